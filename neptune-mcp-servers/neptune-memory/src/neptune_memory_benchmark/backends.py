@@ -0,0 +1,302 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Benchmark Backends Module
+
+This module provides the memory backends a benchmark can run against. A backend exposes
+the KnowledgeGraphManager methods used by the memory server tools, so the benchmark can
+drive either a KnowledgeGraphManager connected to a real Neptune endpoint, or a local
+in-memory stand-in that needs no AWS resources. The stand-in can simulate a round trip
+latency per call to approximate a remote database.
+"""
+
+import logging
+import os
+import threading
+import time
+from neptune_memory_mcp_server.memory import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    KnowledgeGraphManager,
+)
+from neptune_memory_mcp_server.models import (
+    DEFAULT_NAMESPACE,
+    Entity,
+    KnowledgeGraph,
+    KnowledgeGraphPage,
+    Observation,
+    Relation,
+)
+from neptune_memory_mcp_server.neptune import NeptuneServer
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class InMemoryKnowledgeGraph:
+    """Local stand-in for KnowledgeGraphManager keeping the graph in dictionaries.
+
+    It implements the same search, lookup and paging semantics as the Neptune
+    backed manager, so workloads replayed against it return comparable results.
+
+    Attributes:
+        namespace (str): Namespace used when an operation does not specify one
+        latency (float): Seconds slept on every call to simulate a database round trip
+    """
+
+    def __init__(self, namespace: str = DEFAULT_NAMESPACE, latency: float = 0.0):
+        """Initialize the InMemoryKnowledgeGraph.
+
+        Args:
+            namespace (str, optional): Namespace used when an operation does not specify one.
+                Defaults to DEFAULT_NAMESPACE.
+            latency (float, optional): Seconds slept on every call. Defaults to 0.
+        """
+        self.namespace = namespace
+        self.latency = latency
+        self._entities: Dict[str, Dict[str, Entity]] = {}
+        self._relations: Dict[str, Dict[Tuple[str, str], Relation]] = {}
+        self._adjacency: Dict[str, Dict[str, Set[Tuple[str, str]]]] = {}
+        self._order: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def _call(self, namespace: Optional[str]) -> str:
+        """Simulate the round trip of a call and resolve its namespace.
+
+        The round trip is simulated before the graph is locked, so concurrent calls
+        wait in parallel like they would on a remote database.
+
+        Args:
+            namespace (str, optional): Namespace requested by the caller
+
+        Returns:
+            str: The requested namespace, or the default one
+        """
+        if self.latency:
+            time.sleep(self.latency)
+        namespace = namespace or self.namespace
+        with self._lock:
+            self._entities.setdefault(namespace, {})
+            self._relations.setdefault(namespace, {})
+            self._adjacency.setdefault(namespace, {})
+            self._order.setdefault(namespace, [])
+        return namespace
+
+    def create_entities(self, entities: List[Entity], namespace: Optional[str] = None) -> List[Entity]:
+        """Create entities, merging them with existing entities of the same name.
+
+        Args:
+            entities (List[Entity]): Entities to create
+            namespace (str, optional): Namespace of the entities
+
+        Returns:
+            List[Entity]: The created entities
+        """
+        namespace = self._call(namespace)
+        with self._lock:
+            stored = self._entities[namespace]
+            for entity in entities:
+                existing = stored.get(entity.name)
+                if existing is None:
+                    self._order[namespace].append(entity.name)
+                    observations = list(dict.fromkeys(entity.observations))
+                else:
+                    observations = list(dict.fromkeys(existing.observations + entity.observations))
+                stored[entity.name] = Entity(
+                    name=entity.name, type=entity.type, observations=observations, namespace=namespace
+                )
+        return entities
+
+    def create_relations(self, relations: List[Relation], namespace: Optional[str] = None) -> List[Relation]:
+        """Create relations between existing entities.
+
+        Args:
+            relations (List[Relation]): Relations to create
+            namespace (str, optional): Namespace of the relations
+
+        Returns:
+            List[Relation]: The created relations
+        """
+        namespace = self._call(namespace)
+        with self._lock:
+            stored = self._entities[namespace]
+            for relation in relations:
+                if relation.source in stored and relation.target in stored:
+                    key = (relation.source, relation.target)
+                    for name in key:
+                        self._adjacency[namespace].setdefault(name, set()).add(key)
+                    self._relations[namespace][key] = Relation(
+                        source=relation.source,
+                        target=relation.target,
+                        relationType=relation.relationType,
+                        namespace=namespace,
+                    )
+        return relations
+
+    def add_observations(self, observations: List[Observation], namespace: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Add observations to existing entities, skipping the ones already stored.
+
+        Args:
+            observations (List[Observation]): Observations to add
+            namespace (str, optional): Namespace of the entities
+
+        Returns:
+            List[Dict[str, Any]]: The observations actually added, per entity
+        """
+        namespace = self._call(namespace)
+        result = []
+        with self._lock:
+            for obs in observations:
+                entity = self._entities[namespace].get(obs.entityName)
+                if entity is None:
+                    continue
+                added = [c for c in dict.fromkeys(obs.contents) if c not in entity.observations]
+                entity.observations.extend(added)
+                result.append({"entityName": obs.entityName, "addedObservations": added})
+        return result
+
+    def search_nodes(self, query: str, namespace: Optional[str] = None) -> KnowledgeGraph:
+        """Search entities whose name contains the query, with their neighbours.
+
+        Args:
+            query (str): Search query string
+            namespace (str, optional): Namespace to search
+
+        Returns:
+            KnowledgeGraph: The matching entities, their neighbours and the relations between them
+        """
+        namespace = self._call(namespace)
+        with self._lock:
+            needle = query.lower()
+            matches = {name for name in self._entities[namespace] if needle in name.lower()}
+            return self._subgraph(namespace, matches, neighbours=True)
+
+    def find_nodes(self, names: List[str], namespace: Optional[str] = None) -> KnowledgeGraph:
+        """Find entities by their exact names.
+
+        Args:
+            names (List[str]): Names of the entities to find
+            namespace (str, optional): Namespace to search
+
+        Returns:
+            KnowledgeGraph: The entities found and the relations attached to them
+        """
+        namespace = self._call(namespace)
+        with self._lock:
+            return self._subgraph(namespace, {name for name in names if name in self._entities[namespace]})
+
+    def _subgraph(self, namespace: str, names: Set[str], neighbours: bool = False) -> KnowledgeGraph:
+        """Build the graph of a set of entities and the relations attached to them.
+
+        Must be called with the lock held.
+
+        Args:
+            namespace (str): Namespace of the entities
+            names (Set[str]): Names of the entities
+            neighbours (bool, optional): Whether to include the entities at the other end of the relations
+
+        Returns:
+            KnowledgeGraph: The entities and their relations
+        """
+        keys = {key for name in names for key in self._adjacency[namespace].get(name, ())}
+        relations = [self._relations[namespace][key] for key in keys]
+        if neighbours:
+            names = names | {r.source for r in relations} | {r.target for r in relations}
+        entities = [self._entities[namespace][name] for name in names]
+        return KnowledgeGraph(entities=entities, relations=relations)
+
+    def read_graph_page(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        namespace: Optional[str] = None,
+    ) -> KnowledgeGraphPage:
+        """Read a single page of the graph in creation order.
+
+        Args:
+            cursor (str, optional): Cursor returned by the previous page, None for the first page
+            page_size (int, optional): Maximum number of entities in the page. Defaults to DEFAULT_PAGE_SIZE.
+            namespace (str, optional): Namespace to read
+
+        Returns:
+            KnowledgeGraphPage: The entities and relations of the page and the cursor of the next page
+        """
+        namespace = self._call(namespace)
+        with self._lock:
+            page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+            start = int(cursor) if cursor else 0
+            names = self._order[namespace][start:start + page_size]
+            entities = [self._entities[namespace][name] for name in names]
+            relations = [
+                self._relations[namespace][key]
+                for name in names
+                for key in self._adjacency[namespace].get(name, ())
+                if key[0] == name
+            ]
+            end = start + len(names)
+            next_cursor = str(end) if end < len(self._order[namespace]) else None
+            return KnowledgeGraphPage(entities=entities, relations=relations, next_cursor=next_cursor)
+
+    def delete_namespace(self, namespace: str) -> int:
+        """Delete every entity of a namespace together with its relations.
+
+        Args:
+            namespace (str): Namespace to delete
+
+        Returns:
+            int: Number of entities deleted
+        """
+        with self._lock:
+            self._relations.pop(namespace, None)
+            self._adjacency.pop(namespace, None)
+            self._order.pop(namespace, None)
+            return len(self._entities.pop(namespace, {}))
+
+    def flush(self) -> int:
+        """Do nothing, the stand-in does not buffer writes.
+
+        Returns:
+            int: Always 0
+        """
+        return 0
+
+
+def create_backend(
+    name: str,
+    endpoint: Optional[str] = None,
+    namespace: str = DEFAULT_NAMESPACE,
+    latency: float = 0.0,
+    logger: Optional[logging.Logger] = None,
+):
+    """Create the backend a benchmark runs against.
+
+    Args:
+        name (str): Backend name, `memory` for the in-memory stand-in or `neptune` for a Neptune endpoint
+        endpoint (str, optional): Neptune endpoint, required by the `neptune` backend
+        namespace (str, optional): Namespace the benchmark writes to. Defaults to DEFAULT_NAMESPACE.
+        latency (float, optional): Round trip latency in seconds simulated by the `memory` backend
+        logger (logging.Logger, optional): Logger instance used by the `neptune` backend
+
+    Returns:
+        KnowledgeGraphManager | InMemoryKnowledgeGraph: The backend
+
+    Raises:
+        ValueError: If the backend is unknown or no endpoint is given for the `neptune` backend
+    """
+    if name == 'memory':
+        return InMemoryKnowledgeGraph(namespace=namespace, latency=latency)
+    if name == 'neptune':
+        if endpoint is None:
+            raise ValueError('The neptune backend requires an endpoint')
+        use_https = os.environ.get('NEPTUNE_MEMORY_USE_HTTPS', 'True').lower() in ('true', '1', 't')
+        return KnowledgeGraphManager(
+            NeptuneServer(endpoint, use_https=use_https), logger or logging.getLogger(__name__), namespace=namespace
+        )
+    raise ValueError(f'Unknown backend: {name}')
@@ -0,0 +1,113 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Memory Benchmark Command Line Module
+
+This module provides the command line tool running the memory server benchmark. For each
+requested graph size it loads a synthetic memory graph into a fresh namespace, replays a
+synthetic or recorded agent workload, reports the throughput and latency percentiles of
+each tool, and deletes the namespace.
+"""
+
+import argparse
+import json
+import logging
+import os
+from dataclasses import asdict
+from neptune_memory_benchmark.backends import create_backend
+from neptune_memory_benchmark.runner import format_result, replay, summarize
+from neptune_memory_benchmark.workload import (
+    load_synthetic_graph,
+    read_trace,
+    synthetic_trace,
+    write_trace,
+)
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def main():
+    """Run the memory server benchmark.
+
+    Command line arguments:
+        --backend: memory for the local in-memory stand-in, neptune for a Neptune endpoint (default: memory)
+        --endpoint: Neptune endpoint (defaults to the NEPTUNE_MEMORY_ENDPOINT environment variable)
+        --namespace: Prefix of the namespaces the synthetic graphs are loaded into (default: benchmark)
+        --entities: Sizes of the synthetic graphs, one run per size (default: 1000)
+        --degree: Relations originating from each entity (default: 2)
+        --observations: Observations per entity (default: 3)
+        --calls: Number of tool calls of the synthetic workload (default: 1000)
+        --trace: Recorded JSONL trace replayed instead of the synthetic workload
+        --record-trace: File the synthetic workload is written to
+        --concurrency: Tool calls run in parallel (default: 1)
+        --latency-ms: Round trip latency simulated by the memory backend (default: 0)
+        --seed: Random seed (default: 0)
+        --keep: Keep the benchmark namespaces instead of deleting them after each run
+        --json: Print the results as JSON
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Neptune memory server with synthetic agent workloads')
+    parser.add_argument('--backend', choices=('memory', 'neptune'), default='memory', help='Backend to benchmark')
+    parser.add_argument('--endpoint', default=os.environ.get('NEPTUNE_MEMORY_ENDPOINT'), help='Neptune endpoint')
+    parser.add_argument('--namespace', default='benchmark', help='Prefix of the benchmark namespaces')
+    parser.add_argument('--entities', type=int, nargs='+', default=[1000], help='Sizes of the synthetic graphs')
+    parser.add_argument('--degree', type=int, default=2, help='Relations originating from each entity')
+    parser.add_argument('--observations', type=int, default=3, help='Observations per entity')
+    parser.add_argument('--calls', type=int, default=1000, help='Tool calls of the synthetic workload')
+    parser.add_argument('--trace', help='Recorded JSONL trace replayed instead of the synthetic workload')
+    parser.add_argument('--record-trace', help='File the synthetic workload is written to')
+    parser.add_argument('--concurrency', type=int, default=1, help='Tool calls run in parallel')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Round trip latency simulated by the memory backend')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument('--keep', action='store_true', help='Keep the benchmark namespaces after each run')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    if args.backend == 'neptune' and args.endpoint is None:
+        parser.error('--endpoint or the NEPTUNE_MEMORY_ENDPOINT environment variable must be set')
+
+    results = []
+    for size in args.entities:
+        namespace = f'{args.namespace}-{size}'
+        backend = create_backend(
+            args.backend, endpoint=args.endpoint, namespace=namespace, latency=args.latency_ms / 1000, logger=logger
+        )
+        try:
+            logger.info(f'Loading {size} entities into namespace {namespace}')
+            load_seconds = load_synthetic_graph(backend, size, args.degree, args.observations, seed=args.seed)
+
+            if args.trace:
+                trace = read_trace(args.trace)
+            else:
+                trace = synthetic_trace(args.calls, size, seed=args.seed)
+                if args.record_trace:
+                    write_trace(args.record_trace, trace)
+
+            duration, latencies, errors = replay(backend, trace, args.concurrency)
+        finally:
+            if not args.keep:
+                logger.info(f'Deleting namespace {namespace}')
+                backend.delete_namespace(namespace)
+        result = summarize(args.backend, duration, latencies, errors, args.concurrency, size, load_seconds)
+        results.append(result)
+        if not args.json:
+            print(format_result(result, title=f'== {size} entities =='))
+            print()
+
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Benchmark Runner Module
+
+This module replays workloads of memory server tool calls against a backend, times every
+call, and summarizes the throughput and latency distribution of each tool.
+"""
+
+import math
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from neptune_memory_benchmark.workload import ToolCall
+from neptune_memory_mcp_server.memory import DEFAULT_PAGE_SIZE
+from neptune_memory_mcp_server.models import Entity, Observation, Relation
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class ToolStats:
+    """Throughput and latency of a memory server tool.
+
+    Attributes:
+        tool (str): Name of the tool
+        calls (int): Number of calls
+        errors (int): Number of calls that raised an error
+        throughput (float): Calls per second over the whole run
+        mean (float): Mean latency in milliseconds
+        p50 (float): Median latency in milliseconds
+        p95 (float): 95th percentile latency in milliseconds
+        p99 (float): 99th percentile latency in milliseconds
+    """
+    tool: str
+    calls: int
+    errors: int
+    throughput: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+
+@dataclass
+class BenchmarkResult:
+    """Outcome of a benchmark run.
+
+    Attributes:
+        backend (str): Name of the backend
+        entities (int): Number of entities in the synthetic graph, 0 if none was loaded
+        load_seconds (float): Seconds taken to load the synthetic graph
+        duration (float): Seconds taken to replay the workload
+        calls (int): Number of tool calls replayed
+        concurrency (int): Number of tool calls run in parallel
+        throughput (float): Tool calls per second
+        tools (List[ToolStats]): Throughput and latency of each tool
+    """
+    backend: str
+    entities: int
+    load_seconds: float
+    duration: float
+    calls: int
+    concurrency: int
+    throughput: float
+    tools: List[ToolStats] = field(default_factory=list)
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Compute a percentile with the nearest-rank method.
+
+    Args:
+        values (List[float]): Sorted values
+        p (float): Percentile, between 0 and 100
+
+    Returns:
+        float: The percentile, 0 if there are no values
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def execute(backend, call: ToolCall) -> Any:
+    """Run a tool call against a backend the way the memory server does.
+
+    A read_memory call with a number of pages follows the cursor through that many pages.
+
+    Args:
+        backend: Backend to run the call against
+        call (ToolCall): The tool call
+
+    Returns:
+        Any: The result of the call
+
+    Raises:
+        ValueError: If the tool is unknown
+    """
+    args = call.arguments
+    namespace = args.get('namespace')
+    if call.tool == 'create_entities':
+        return backend.create_entities([Entity(**e) for e in args['entities']], namespace)
+    if call.tool == 'create_relations':
+        return backend.create_relations([Relation(**r) for r in args['relations']], namespace)
+    if call.tool == 'add_observations':
+        return backend.add_observations([Observation(**o) for o in args['observations']], namespace)
+    if call.tool == 'search_memory':
+        return backend.search_nodes(args['query'], namespace)
+    if call.tool == 'get_entities':
+        return backend.find_nodes(args['names'], namespace)
+    if call.tool == 'read_memory':
+        page = backend.read_graph_page(args.get('cursor'), args.get('page_size', DEFAULT_PAGE_SIZE), namespace)
+        for _ in range(args.get('pages', 1) - 1):
+            if page.next_cursor is None:
+                break
+            page = backend.read_graph_page(page.next_cursor, args.get('page_size', DEFAULT_PAGE_SIZE), namespace)
+        return page
+    if call.tool == 'flush_memory':
+        return backend.flush()
+    raise ValueError(f'Unknown tool: {call.tool}')
+
+
+def replay(backend, trace: List[ToolCall], concurrency: int = 1) -> Tuple[float, Dict[str, List[float]], Dict[str, int]]:
+    """Replay a workload against a backend.
+
+    Args:
+        backend: Backend to run the calls against
+        trace (List[ToolCall]): The tool calls, run in order by each worker
+        concurrency (int, optional): Number of calls run in parallel. Defaults to 1.
+
+    Returns:
+        Tuple[float, Dict[str, List[float]], Dict[str, int]]: The duration of the run in seconds,
+            the latencies in milliseconds and the number of errors, per tool
+    """
+    def timed(call: ToolCall) -> Tuple[str, float, bool]:
+        started = time.perf_counter()
+        try:
+            execute(backend, call)
+            failed = False
+        except Exception:
+            failed = True
+        return call.tool, (time.perf_counter() - started) * 1000, failed
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for tool, latency, failed in executor.map(timed, trace):
+            latencies[tool].append(latency)
+            errors[tool] += failed
+    backend.flush()
+    return time.perf_counter() - started, latencies, errors
+
+
+def summarize(
+    backend_name: str,
+    duration: float,
+    latencies: Dict[str, List[float]],
+    errors: Dict[str, int],
+    concurrency: int = 1,
+    entities: int = 0,
+    load_seconds: float = 0.0,
+) -> BenchmarkResult:
+    """Summarize the latencies of a run.
+
+    Args:
+        backend_name (str): Name of the backend
+        duration (float): Seconds taken to replay the workload
+        latencies (Dict[str, List[float]]): Latencies in milliseconds, per tool
+        errors (Dict[str, int]): Number of errors, per tool
+        concurrency (int, optional): Number of calls run in parallel. Defaults to 1.
+        entities (int, optional): Number of entities in the synthetic graph. Defaults to 0.
+        load_seconds (float, optional): Seconds taken to load the synthetic graph. Defaults to 0.
+
+    Returns:
+        BenchmarkResult: The summary of the run
+    """
+    tools = []
+    for tool in sorted(latencies):
+        values = sorted(latencies[tool])
+        tools.append(
+            ToolStats(
+                tool=tool,
+                calls=len(values),
+                errors=errors.get(tool, 0),
+                throughput=len(values) / duration if duration else 0.0,
+                mean=sum(values) / len(values),
+                p50=percentile(values, 50),
+                p95=percentile(values, 95),
+                p99=percentile(values, 99),
+            )
+        )
+    calls = sum(t.calls for t in tools)
+    return BenchmarkResult(
+        backend=backend_name,
+        entities=entities,
+        load_seconds=load_seconds,
+        duration=duration,
+        calls=calls,
+        concurrency=concurrency,
+        throughput=calls / duration if duration else 0.0,
+        tools=tools,
+    )
+
+
+def format_result(result: BenchmarkResult, title: Optional[str] = None) -> str:
+    """Format a benchmark result as a text table.
+
+    Args:
+        result (BenchmarkResult): The result to format
+        title (str, optional): Title printed above the table
+
+    Returns:
+        str: The formatted result
+    """
+    lines = [title] if title else []
+    if result.entities:
+        lines.append(
+            f'Loaded {result.entities} entities in {result.load_seconds:.1f}s '
+            f'({result.entities / result.load_seconds if result.load_seconds else 0:.0f} entities/s)'
+        )
+    lines.append(
+        f'Replayed {result.calls} calls on {result.backend} in {result.duration:.1f}s '
+        f'with concurrency {result.concurrency} ({result.throughput:.1f} calls/s)'
+    )
+    lines.append(f'{"tool":<18}{"calls":>8}{"errors":>8}{"calls/s":>10}{"mean ms":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+    for t in result.tools:
+        lines.append(
+            f'{t.tool:<18}{t.calls:>8}{t.errors:>8}{t.throughput:>10.1f}'
+            f'{t.mean:>10.2f}{t.p50:>10.2f}{t.p95:>10.2f}{t.p99:>10.2f}'
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,261 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Benchmark Workload Module
+
+This module generates the workloads replayed by the benchmark. Synthetic memory graphs of
+any size are generated deterministically from a seed and loaded in chunks, and agent
+workloads are sequences of memory server tool calls, either generated with a configurable
+mix of tools or read from a trace recorded from a real agent.
+
+Traces are JSONL files with one tool call per line, using the tool names and arguments of
+the memory server:
+
+    {"tool": "search_memory", "arguments": {"query": "person 42"}}
+
+Since cursors are only known at run time, a read_memory call may instead give the number
+of pages to read by following the cursor from the first page, as an agent paging through
+its memory does:
+
+    {"tool": "read_memory", "arguments": {"page_size": 100, "pages": 3}}
+"""
+
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from neptune_memory_mcp_server.memory import DEFAULT_PAGE_SIZE
+from neptune_memory_mcp_server.models import Entity, Relation
+from typing import Any, Dict, Iterator, List
+
+
+ENTITY_TYPES = ('person', 'project', 'organization', 'location', 'preference', 'event')
+RELATION_TYPES = ('works_on', 'knows', 'located_in', 'prefers', 'attended', 'member_of')
+
+# Mix of tool calls observed in agent conversations: mostly reads, a few writes per turn
+DEFAULT_MIX = {
+    'search_memory': 0.40,
+    'get_entities': 0.20,
+    'add_observations': 0.20,
+    'create_entities': 0.10,
+    'create_relations': 0.05,
+    'read_memory': 0.05,
+}
+# Maximum number of pages read by a synthetic read_memory call
+MAX_READ_PAGES = 10
+
+
+@dataclass
+class ToolCall:
+    """A memory server tool call of a workload.
+
+    Attributes:
+        tool (str): Name of the memory server tool
+        arguments (Dict[str, Any]): Arguments of the call, as sent by the agent
+    """
+    tool: str
+    arguments: Dict[str, Any]
+
+
+def entity_name(index: int) -> str:
+    """Get the name of a synthetic entity.
+
+    Args:
+        index (int): Index of the entity
+
+    Returns:
+        str: The entity name
+    """
+    return f'{ENTITY_TYPES[index % len(ENTITY_TYPES)]} {index}'
+
+
+def generate_entities(count: int, observations: int = 3, seed: int = 0) -> Iterator[Entity]:
+    """Generate synthetic entities.
+
+    Args:
+        count (int): Number of entities
+        observations (int, optional): Number of observations per entity. Defaults to 3.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Yields:
+        Entity: The next entity
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        yield Entity(
+            name=entity_name(index),
+            type=ENTITY_TYPES[index % len(ENTITY_TYPES)],
+            observations=[f'observation {rng.randrange(10 ** 9)} about {entity_name(index)}' for _ in range(observations)],
+        )
+
+
+def generate_relations(count: int, degree: int = 2, seed: int = 0) -> Iterator[Relation]:
+    """Generate synthetic relations between the synthetic entities.
+
+    Args:
+        count (int): Number of entities
+        degree (int, optional): Number of relations originating from each entity. Defaults to 2.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Yields:
+        Relation: The next relation
+    """
+    rng = random.Random(seed + 1)
+    for index in range(count if count > 1 else 0):
+        for _ in range(degree):
+            target = rng.randrange(count - 1)
+            yield Relation(
+                source=entity_name(index),
+                target=entity_name(target if target < index else target + 1),
+                relationType=rng.choice(RELATION_TYPES),
+            )
+
+
+def _chunks(items: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterator into lists of at most size items.
+
+    Args:
+        items (Iterator[Any]): The items
+        size (int): Maximum number of items per chunk
+
+    Yields:
+        List[Any]: The next chunk
+    """
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def load_synthetic_graph(
+    backend,
+    count: int,
+    degree: int = 2,
+    observations: int = 3,
+    chunk_size: int = 1000,
+    workers: int = 4,
+    seed: int = 0,
+) -> float:
+    """Load a synthetic memory graph into a backend.
+
+    Entities are loaded before relations, in chunks written by several workers.
+    Chunks are generated lazily, so graphs of millions of entities can be loaded
+    without being held in memory.
+
+    Args:
+        backend: Backend to load into
+        count (int): Number of entities
+        degree (int, optional): Number of relations originating from each entity. Defaults to 2.
+        observations (int, optional): Number of observations per entity. Defaults to 3.
+        chunk_size (int, optional): Number of entities or relations written per call. Defaults to 1000.
+        workers (int, optional): Number of chunks written in parallel. Defaults to 4.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        float: Seconds taken to load the graph
+    """
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(backend.create_entities, _chunks(generate_entities(count, observations, seed), chunk_size)):
+            pass
+        for _ in executor.map(backend.create_relations, _chunks(generate_relations(count, degree, seed), chunk_size)):
+            pass
+    backend.flush()
+    return time.perf_counter() - started
+
+
+def synthetic_trace(
+    calls: int,
+    entities: int,
+    mix: Dict[str, float] = DEFAULT_MIX,
+    seed: int = 0,
+) -> List[ToolCall]:
+    """Generate an agent workload against a synthetic memory graph.
+
+    Reads and observations target existing entities, with a skew towards a small
+    set of frequently used entities as agents tend to recall the same memories.
+    Created entities get new names so that the graph grows during the run.
+
+    Args:
+        calls (int): Number of tool calls
+        entities (int): Number of entities in the synthetic graph
+        mix (Dict[str, float], optional): Relative frequency of each tool. Defaults to DEFAULT_MIX.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        List[ToolCall]: The tool calls
+    """
+    rng = random.Random(seed + 2)
+    tools = list(mix)
+    weights = [mix[tool] for tool in tools]
+    created = entities
+
+    def existing() -> str:
+        # Pareto distributed index, most calls hit the first few entities
+        return entity_name(min(int(rng.paretovariate(1.2)) - 1, max(created - 1, 0)))
+
+    trace = []
+    for tool in rng.choices(tools, weights, k=calls):
+        if tool == 'search_memory':
+            arguments: Dict[str, Any] = {'query': existing()}
+        elif tool == 'get_entities':
+            arguments = {'names': [existing() for _ in range(rng.randint(1, 3))]}
+        elif tool == 'add_observations':
+            arguments = {
+                'observations': [{'entityName': existing(), 'contents': [f'observation {rng.randrange(10 ** 9)}']}]
+            }
+        elif tool == 'create_entities':
+            arguments = {
+                'entities': [
+                    {'name': entity_name(created), 'type': ENTITY_TYPES[created % len(ENTITY_TYPES)], 'observations': []}
+                ]
+            }
+            created += 1
+        elif tool == 'create_relations':
+            arguments = {
+                'relations': [
+                    {'source': existing(), 'target': existing(), 'relationType': rng.choice(RELATION_TYPES)}
+                ]
+            }
+        else:
+            pages = -(-created // DEFAULT_PAGE_SIZE)
+            arguments = {'page_size': DEFAULT_PAGE_SIZE, 'pages': rng.randint(1, max(min(pages, MAX_READ_PAGES), 1))}
+        trace.append(ToolCall(tool=tool, arguments=arguments))
+    return trace
+
+
+def read_trace(path: str) -> List[ToolCall]:
+    """Read a recorded agent trace.
+
+    Args:
+        path (str): Path of the JSONL trace
+
+    Returns:
+        List[ToolCall]: The tool calls of the trace
+    """
+    with open(path) as f:
+        return [ToolCall(**json.loads(line)) for line in f if line.strip()]
+
+
+def write_trace(path: str, trace: List[ToolCall]):
+    """Write a trace as JSONL.
+
+    Args:
+        path (str): Path of the JSONL trace
+        trace (List[ToolCall]): The tool calls
+    """
+    with open(path, 'w') as f:
+        for call in trace:
+            f.write(json.dumps({'tool': call.tool, 'arguments': call.arguments}) + '\n')
@@ -0,0 +1,271 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Write Buffer Module for Neptune Memory System
+
+This module provides a write-behind buffer that coalesces the small mutations issued by
+agents (a couple of entities, relations or observations per tool call) into a single set
+of pending changes. Pending changes are merged by namespace and entity name and written to Neptune in
+one batch when the buffer is full, when it gets too old, or when it is flushed explicitly.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from neptune_memory_mcp_server.models import Entity, Observation, Relation
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class PendingWrites:
+    """The mutations accumulated by the buffer since the last flush.
+
+    Attributes:
+        entities (Dict[Tuple[str, str], Entity]): Entities to create, keyed by namespace and name
+        observations (Dict[Tuple[str, str], List[str]]): Observations to add to existing entities,
+            keyed by namespace and entity name
+        relations (Dict[Tuple[str, str, str], Relation]): Relations to create, keyed by namespace, source and target
+        count (int): Number of mutations merged into this batch
+    """
+    entities: Dict[Tuple[str, str], Entity] = field(default_factory=dict)
+    observations: Dict[Tuple[str, str], List[str]] = field(default_factory=dict)
+    relations: Dict[Tuple[str, str, str], Relation] = field(default_factory=dict)
+    count: int = 0
+
+    def is_empty(self) -> bool:
+        """Check whether there is anything to write.
+
+        Returns:
+            bool: True if the batch holds no mutation
+        """
+        return not (self.entities or self.observations or self.relations)
+
+
+class WriteBuffer:
+    """Coalesces memory mutations and writes them to Neptune in batches.
+
+    Entities are merged by namespace and name: the latest type wins and
+    observations are concatenated without duplicates. Observations for an entity
+    that is itself pending are folded into that entity. Relations are merged by
+    their namespace, source and target, the latest relation type wins.
+
+    Attributes:
+        max_size (int): Number of buffered mutations that triggers a flush
+        flush_interval (Optional[float]): Maximum age in seconds of a pending mutation, None to disable time based flushes
+        flushes (int): Number of batches written so far
+        mutations (int): Number of mutations received so far
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[PendingWrites], None],
+        max_size: int,
+        flush_interval: Optional[float] = None,
+    ):
+        """Initialize the WriteBuffer.
+
+        Args:
+            writer (Callable[[PendingWrites], None]): Function writing a batch of pending mutations to Neptune
+            max_size (int): Number of buffered mutations that triggers a flush
+            flush_interval (Optional[float]): Maximum age in seconds of a pending mutation, None to disable
+        """
+        self._writer = writer
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.flushes = 0
+        self.mutations = 0
+        self._pending = PendingWrites()
+        self._oldest: Optional[float] = None
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        if flush_interval:
+            self._thread = threading.Thread(target=self._run, name='memory-write-buffer', daemon=True)
+            self._thread.start()
+
+    def add_entities(self, entities: List[Entity]):
+        """Buffer the creation of entities.
+
+        Args:
+            entities (List[Entity]): Entities to create
+        """
+        with self._lock:
+            _merge_entities(self._pending, entities)
+            full = self._added(len(entities))
+        if full:
+            self.flush()
+
+    def add_relations(self, relations: List[Relation]):
+        """Buffer the creation of relations.
+
+        Args:
+            relations (List[Relation]): Relations to create
+        """
+        with self._lock:
+            _merge_relations(self._pending, relations)
+            full = self._added(len(relations))
+        if full:
+            self.flush()
+
+    def add_observations(self, observations: List[Observation]):
+        """Buffer the addition of observations to entities.
+
+        Args:
+            observations (List[Observation]): Observations to add
+        """
+        with self._lock:
+            _merge_observations(self._pending, observations)
+            full = self._added(len(observations))
+        if full:
+            self.flush()
+
+    def pending_count(self) -> int:
+        """Get the number of mutations waiting to be written.
+
+        Returns:
+            int: Number of buffered mutations
+        """
+        with self._lock:
+            return self._pending.count
+
+    def flush(self) -> int:
+        """Write all pending mutations to Neptune.
+
+        If the write fails the mutations are put back in the buffer, merged with any
+        mutation received in the meantime, and the error is raised.
+
+        Returns:
+            int: Number of mutations written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = self._pending
+                if batch.is_empty():
+                    return 0
+                self._pending = PendingWrites()
+                self._oldest = None
+            try:
+                self._writer(batch)
+            except Exception:
+                self._restore(batch)
+                raise
+            self.flushes += 1
+            return batch.count
+
+    def close(self):
+        """Stop the background flusher and write any pending mutation."""
+        self._closed.set()
+        self.flush()
+
+    def _added(self, count: int) -> bool:
+        """Record newly buffered mutations.
+
+        Must be called with the lock held.
+
+        Args:
+            count (int): Number of mutations just buffered
+
+        Returns:
+            bool: True if the buffer is full and should be flushed
+        """
+        self._pending.count += count
+        self.mutations += count
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        return self._pending.count >= self.max_size
+
+    def _restore(self, batch: PendingWrites):
+        """Put a batch that failed to be written back in front of the pending mutations.
+
+        Args:
+            batch (PendingWrites): The batch to restore
+        """
+        with self._lock:
+            newer = self._pending
+            _merge_entities(batch, list(newer.entities.values()))
+            _merge_observations(batch, pending_observations(newer))
+            _merge_relations(batch, list(newer.relations.values()))
+            batch.count += newer.count
+            self._pending = batch
+            self._oldest = time.monotonic()
+
+    def _run(self):
+        """Background loop flushing pending mutations once they reach the flush interval."""
+        while not self._closed.wait(self.flush_interval / 2):
+            with self._lock:
+                due = self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval
+            if due:
+                try:
+                    self.flush()
+                except Exception:
+                    # The batch was restored and will be retried on the next tick
+                    pass
+
+
+def pending_observations(pending: PendingWrites) -> List[Observation]:
+    """List the observations of a batch that are not folded into a pending entity.
+
+    Args:
+        pending (PendingWrites): The batch of pending mutations
+
+    Returns:
+        List[Observation]: One Observation per entity with its pending contents
+    """
+    return [
+        Observation(entityName=name, contents=contents, namespace=namespace)
+        for (namespace, name), contents in pending.observations.items()
+    ]
+
+
+def _merge_entities(pending: PendingWrites, entities: List[Entity]):
+    """Merge entities into a batch of pending mutations.
+
+    Args:
+        pending (PendingWrites): The batch to merge into
+        entities (List[Entity]): Entities to create
+    """
+    for entity in entities:
+        key = (entity.namespace, entity.name)
+        existing = pending.entities.get(key)
+        observations = list(existing.observations) if existing is not None else []
+        observations += [o for o in entity.observations if o not in observations]
+        observations += [o for o in pending.observations.pop(key, []) if o not in observations]
+        pending.entities[key] = Entity(
+            name=entity.name, type=entity.type, observations=observations, namespace=entity.namespace
+        )
+
+
+def _merge_relations(pending: PendingWrites, relations: List[Relation]):
+    """Merge relations into a batch of pending mutations.
+
+    Args:
+        pending (PendingWrites): The batch to merge into
+        relations (List[Relation]): Relations to create
+    """
+    for relation in relations:
+        pending.relations[(relation.namespace, relation.source, relation.target)] = relation
+
+
+def _merge_observations(pending: PendingWrites, observations: List[Observation]):
+    """Merge observations into a batch of pending mutations.
+
+    Observations of an entity that is pending creation are folded into that entity.
+
+    Args:
+        pending (PendingWrites): The batch to merge into
+        observations (List[Observation]): Observations to add
+    """
+    for obs in observations:
+        key = (obs.namespace, obs.entityName)
+        entity = pending.entities.get(key)
+        target = entity.observations if entity is not None else pending.observations.setdefault(key, [])
+        target.extend(c for c in obs.contents if c not in target)
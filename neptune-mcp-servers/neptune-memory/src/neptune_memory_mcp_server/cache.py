@@ -0,0 +1,257 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Entity Cache Module for Neptune Memory System
+
+This module provides an in-process, read-through cache for the memory server. Agents fetch
+the same few entities (the user, their project, their preferences) over and over during a
+session; the cache keeps recently read entities with their adjacent relations, and recent
+search results, so repeated reads are answered without a round trip to Neptune.
+
+Entries are evicted in least recently used order once the estimated size of the cache
+exceeds its byte budget.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from neptune_memory_mcp_server.models import (
+    CacheStats,
+    Entity,
+    KnowledgeGraph,
+    Relation,
+)
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+
+
+@dataclass
+class CacheEntry:
+    """A value held by the cache.
+
+    Attributes:
+        value (Any): The cached value
+        size (int): Estimated size of the value in bytes
+        touched_at (float): Unix timestamp at which the access to the value was last recorded in Neptune
+    """
+    value: Any
+    size: int
+    touched_at: float
+
+
+class EntityCache:
+    """LRU cache of entities, their adjacency and search results, bounded by a byte budget.
+
+    Entities are keyed by namespace and name and hold the entity together with the
+    relations attached to it. Search results are keyed by namespace and query and
+    are dropped whenever anything is written to their namespace, since a write can
+    change which entities match a search.
+
+    Every invalidation bumps the generation of its namespace. Readers capture the
+    generation before querying Neptune and pass it to put_entity or put_search, which
+    skip the result if a write invalidated the namespace while the query ran.
+
+    Attributes:
+        max_bytes (int): Byte budget of the cache
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups not found in the cache
+        evictions (int): Number of entries evicted to stay within the byte budget
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize the EntityCache.
+
+        Args:
+            max_bytes (int): Byte budget of the cache
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Hashable, CacheEntry]' = OrderedDict()
+        self._searches: Dict[str, Set[Hashable]] = {}
+        self._generations: Dict[str, int] = {}
+        self._cleared = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_entity(self, namespace: str, name: str) -> Optional[CacheEntry]:
+        """Look up an entity and its adjacent relations.
+
+        Args:
+            namespace (str): Namespace of the entity
+            name (str): Name of the entity
+
+        Returns:
+            Optional[CacheEntry]: Entry holding a (Entity, List[Relation]) tuple, None on a miss
+        """
+        return self._get(('entity', namespace, name))
+
+    def generation(self, namespace: str) -> int:
+        """Get the generation of a namespace, which changes on every write to it.
+
+        Args:
+            namespace (str): The namespace
+
+        Returns:
+            int: The current generation of the namespace
+        """
+        with self._lock:
+            return self._cleared + self._generations.get(namespace, 0)
+
+    def put_entity(self, entity: Entity, relations: List[Relation], generation: int):
+        """Cache an entity with the relations attached to it.
+
+        Args:
+            entity (Entity): The entity, with its namespace set
+            relations (List[Relation]): Every relation whose source or target is the entity
+            generation (int): Generation of the namespace captured before the entity was read
+        """
+        self._put(('entity', entity.namespace, entity.name), (entity, relations), generation)
+
+    def get_search(self, namespace: str, query: str) -> Optional[CacheEntry]:
+        """Look up the result of a search.
+
+        Args:
+            namespace (str): Namespace searched
+            query (str): The search query
+
+        Returns:
+            Optional[CacheEntry]: Entry holding the KnowledgeGraph returned by the search, None on a miss
+        """
+        return self._get(('search', namespace, query))
+
+    def put_search(self, namespace: str, query: str, graph: KnowledgeGraph, generation: int):
+        """Cache the result of a search.
+
+        Args:
+            namespace (str): Namespace searched
+            query (str): The search query
+            graph (KnowledgeGraph): The search result
+            generation (int): Generation of the namespace captured before the search ran
+        """
+        self._put(('search', namespace, query), graph, generation)
+
+    def invalidate(self, namespace: str, names: Iterable[str]):
+        """Drop entities that were written, and every search result of their namespace.
+
+        Args:
+            namespace (str): Namespace written to
+            names (Iterable[str]): Names of the entities written
+        """
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for name in names:
+                self._remove(('entity', namespace, name))
+            for key in self._searches.pop(namespace, set()):
+                self._remove(key)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._cleared += 1
+            self._entries.clear()
+            self._searches.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Get the cache metrics.
+
+        Returns:
+            CacheStats: Hit rate, size and eviction counters of the cache
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                hit_rate=self.hits / lookups if lookups else 0.0,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def _get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Look up an entry and mark it as most recently used.
+
+        Args:
+            key (Hashable): Key of the entry
+
+        Returns:
+            Optional[CacheEntry]: The entry, None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key: Hashable, value: Any, generation: int):
+        """Insert an entry and evict the least recently used entries beyond the byte budget.
+
+        The entry is skipped if its namespace was written since the value was read.
+
+        Args:
+            key (Hashable): Key of the entry, whose second element is the namespace
+            value (Any): Value to cache
+            generation (int): Generation of the namespace captured before the value was read
+        """
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        namespace = key[1]
+        with self._lock:
+            if self._cleared + self._generations.get(namespace, 0) != generation:
+                return
+            self._remove(key)
+            self._entries[key] = CacheEntry(value=value, size=size, touched_at=time.time())
+            self._bytes += size
+            if key[0] == 'search':
+                self._searches.setdefault(namespace, set()).add(key)
+            while self._bytes > self.max_bytes:
+                old_key, _ = next(iter(self._entries.items()))
+                self._remove(old_key)
+                self.evictions += 1
+
+    def _remove(self, key: Hashable):
+        """Remove an entry if present. Must be called with the lock held.
+
+        Args:
+            key (Hashable): Key of the entry
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+            if key[0] == 'search':
+                self._searches.get(key[1], set()).discard(key)
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory used by a cached value from its JSON encoding.
+
+    Args:
+        value (Any): A KnowledgeGraph or an (Entity, List[Relation]) tuple
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    if isinstance(value, KnowledgeGraph):
+        data: Any = asdict(value)
+    else:
+        entity, relations = value
+        data = [asdict(entity), [asdict(r) for r in relations]]
+    return len(json.dumps(data))
@@ -0,0 +1,223 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Memory Compaction Module for Neptune Memory System
+
+This module keeps memory graphs from growing without bound. A retention policy decides,
+from the last access time and access count of each entity, whether the entity has expired.
+A background compactor walks the graph in batches, deletes expired entities together with
+their observations, and optionally merges observations of an entity that only differ by
+case or whitespace.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from neptune_memory_mcp_server.memory import DEFAULT_PAGE_SIZE, KnowledgeGraphManager
+from neptune_memory_mcp_server.models import CompactionResult
+from typing import Any, Dict, List, Optional
+
+
+@dataclass
+class RetentionPolicy:
+    """Decides when an entity has expired.
+
+    An entity expires when it has not been accessed for ttl seconds, or when its
+    decay score drops below min_score. The decay score starts at one plus the
+    number of accesses and halves every half_life seconds since the last access,
+    so frequently used memories survive longer than ones used once.
+
+    Attributes:
+        ttl (Optional[float]): Seconds since the last access after which an entity expires, None to disable
+        half_life (Optional[float]): Half-life in seconds of the decay score, None to disable decay
+        min_score (float): Decay score below which an entity expires
+    """
+    ttl: Optional[float] = None
+    half_life: Optional[float] = None
+    min_score: float = 0.1
+
+    def is_enabled(self) -> bool:
+        """Check whether the policy can expire anything.
+
+        Returns:
+            bool: True if either a TTL or a decay half-life is configured
+        """
+        return bool(self.ttl or self.half_life)
+
+    def score(self, last_accessed_at: float, access_count: int, now: float) -> float:
+        """Compute the decay score of an entity.
+
+        Args:
+            last_accessed_at (float): Unix timestamp of the last access
+            access_count (int): Number of times the entity was accessed
+            now (float): Current Unix timestamp
+
+        Returns:
+            float: The decay score
+        """
+        age = max(0.0, now - last_accessed_at)
+        return (1 + access_count) * 0.5 ** (age / self.half_life)
+
+    def is_expired(self, last_accessed_at: float, access_count: int, now: float) -> bool:
+        """Check whether an entity has expired.
+
+        Args:
+            last_accessed_at (float): Unix timestamp of the last access
+            access_count (int): Number of times the entity was accessed
+            now (float): Current Unix timestamp
+
+        Returns:
+            bool: True if the entity should be deleted
+        """
+        if self.ttl and now - last_accessed_at > self.ttl:
+            return True
+        if self.half_life and self.score(last_accessed_at, access_count, now) < self.min_score:
+            return True
+        return False
+
+
+def normalize_observation(content: str) -> str:
+    """Normalize an observation for duplicate detection.
+
+    Args:
+        content (str): The observation text
+
+    Returns:
+        str: The observation lower-cased with whitespace collapsed
+    """
+    return re.sub(r'\s+', ' ', content).strip().casefold()
+
+
+class MemoryCompactor:
+    """Periodically compacts the memory graph in the background.
+
+    Attributes:
+        memory (KnowledgeGraphManager): Manager of the graph to compact
+        policy (RetentionPolicy): Policy deciding which entities expire
+        interval (float): Seconds between two compaction runs
+        batch_size (int): Number of entities processed per batch
+        merge_duplicates (bool): Whether observations differing only in case and whitespace are merged
+        last_result (Optional[CompactionResult]): Outcome of the latest run, None if none ran yet
+    """
+
+    def __init__(
+        self,
+        memory: KnowledgeGraphManager,
+        policy: RetentionPolicy,
+        interval: float,
+        batch_size: int = DEFAULT_PAGE_SIZE,
+        logger: Optional[logging.Logger] = None,
+        merge_duplicates: bool = False,
+    ):
+        """Initialize the MemoryCompactor.
+
+        Args:
+            memory (KnowledgeGraphManager): Manager of the graph to compact
+            policy (RetentionPolicy): Policy deciding which entities expire
+            interval (float): Seconds between two compaction runs
+            batch_size (int, optional): Number of entities processed per batch. Defaults to DEFAULT_PAGE_SIZE.
+            logger (logging.Logger, optional): Logger instance, defaults to the manager's logger
+            merge_duplicates (bool, optional): Whether observations differing only in case and whitespace
+                are merged, which is lossy when case is meaningful. Defaults to False.
+        """
+        self.memory = memory
+        self.policy = policy
+        self.interval = interval
+        self.batch_size = batch_size
+        self.merge_duplicates = merge_duplicates
+        self.logger = logger or memory.logger
+        self.last_result: Optional[CompactionResult] = None
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start compacting in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='memory-compactor', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread after the current batch."""
+        self._closed.set()
+
+    def run_once(self) -> CompactionResult:
+        """Compact the whole memory graph once.
+
+        Returns:
+            CompactionResult: The outcome of the run
+        """
+        started_at = time.time()
+        scanned = deleted = merged = 0
+        cursor = None
+        while not self._closed.is_set():
+            records = self.memory.read_access_page(cursor, self.batch_size)
+            if not records:
+                break
+            now = time.time()
+            # Entities written before access tracking start aging once stamped, they never expire unstamped
+            self.memory.stamp_access_metadata([r["id"] for r in records if r["last_accessed_at"] is None])
+            expired = [
+                r["id"] for r in records
+                if self.policy.is_enabled() and r["last_accessed_at"] is not None
+                and self.policy.is_expired(r["last_accessed_at"], r["access_count"], now)
+            ]
+            deleted += self.memory.delete_entities(expired)
+            expired_ids = set(expired)
+            kept = [r["id"] for r in records if r["id"] not in expired_ids]
+            if kept and self.merge_duplicates:
+                merged += self.memory.delete_observations(self._duplicates(self.memory.read_observations(kept)))
+            scanned += len(records)
+            if len(records) < self.batch_size:
+                break
+            cursor = records[-1]["id"]
+
+        self.last_result = CompactionResult(
+            started_at=started_at,
+            duration=time.time() - started_at,
+            entities_scanned=scanned,
+            entities_deleted=deleted,
+            observations_merged=merged,
+        )
+        self.logger.info(f"Memory compaction: {self.last_result}")
+        return self.last_result
+
+    @staticmethod
+    def _duplicates(observations: List[Dict[str, Any]]) -> List[str]:
+        """Find the observations that duplicate another observation of the same entity.
+
+        The first observation of each group of duplicates is kept.
+
+        Args:
+            observations (List[Dict[str, Any]]): Rows with the entity id, the observation id and its content
+
+        Returns:
+            List[str]: Ids of the observations to delete
+        """
+        seen = set()
+        duplicates = []
+        for obs in sorted(observations, key=lambda o: o["id"]):
+            key = (obs["entity"], normalize_observation(obs["content"] or ""))
+            if key in seen:
+                duplicates.append(obs["id"])
+            else:
+                seen.add(key)
+        return duplicates
+
+    def _run(self):
+        """Background loop running a compaction every interval."""
+        while not self._closed.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                self.logger.warning(f"Memory compaction failed: {e}")
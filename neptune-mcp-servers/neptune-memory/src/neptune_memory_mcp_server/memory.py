@@ -20,12 +20,94 @@ The KnowledgeGraphManager class serves as the main interface for all graph opera
 providing methods to manipulate and query the graph structure while maintaining data consistency.
 """
 
+
+import hashlib
 import json
 import logging
-from dataclasses import asdict
-from neptune_memory_mcp_server.models import Entity, KnowledgeGraph, Observation, QueryLanguage, Relation
+import threading
+import time
+from dataclasses import replace
+from neptune_memory_mcp_server.buffer import (
+    PendingWrites,
+    WriteBuffer,
+    pending_observations,
+)
+from neptune_memory_mcp_server.cache import CacheEntry, EntityCache
+from neptune_memory_mcp_server.models import (
+    DEFAULT_NAMESPACE,
+    CacheStats,
+    Entity,
+    KnowledgeGraph,
+    KnowledgeGraphPage,
+    NamespaceStats,
+    Observation,
+    QueryLanguage,
+    Relation,
+)
 from neptune_memory_mcp_server.neptune import NeptuneServer
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# Minimum number of seconds between two accesses of an entity recorded in Neptune
+TOUCH_INTERVAL = 60
+# Number of recently touched entities remembered to debounce their access writes
+MAX_TOUCHED = 10_000
+
+
+def observation_hash(content: str) -> str:
+    """Compute the content hash of an observation.
+
+    Args:
+        content (str): The observation text
+
+    Returns:
+        str: Hex encoded SHA-256 digest of the observation
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def observation_id(namespace: str, entity_name: str, content: str) -> str:
+    """Compute the node id of an observation attached to an entity.
+
+    Observations are stored as their own nodes whose id is derived from the owning
+    entity and the content hash. Looking an observation up, or deduplicating it,
+    is therefore a single id lookup rather than a scan of the entity's observations.
+    Ids in the default namespace omit the namespace so that observations written
+    before namespaces were introduced keep their id.
+
+    Args:
+        namespace (str): Namespace of the entity the observation belongs to
+        entity_name (str): Name of the entity the observation belongs to
+        content (str): The observation text
+
+    Returns:
+        str: The id of the observation node
+    """
+    key = f'{entity_name}\n{content}' if namespace == DEFAULT_NAMESPACE else f'{namespace}\n{entity_name}\n{content}'
+    return 'observation:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def observation_rows(namespace: str, entity_name: str, contents: List[str]) -> List[Dict[str, str]]:
+    """Build the query parameters used to write the observations of an entity.
+
+    Duplicate contents are dropped while preserving the original order.
+
+    Args:
+        namespace (str): Namespace of the entity the observations belong to
+        entity_name (str): Name of the entity the observations belong to
+        contents (List[str]): The observation texts
+
+    Returns:
+        List[Dict[str, str]]: One row per distinct observation with its id, content and hash
+    """
+    rows = {}
+    for content in contents:
+        oid = observation_id(namespace, entity_name, content)
+        if oid not in rows:
+            rows[oid] = {"id": oid, "content": content, "hash": observation_hash(content)}
+    return list(rows.values())
 
 
 class KnowledgeGraphManager:
@@ -35,22 +117,117 @@ class KnowledgeGraphManager:
     entities, relations, and observations in the knowledge graph. It handles
     all interactions with the Neptune database through a provided client.
 
+    Every memory node carries the namespace (tenant or user) it belongs to and
+    every query is anchored on that namespace, so an operation only ever touches
+    the partition of a single namespace.
+
     Attributes:
         client (NeptuneServer): Instance of NeptuneServer for database operations
         logger (logging.Logger): Logger instance for tracking operations
+        namespace (str): Namespace used when an operation does not specify one
+        buffer (Optional[WriteBuffer]): Write-behind buffer coalescing mutations, None when writes go straight to Neptune
+        cache (Optional[EntityCache]): Read-through cache of entities and search results, None when caching is disabled
     """
 
-    def __init__(self, client: NeptuneServer, logger: logging.Logger):
+    def __init__(
+        self,
+        client: NeptuneServer,
+        logger: logging.Logger,
+        buffer_size: int = 0,
+        flush_interval: Optional[float] = None,
+        namespace: str = DEFAULT_NAMESPACE,
+        cache_bytes: int = 0,
+    ):
         """Initialize the KnowledgeGraphManager.
 
         Args:
             client (NeptuneServer): Neptune database client instance
             logger (logging.Logger): Logger instance for operation tracking
+            buffer_size (int, optional): Number of mutations buffered before they are written
+                to Neptune in one batch. Defaults to 0, which disables buffering.
+            flush_interval (float, optional): Maximum number of seconds a buffered mutation
+                waits before being written. Defaults to None (only size based and explicit flushes).
+            namespace (str, optional): Namespace used when an operation does not specify one.
+                Defaults to DEFAULT_NAMESPACE.
+            cache_bytes (int, optional): Byte budget of the entity cache. Defaults to 0, which disables caching.
         """
         self.client = client
         self.logger = logger
+        self.namespace = namespace
+        self.buffer = WriteBuffer(self._write_pending, buffer_size, flush_interval) if buffer_size > 0 else None
+        self.cache = EntityCache(cache_bytes) if cache_bytes > 0 else None
+        # Time at which the last access to each entity was written, keyed by namespace and name
+        self._touched: Dict[Tuple[str, str], float] = {}
+        self._touched_lock = threading.Lock()
+
+    def _namespace(self, namespace: Optional[str]) -> str:
+        """Resolve the namespace of an operation.
+
+        Args:
+            namespace (str, optional): Namespace requested by the caller
 
-    def load_graph(self, filter_query=None) -> KnowledgeGraph:
+        Returns:
+            str: The requested namespace, or the manager's default one
+        """
+        return namespace or self.namespace
+
+    def _query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Run an openCypher query and return the result rows.
+
+        Neptune Analytics returns the raw JSON payload while Neptune Database returns
+        the already decoded results, so both shapes are normalized to a list of rows.
+
+        Args:
+            query (str): openCypher query to run
+            parameters (Dict[str, Any], optional): Query parameters
+
+        Returns:
+            List[Dict[str, Any]]: The result rows
+        """
+        resp = self.client.query(query, parameters=parameters, language=QueryLanguage.OPEN_CYPHER)
+        if isinstance(resp, str):
+            resp = json.loads(resp)
+        if isinstance(resp, dict):
+            return resp.get("results", [])
+        return resp or []
+
+    @staticmethod
+    def _to_entity(record: Dict[str, Any], namespace: str) -> Entity:
+        """Convert a result row with name, type and observations into an Entity.
+
+        Args:
+            record (Dict[str, Any]): Result row
+            namespace (str): Namespace the entity was read from
+
+        Returns:
+            Entity: The converted entity
+        """
+        return Entity(
+            name=record["name"],
+            type=record.get("type"),
+            observations=record.get("observations") or [],
+            namespace=namespace,
+        )
+
+    @staticmethod
+    def _to_relation(record: Dict[str, Any], namespace: str) -> Relation:
+        """Convert a result row with source, target and relationType into a Relation.
+
+        Args:
+            record (Dict[str, Any]): Result row
+            namespace (str): Namespace the relation was read from
+
+        Returns:
+            Relation: The converted relation
+        """
+        return Relation(
+            source=record["source"],
+            target=record["target"],
+            relationType=record["relationType"],
+            namespace=namespace,
+        )
+
+    def load_graph(self, filter_query=None, namespace: Optional[str] = None) -> KnowledgeGraph:
         """Load the knowledge graph with optional filtering.
 
         Retrieves entities and their relationships from the Neptune database.
@@ -58,173 +235,814 @@ class KnowledgeGraphManager:
 
         Args:
             filter_query (str, optional): Query string to filter entities by name
+            namespace (str, optional): Namespace to load. Defaults to the manager's namespace.
 
         Returns:
             KnowledgeGraph: Object containing filtered entities and their relations
         """
+        self.flush()
+        namespace = self._namespace(namespace)
+        parameters = {"namespace": namespace}
+        match = "MATCH (entity:Memory { namespace: $namespace }) "
         if filter_query:
-            query = "MATCH (entity) WHERE toLower(entity.name) CONTAINS toLower($filter) "
-        else:
-            query = ""
-        query = (
-            query
-            + """
-                OPTIONAL MATCH p=(entity:Memory)-[r]-(other)
-                WITH nodes(p) as n
-                UNWIND n as node
-                WITH collect(DISTINCT node) as nodes
-            UNWIND nodes as node
-            RETURN  {
-                name: node.name,
-                type: node.type,
-                observations: node.observations
-            } as node
+            match += "WHERE toLower(entity.name) CONTAINS toLower($filter) "
+            parameters["filter"] = filter_query
+
+        query = match + """
+        OPTIONAL MATCH (entity)-[:related_to]-(other:Memory)
+        WITH collect(DISTINCT entity) + collect(DISTINCT other) as nodes
+        UNWIND nodes as node
+        WITH DISTINCT node
+        OPTIONAL MATCH (node)-[:has_observation]->(o:Observation)
+        RETURN node.name as name, node.type as type, collect(o.content) as observations
         """
-        )
-        resp = self.client.query(query, parameters={"filter": filter_query}, language=QueryLanguage.OPEN_CYPHER)
-        result = json.loads(resp)["results"]
-
-        entities = []
-        for node in result:
-            if "name" in node["node"]:
-                entities.append(
-                    Entity(
-                        name=node["node"]["name"],
-                        type=node["node"]["type"],
-                        observations=node["node"]["observations"].split("|"),
-                    )
-                )
+        entities = [self._to_entity(record, namespace) for record in self._query(query, parameters)]
 
-        if filter_query:
-            query = "MATCH (entity) WHERE toLower(entity.name) CONTAINS toLower($filter) "
-        else:
-            query = ""
-        query = (
-            query
-            + """
-            OPTIONAL MATCH p=(entity:Memory)-[r]-(other)
-            RETURN  {
-                            source: id(startNode(r)),
-                            target: id(endNode(r)),
-                            relationType: r.type
-                        } as rel
+        query = match + """
+        MATCH (entity)-[r:related_to]-(other:Memory)
+        RETURN DISTINCT startNode(r).name as source, endNode(r).name as target, r.type as relationType
         """
-        )
-        resp = self.client.query(query, parameters={"filter": filter_query}, language=QueryLanguage.OPEN_CYPHER)
-
-        result = json.loads(resp)["results"]
-        rels = []
-        for rel in result:
-            if "relationType" in rel["rel"]:
-                rels.append(
-                    Relation(
-                        source=rel["rel"]["source"],
-                        target=rel["rel"]["target"],
-                        relationType=rel["rel"]["relationType"]
-                    )
-                )
+        rels = [self._to_relation(record, namespace) for record in self._query(query, parameters)]
 
         self.logger.debug(f"Loaded entities: {entities}")
         self.logger.debug(f"Loaded relations: {rels}")
         return KnowledgeGraph(entities=entities, relations=rels)
 
-    def create_entities(self, entities: List[Entity]) -> List[Entity]:
+    def create_entities(self, entities: List[Entity], namespace: Optional[str] = None) -> List[Entity]:
         """Create new entities in the knowledge graph.
 
         Args:
             entities (List[Entity]): List of entities to create
+            namespace (str, optional): Namespace of entities that do not specify one.
+                Defaults to the manager's namespace.
 
         Returns:
             List[Entity]: The created entities
         """
-        query = """
-        UNWIND $entities as entity
-        MERGE (e:Memory { name: entity.name })
-        SET e.type = entity.type
-        SET e.observations = join(entity.observations, '|')
-        """
-        entities_data = [asdict(entity) for entity in entities]
-        self.client.query(query, parameters={"entities": entities_data}, language=QueryLanguage.OPEN_CYPHER)
+        namespace = self._namespace(namespace)
+        entities = [replace(entity, namespace=entity.namespace or namespace) for entity in entities]
+        keys = [(entity.namespace, entity.name) for entity in entities]
+        self._invalidate(keys)
+        if self.buffer is not None:
+            self.buffer.add_entities(entities)
+        else:
+            self._write_entities(entities)
+            self._invalidate(keys)
         return entities
 
-    def create_relations(self, relations: List[Relation]) -> List[Relation]:
+    def create_relations(self, relations: List[Relation], namespace: Optional[str] = None) -> List[Relation]:
         """Create new relations between entities in the knowledge graph.
 
+        Both entities of a relation must belong to the namespace of the relation.
+
         Args:
             relations (List[Relation]): List of relations to create
+            namespace (str, optional): Namespace of relations that do not specify one.
+                Defaults to the manager's namespace.
 
         Returns:
             List[Relation]: The created relations
         """
-        for relation in relations:
-            query = """
-            UNWIND $relations as relation
-            MATCH (from:Memory),(to:Memory)
-            WHERE from.name = relation.source
-            AND  to.name = relation.target
-            MERGE (from)-[r:related_to]->(to)
-            SET r.type = relation.relationType
-            """
-
-            self.client.query(
-                query, parameters={"relations": [asdict(relation) for relation in relations]}, language=QueryLanguage.OPEN_CYPHER
-            )
-
+        namespace = self._namespace(namespace)
+        relations = [replace(relation, namespace=relation.namespace or namespace) for relation in relations]
+        keys = [(relation.namespace, name) for relation in relations for name in (relation.source, relation.target)]
+        self._invalidate(keys)
+        if self.buffer is not None:
+            self.buffer.add_relations(relations)
+        else:
+            self._write_relations(relations)
+            self._invalidate(keys)
         return relations
 
-    def add_observations(self, observations: List[Observation]) -> List[Dict[str, Any]]:
+    def add_observations(self, observations: List[Observation], namespace: Optional[str] = None) -> List[Dict[str, Any]]:
         """Add new observations to existing entities.
 
+        When writes are buffered the observations are not checked against the graph
+        yet, so every requested observation is reported as added.
+
         Args:
             observations (List[Observation]): List of observations to add
+            namespace (str, optional): Namespace of observations that do not specify one.
+                Defaults to the manager's namespace.
 
         Returns:
             List[Dict[str, Any]]: Results of the operation, including added observations
         """
-        query = """
-        UNWIND $observations as obs
-        MATCH (e:Memory { name: obs.entityName })
-        WITH e, [o in obs.contents WHERE NOT o IN e.observations] as new
-        SET e.observations = coalesce(e.observations,[]) + new
-        RETURN e.name as name, new
+        namespace = self._namespace(namespace)
+        observations = [replace(obs, namespace=obs.namespace or namespace) for obs in observations]
+        keys = [(obs.namespace, obs.entityName) for obs in observations]
+        self._invalidate(keys)
+        if self.buffer is not None:
+            self.buffer.add_observations(observations)
+            return [{"entityName": obs.entityName, "addedObservations": obs.contents} for obs in observations]
+        added = self._write_observations(observations)
+        self._invalidate(keys)
+        return added
+
+    def _invalidate(self, keys: Iterable[Tuple[str, str]]):
+        """Drop written entities, and the search results of their namespaces, from the cache.
+
+        Writes invalidate before and after they reach Neptune: before, so that the cache
+        never answers with data older than a pending write; after, so that reads that ran
+        while the write was in flight do not cache what they saw.
+
+        Args:
+            keys (Iterable[Tuple[str, str]]): Namespace and name of each written entity
+        """
+        if self.cache is None:
+            return
+        names: Dict[str, List[str]] = {}
+        for namespace, name in keys:
+            names.setdefault(namespace, []).append(name)
+        for namespace, entity_names in names.items():
+            self.cache.invalidate(namespace, entity_names)
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Get the metrics of the entity cache.
+
+        Returns:
+            Optional[CacheStats]: Hit rate, size and eviction counters, None if caching is disabled
+        """
+        return self.cache.stats() if self.cache is not None else None
+
+    def flush(self) -> int:
+        """Write any buffered mutation to Neptune.
+
+        Returns:
+            int: Number of mutations written
         """
+        if self.buffer is None:
+            return 0
+        return self.buffer.flush()
 
-        result = self.client.query(
-            query, parameters={"observations": [asdict(obs) for obs in observations]}, language=QueryLanguage.OPEN_CYPHER
+    def close(self):
+        """Flush buffered mutations and stop the background flusher."""
+        if self.buffer is not None:
+            self.buffer.close()
+
+    def _write_pending(self, batch: PendingWrites):
+        """Write a batch of buffered mutations to Neptune.
+
+        Entities are written first so that the observations and relations of the
+        batch can refer to entities created in the same batch.
+
+        Args:
+            batch (PendingWrites): The buffered mutations
+        """
+        if batch.entities:
+            self._write_entities(list(batch.entities.values()))
+        if batch.observations:
+            self._write_observations(pending_observations(batch))
+        if batch.relations:
+            self._write_relations(list(batch.relations.values()))
+        self._invalidate(
+            list(batch.entities)
+            + list(batch.observations)
+            + [(namespace, name) for namespace, source, target in batch.relations for name in (source, target)]
         )
+        self.logger.debug(f"Flushed {batch.count} buffered mutations")
+
+    def _write_entities(self, entities: List[Entity]):
+        """Write entities and their observations to Neptune.
+
+        Args:
+            entities (List[Entity]): List of entities to write, with their namespace set
+        """
+        query = """
+        UNWIND $entities as entity
+        MERGE (e:Memory { namespace: entity.namespace, name: entity.name })
+        ON CREATE SET e.created_at = $now, e.access_count = 0
+        SET e.type = entity.type, e.last_accessed_at = $now
+        WITH e, entity
+        UNWIND entity.observations as obs
+        MERGE (o:Observation { `~id`: obs.id })
+        ON CREATE SET o.content = obs.content, o.hash = obs.hash
+        MERGE (e)-[:has_observation]->(o)
+        """
+        entities_data = [
+            {
+                "namespace": entity.namespace,
+                "name": entity.name,
+                "type": entity.type,
+                "observations": observation_rows(entity.namespace, entity.name, entity.observations),
+            }
+            for entity in entities
+        ]
+        self._query(query, {"entities": entities_data, "now": time.time()})
+
+    def _write_relations(self, relations: List[Relation]):
+        """Write relations to Neptune.
+
+        Args:
+            relations (List[Relation]): List of relations to write, with their namespace set
+        """
+        query = """
+        UNWIND $relations as relation
+        MATCH (from:Memory { namespace: relation.namespace, name: relation.source })
+        MATCH (to:Memory { namespace: relation.namespace, name: relation.target })
+        MERGE (from)-[r:related_to]->(to)
+        SET r.type = relation.relationType
+        """
+        relations_data = [
+            {
+                "namespace": relation.namespace,
+                "source": relation.source,
+                "target": relation.target,
+                "relationType": relation.relationType,
+            }
+            for relation in relations
+        ]
+        self._query(query, {"relations": relations_data})
+
+    def _write_observations(self, observations: List[Observation]) -> List[Dict[str, Any]]:
+        """Write observations of existing entities to Neptune, skipping the ones already stored.
+
+        Args:
+            observations (List[Observation]): List of observations to write, with their namespace set
 
-        results = [
+        Returns:
+            List[Dict[str, Any]]: The observations actually added, per entity
+        """
+        query = """
+        UNWIND $observations as obs
+        MATCH (e:Memory { namespace: obs.namespace, name: obs.entityName })
+        SET e.last_accessed_at = $now
+        WITH e, obs
+        UNWIND obs.contents as content
+        OPTIONAL MATCH (existing:Observation { `~id`: content.id })
+        WITH e, content, existing
+        WHERE existing IS NULL
+        CREATE (o:Observation { `~id`: content.id, content: content.content, hash: content.hash })
+        CREATE (e)-[:has_observation]->(o)
+        RETURN e.name as name, collect(content.content) as new
+        """
+        observations_data = [
+            {
+                "namespace": obs.namespace,
+                "entityName": obs.entityName,
+                "contents": observation_rows(obs.namespace, obs.entityName, obs.contents),
+            }
+            for obs in observations
+        ]
+        result = self._query(query, {"observations": observations_data, "now": time.time()})
+
+        return [
             {"entityName": record.get("name"), "addedObservations": record.get("new")}
-            for record in result.records
+            for record in result
+        ]
+
+    def assign_default_namespace(self, batch_size: int = 500) -> int:
+        """Assign the default namespace to entities written before namespaces existed.
+
+        Args:
+            batch_size (int, optional): Number of entities updated per transaction. Defaults to 500.
+
+        Returns:
+            int: Number of entities updated
+        """
+        query = """
+        MATCH (e:Memory)
+        WHERE e.namespace IS NULL
+        WITH e LIMIT $limit
+        SET e.namespace = $namespace
+        RETURN count(e) as updated
+        """
+        updated = 0
+        while True:
+            records = self._query(query, {"limit": batch_size, "namespace": DEFAULT_NAMESPACE})
+            count = records[0]["updated"] if records else 0
+            if not count:
+                return updated
+            updated += count
+            self.logger.info(f"Assigned the default namespace to {updated} entities")
+
+    def migrate_legacy_observations(self, batch_size: int = 500) -> int:
+        """Move observations stored in the legacy `observations` property to observation nodes.
+
+        Earlier versions stored every observation of an entity in a single `|`-joined
+        property. This converts them, one batch of entities per transaction, to
+        observation nodes and removes the legacy property. It is idempotent and can
+        be resumed after an interruption.
+
+        Args:
+            batch_size (int, optional): Number of entities migrated per transaction. Defaults to 500.
+
+        Returns:
+            int: Number of entities migrated
+        """
+        read_query = """
+        MATCH (e:Memory)
+        WHERE e.observations IS NOT NULL
+        RETURN id(e) as id, e.namespace as namespace, e.name as name, e.observations as observations
+        LIMIT $limit
+        """
+        write_query = """
+        UNWIND $entities as entity
+        MATCH (e:Memory)
+        WHERE id(e) = entity.id
+        REMOVE e.observations
+        WITH e, entity
+        UNWIND entity.observations as obs
+        MERGE (o:Observation { `~id`: obs.id })
+        ON CREATE SET o.content = obs.content, o.hash = obs.hash
+        MERGE (e)-[:has_observation]->(o)
+        """
+        migrated = 0
+        while True:
+            records = self._query(read_query, {"limit": batch_size})
+            if not records:
+                return migrated
+            entities_data = []
+            for record in records:
+                legacy = record["observations"]
+                contents = legacy.split("|") if isinstance(legacy, str) else legacy
+                namespace = record.get("namespace") or DEFAULT_NAMESPACE
+                entities_data.append(
+                    {
+                        "id": record["id"],
+                        "observations": observation_rows(namespace, record["name"], [c for c in contents if c]),
+                    }
+                )
+            self._query(write_query, {"entities": entities_data})
+            migrated += len(records)
+            self.logger.info(f"Migrated observations of {migrated} entities")
+
+    def read_graph_page(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        namespace: Optional[str] = None,
+    ) -> KnowledgeGraphPage:
+        """Read a single page of the knowledge graph.
+
+        Entities are ordered by their internal id and the page starts right after
+        the entity identified by the cursor. The relations returned are the ones
+        originating from the entities of the page.
+
+        Args:
+            cursor (str, optional): Cursor returned by the previous page, None for the first page
+            page_size (int, optional): Maximum number of entities in the page. Defaults to DEFAULT_PAGE_SIZE.
+            namespace (str, optional): Namespace to read. Defaults to the manager's namespace.
+
+        Returns:
+            KnowledgeGraphPage: The entities and relations of the page and the cursor of the next page
+        """
+        self.flush()
+        namespace = self._namespace(namespace)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        parameters = {"limit": page_size, "namespace": namespace}
+        query = "MATCH (e:Memory { namespace: $namespace }) "
+        if cursor:
+            query += "WHERE id(e) > $cursor "
+            parameters["cursor"] = cursor
+        query += """
+        WITH e ORDER BY id(e) LIMIT $limit
+        OPTIONAL MATCH (e)-[:has_observation]->(o:Observation)
+        WITH e, collect(o.content) as observations
+        RETURN id(e) as id, e.name as name, e.type as type, observations
+        ORDER BY id(e)
+        """
+        records = self._query(query, parameters)
+        entities = [self._to_entity(record, namespace) for record in records]
+        if not records:
+            return KnowledgeGraphPage(entities=[], relations=[], next_cursor=None)
+
+        query = """
+        MATCH (from:Memory)-[r:related_to]->(to:Memory)
+        WHERE id(from) IN $ids
+        RETURN from.name as source, to.name as target, r.type as relationType
+        """
+        rels = [
+            self._to_relation(record, namespace)
+            for record in self._query(query, {"ids": [record["id"] for record in records]})
         ]
-        return results
 
-    def read_graph(self) -> KnowledgeGraph:
+        next_cursor = records[-1]["id"] if len(records) == page_size else None
+        return KnowledgeGraphPage(entities=entities, relations=rels, next_cursor=next_cursor)
+
+    def iter_graph_pages(
+        self, page_size: int = DEFAULT_PAGE_SIZE, namespace: Optional[str] = None
+    ) -> Iterator[KnowledgeGraphPage]:
+        """Iterate over the knowledge graph one page at a time.
+
+        Pages are only fetched when the caller asks for them, so a consumer can stop
+        early without the remaining pages ever being read from Neptune.
+
+        Args:
+            page_size (int, optional): Maximum number of entities per page. Defaults to DEFAULT_PAGE_SIZE.
+            namespace (str, optional): Namespace to read. Defaults to the manager's namespace.
+
+        Yields:
+            KnowledgeGraphPage: The next page of the graph
+        """
+        cursor = None
+        while True:
+            page = self.read_graph_page(cursor, page_size, namespace)
+            if page.entities:
+                yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def iter_entities(self, page_size: int = DEFAULT_PAGE_SIZE, namespace: Optional[str] = None) -> Iterator[Entity]:
+        """Iterate over all entities of the knowledge graph.
+
+        Args:
+            page_size (int, optional): Number of entities fetched per round trip. Defaults to DEFAULT_PAGE_SIZE.
+            namespace (str, optional): Namespace to read. Defaults to the manager's namespace.
+
+        Yields:
+            Entity: The next entity
+        """
+        for page in self.iter_graph_pages(page_size, namespace):
+            yield from page.entities
+
+    def iter_relations(self, page_size: int = DEFAULT_PAGE_SIZE, namespace: Optional[str] = None) -> Iterator[Relation]:
+        """Iterate over all relations of the knowledge graph.
+
+        Args:
+            page_size (int, optional): Number of source entities fetched per round trip. Defaults to DEFAULT_PAGE_SIZE.
+            namespace (str, optional): Namespace to read. Defaults to the manager's namespace.
+
+        Yields:
+            Relation: The next relation
+        """
+        for page in self.iter_graph_pages(page_size, namespace):
+            yield from page.relations
+
+    def read_graph(self, namespace: Optional[str] = None) -> KnowledgeGraph:
         """Read the entire knowledge graph.
 
+        This materializes every page in memory, prefer read_graph_page or
+        iter_graph_pages for large graphs.
+
+        Args:
+            namespace (str, optional): Namespace to read. Defaults to the manager's namespace.
+
         Returns:
             KnowledgeGraph: Complete graph with all entities and relations
         """
-        return self.load_graph()
+        graph = KnowledgeGraph(entities=[], relations=[])
+        for page in self.iter_graph_pages(namespace=namespace):
+            graph.entities.extend(page.entities)
+            graph.relations.extend(page.relations)
+        return graph
 
-    def search_nodes(self, query: str) -> KnowledgeGraph:
+    def search_nodes(self, query: str, namespace: Optional[str] = None) -> KnowledgeGraph:
         """Search for nodes in the knowledge graph.
 
+        Results are answered from the cache when the same search was run since the
+        last write to the namespace.
+
         Args:
             query (str): Search query string
+            namespace (str, optional): Namespace to search. Defaults to the manager's namespace.
 
         Returns:
             KnowledgeGraph: Graph containing matching nodes and their relations
         """
-        return self.load_graph(query)
+        namespace = self._namespace(namespace)
+        if self.cache is not None:
+            entry = self.cache.get_search(namespace, query)
+            if entry is not None:
+                self._touch_cached([entry], namespace)
+                return entry.value
+        self.flush()
+        generation = self.cache.generation(namespace) if self.cache is not None else 0
+        graph = self.load_graph(query, namespace)
+        self._touch([entity.name for entity in graph.entities], namespace)
+        if self.cache is not None:
+            self.cache.put_search(namespace, query, graph, generation)
+        return graph
 
-    def find_nodes(self, names: List[str]) -> KnowledgeGraph:
-        """Find specific nodes by their names.
+    def find_nodes(self, names: List[str], namespace: Optional[str] = None) -> KnowledgeGraph:
+        """Find specific nodes by their exact names.
+
+        The lookup is an exact match on (namespace, name), which Neptune answers
+        from its property index rather than by scanning entity names.
 
         Args:
             names (List[str]): List of node names to find
+            namespace (str, optional): Namespace to search. Defaults to the manager's namespace.
 
         Returns:
-            KnowledgeGraph: Graph containing the specified nodes and their relations
+            KnowledgeGraph: Graph containing the specified nodes and the relations attached to them
+        """
+        namespace = self._namespace(namespace)
+        names = list(dict.fromkeys(names))
+        cached = KnowledgeGraph(entities=[], relations=[])
+        if self.cache is not None:
+            entries = []
+            missing = []
+            for name in names:
+                entry = self.cache.get_entity(namespace, name)
+                if entry is None:
+                    missing.append(name)
+                    continue
+                entries.append(entry)
+                entity, relations = entry.value
+                cached.entities.append(entity)
+                cached.relations.extend(r for r in relations if r not in cached.relations)
+            self._touch_cached(entries, namespace)
+            names = missing
+        if not names:
+            return cached
+
+        self.flush()
+        generation = self.cache.generation(namespace) if self.cache is not None else 0
+        parameters = {"names": names, "namespace": namespace}
+
+        query = """
+        MATCH (e:Memory { namespace: $namespace })
+        WHERE e.name IN $names
+        OPTIONAL MATCH (e)-[:has_observation]->(o:Observation)
+        RETURN e.name as name, e.type as type, collect(o.content) as observations
+        """
+        entities = [self._to_entity(record, namespace) for record in self._query(query, parameters)]
+        self._touch([entity.name for entity in entities], namespace)
+
+        query = """
+        MATCH (e:Memory { namespace: $namespace })-[r:related_to]-(:Memory)
+        WHERE e.name IN $names
+        RETURN DISTINCT startNode(r).name as source, endNode(r).name as target, r.type as relationType
+        """
+        rels = [
+            self._to_relation(record, namespace)
+            for record in self._query(query, {"names": names, "namespace": namespace})
+        ]
+        if self.cache is not None:
+            for entity in entities:
+                self.cache.put_entity(entity, [r for r in rels if entity.name in (r.source, r.target)], generation)
+        return KnowledgeGraph(
+            entities=cached.entities + entities,
+            relations=cached.relations + [r for r in rels if r not in cached.relations],
+        )
+
+    def verify_name_index(self, sample_size: int = 10) -> List[Dict[str, Any]]:
+        """Verify that entity names can be used as a unique lookup key.
+
+        Neptune maintains the property indexes used by exact (namespace, name) lookups
+        automatically and has no statement to declare them, so the check makes sure
+        that no two entities of a namespace share a name. It scans every entity, so it
+        is run by the migration tool rather than at server startup. Duplicates are
+        reported as warnings so that they can be cleaned up.
+
+        Args:
+            sample_size (int, optional): Maximum number of duplicate names reported. Defaults to 10.
+
+        Returns:
+            List[Dict[str, Any]]: The duplicated names with their namespace and number of entities
+        """
+        query = """
+        MATCH (e:Memory)
+        WITH e.namespace as namespace, e.name as name, count(e) as entities
+        WHERE entities > 1
+        RETURN namespace, name, entities
+        LIMIT $limit
+        """
+        duplicates = self._query(query, {"limit": sample_size})
+        for duplicate in duplicates:
+            self.logger.warning(
+                f"Entity name '{duplicate['name']}' is used by {duplicate['entities']} entities "
+                f"in namespace '{duplicate['namespace']}'"
+            )
+        return duplicates
+
+    def _touch(self, names: List[str], namespace: Optional[str] = None):
+        """Record an access to entities, used by the retention policy.
+
+        An access is only written to Neptune once every TOUCH_INTERVAL seconds per
+        entity, which is plenty for the retention policy and keeps reads from
+        costing a write transaction each.
+
+        Args:
+            names (List[str]): Names of the accessed entities
+            namespace (str, optional): Namespace of the entities. Defaults to the manager's namespace.
+        """
+        namespace = self._namespace(namespace)
+        now = time.time()
+        with self._touched_lock:
+            names = [
+                name for name in dict.fromkeys(names)
+                if now - self._touched.get((namespace, name), float('-inf')) >= TOUCH_INTERVAL
+            ]
+            if len(self._touched) + len(names) > MAX_TOUCHED:
+                self._touched = {key: at for key, at in self._touched.items() if now - at < TOUCH_INTERVAL}
+            for name in names:
+                self._touched[(namespace, name)] = now
+        if not names:
+            return
+        query = """
+        UNWIND $names as name
+        MATCH (e:Memory { namespace: $namespace, name: name })
+        SET e.last_accessed_at = $now, e.access_count = coalesce(e.access_count, 0) + 1
         """
-        return self.load_graph("name: (" + " ".join(names) + ")")
+        self._query(query, {"names": names, "namespace": namespace, "now": now})
+
+    def _touch_cached(self, entries: List[CacheEntry], namespace: str):
+        """Record an access to cached entities or search results.
+
+        Accesses answered from the cache are only written to Neptune once every
+        TOUCH_INTERVAL seconds per entry, which is plenty for the retention policy
+        and keeps cache hits from costing a round trip.
+
+        Args:
+            entries (List[CacheEntry]): The cache entries that were read
+            namespace (str): Namespace of the entries
+        """
+        now = time.time()
+        names = []
+        for entry in entries:
+            if now - entry.touched_at < TOUCH_INTERVAL:
+                continue
+            entry.touched_at = now
+            if isinstance(entry.value, KnowledgeGraph):
+                names.extend(entity.name for entity in entry.value.entities)
+            else:
+                names.append(entry.value[0].name)
+        self._touch(names, namespace)
+
+    def read_access_page(self, cursor: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Read the access metadata of a page of entities across all namespaces.
+
+        Entities written before access tracking existed have no last_accessed_at
+        until they are stamped by stamp_access_metadata.
+
+        Args:
+            cursor (str, optional): Id of the last entity of the previous page, None for the first page
+            page_size (int, optional): Maximum number of entities in the page. Defaults to DEFAULT_PAGE_SIZE.
+
+        Returns:
+            List[Dict[str, Any]]: One row per entity with its id, last_accessed_at and access_count
+        """
+        self.flush()
+        parameters = {"limit": page_size}
+        query = "MATCH (e:Memory) "
+        if cursor:
+            query += "WHERE id(e) > $cursor "
+            parameters["cursor"] = cursor
+        query += """
+        WITH e ORDER BY id(e) LIMIT $limit
+        RETURN id(e) as id, e.last_accessed_at as last_accessed_at, coalesce(e.access_count, 0) as access_count
+        ORDER BY id(e)
+        """
+        return self._query(query, parameters)
+
+    def stamp_access_metadata(self, entity_ids: Optional[List[str]] = None, batch_size: int = 500) -> int:
+        """Stamp entities written before access tracking existed with the current time.
+
+        Stamped entities start aging from now instead of expiring immediately. Only
+        entities without a last access time are written, so this runs once per entity.
+
+        Args:
+            entity_ids (List[str], optional): Internal ids of the entities to stamp, None for the whole graph
+            batch_size (int, optional): Number of entities stamped per transaction. Defaults to 500.
+
+        Returns:
+            int: Number of entities stamped
+        """
+        query = "MATCH (e:Memory) WHERE e.last_accessed_at IS NULL "
+        if entity_ids is not None:
+            if not entity_ids:
+                return 0
+            query += "AND id(e) IN $ids "
+        query += """
+        WITH e LIMIT $limit
+        SET e.last_accessed_at = $now,
+            e.created_at = coalesce(e.created_at, $now),
+            e.access_count = coalesce(e.access_count, 0)
+        RETURN count(e) as stamped
+        """
+        stamped = 0
+        while True:
+            records = self._query(query, {"ids": entity_ids, "limit": batch_size, "now": time.time()})
+            count = records[0]["stamped"] if records else 0
+            stamped += count
+            if count < batch_size:
+                return stamped
+
+    def read_observations(self, entity_ids: List[str]) -> List[Dict[str, Any]]:
+        """Read the observations of entities identified by their internal id.
+
+        Args:
+            entity_ids (List[str]): Internal ids of the entities
+
+        Returns:
+            List[Dict[str, Any]]: One row per observation with the entity id, the observation id and its content
+        """
+        query = """
+        MATCH (e:Memory)-[:has_observation]->(o:Observation)
+        WHERE id(e) IN $ids
+        RETURN id(e) as entity, id(o) as id, o.content as content
+        """
+        return self._query(query, {"ids": entity_ids})
+
+    def delete_entities(self, entity_ids: List[str]) -> int:
+        """Delete entities identified by their internal id together with their observations and relations.
+
+        Args:
+            entity_ids (List[str]): Internal ids of the entities to delete
+
+        Returns:
+            int: Number of entities deleted
+        """
+        if not entity_ids:
+            return 0
+        query = """
+        MATCH (e:Memory)
+        WHERE id(e) IN $ids
+        OPTIONAL MATCH (e)-[:has_observation]->(o:Observation)
+        WITH collect(DISTINCT e) as entities, collect(o) as observations
+        WITH size(entities) as deleted, entities + observations as nodes
+        UNWIND nodes as node
+        DETACH DELETE node
+        RETURN DISTINCT deleted
+        """
+        records = self._query(query, {"ids": entity_ids})
+        if self.cache is not None:
+            self.cache.clear()
+        return records[0]["deleted"] if records else 0
+
+    def delete_observations(self, observation_ids: List[str]) -> int:
+        """Delete observations identified by their id.
+
+        Args:
+            observation_ids (List[str]): Ids of the observations to delete
+
+        Returns:
+            int: Number of observations deleted
+        """
+        if not observation_ids:
+            return 0
+        query = """
+        MATCH (o:Observation)
+        WHERE id(o) IN $ids
+        WITH collect(o) as observations
+        UNWIND observations as o
+        DETACH DELETE o
+        RETURN DISTINCT size(observations) as deleted
+        """
+        records = self._query(query, {"ids": observation_ids})
+        if self.cache is not None:
+            self.cache.clear()
+        return records[0]["deleted"] if records else 0
+
+    def delete_namespace(self, namespace: str, batch_size: int = 500) -> int:
+        """Delete every entity of a namespace together with its observations and relations.
+
+        Args:
+            namespace (str): Namespace to delete
+            batch_size (int, optional): Number of entities deleted per transaction. Defaults to 500.
+
+        Returns:
+            int: Number of entities deleted
+        """
+        self.flush()
+        query = """
+        MATCH (e:Memory { namespace: $namespace })
+        WITH e LIMIT $limit
+        OPTIONAL MATCH (e)-[:has_observation]->(o:Observation)
+        WITH collect(DISTINCT e) as entities, collect(o) as observations
+        WITH size(entities) as deleted, entities + observations as nodes
+        UNWIND nodes as node
+        DETACH DELETE node
+        RETURN DISTINCT deleted
+        """
+        deleted = 0
+        while True:
+            records = self._query(query, {"namespace": namespace, "limit": batch_size})
+            count = records[0]["deleted"] if records else 0
+            deleted += count
+            if count < batch_size:
+                break
+        if self.cache is not None:
+            self.cache.clear()
+        return deleted
+
+    def get_namespace_stats(self, namespace: Optional[str] = None) -> NamespaceStats:
+        """Count the entities, relations and observations stored in a namespace.
+
+        Args:
+            namespace (str, optional): Namespace to measure. Defaults to the manager's namespace.
+
+        Returns:
+            NamespaceStats: The size of the namespace
+        """
+        self.flush()
+        namespace = self._namespace(namespace)
+        query = """
+        MATCH (e:Memory { namespace: $namespace })
+        OPTIONAL MATCH (e)-[:has_observation]->(o:Observation)
+        WITH e, count(o) as observations
+        OPTIONAL MATCH (e)-[r:related_to]->(:Memory)
+        WITH e, observations, count(r) as relations
+        RETURN count(e) as entities, sum(relations) as relations, sum(observations) as observations
+        """
+        records = self._query(query, {"namespace": namespace})
+        record = records[0] if records else {}
+        return NamespaceStats(
+            namespace=namespace,
+            entities=record.get("entities") or 0,
+            relations=record.get("relations") or 0,
+            observations=record.get("observations") or 0,
+        )
@@ -0,0 +1,63 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Memory Graph Migration Module
+
+This module provides a command line tool that upgrades an existing memory graph to the
+current storage layout. Entities written before namespaces existed are assigned the default
+namespace, observations kept in a single `|`-joined property on each entity by earlier
+versions of the server are moved to observation nodes, and entities written before access
+tracking existed are stamped with the current time. Entity names used more than once in a
+namespace are reported, since lookups by name expect them to be unique.
+"""
+
+import argparse
+import logging
+import os
+from neptune_memory_mcp_server.memory import KnowledgeGraphManager
+from neptune_memory_mcp_server.neptune import NeptuneServer
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+def main():
+    """Migrate the memory graph stored in the configured Neptune endpoint.
+
+    Command line arguments:
+        --endpoint: Neptune endpoint (defaults to the NEPTUNE_MEMORY_ENDPOINT environment variable)
+        --batch-size: Number of entities migrated per transaction (default: 500)
+    """
+    parser = argparse.ArgumentParser(description='Migrate a Neptune memory graph to the current storage layout')
+    parser.add_argument('--endpoint', default=os.environ.get('NEPTUNE_MEMORY_ENDPOINT'), help='Neptune endpoint')
+    parser.add_argument('--batch-size', type=int, default=500, help='Entities migrated per transaction')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    if args.endpoint is None:
+        parser.error('--endpoint or the NEPTUNE_MEMORY_ENDPOINT environment variable must be set')
+    use_https = os.environ.get('NEPTUNE_MEMORY_USE_HTTPS', 'True').lower() in ('true', '1', 't')
+    memory = KnowledgeGraphManager(NeptuneServer(args.endpoint, use_https=use_https), logger)
+
+    updated = memory.assign_default_namespace(args.batch_size)
+    migrated = memory.migrate_legacy_observations(args.batch_size)
+    stamped = memory.stamp_access_metadata(batch_size=args.batch_size)
+    logger.info(
+        f'Migration complete, {updated} entities assigned the default namespace, {migrated} entities migrated, '
+        f'{stamped} entities stamped with access metadata'
+    )
+    memory.verify_name_index()
+
+
+if __name__ == '__main__':
+    main()
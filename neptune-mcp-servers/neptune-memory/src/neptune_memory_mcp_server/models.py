@@ -23,7 +23,10 @@ The module contains two main groups of models:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Optional
+
+
+DEFAULT_NAMESPACE = 'default'
 
 
 class QueryLanguage(Enum):
@@ -109,13 +112,15 @@ class Entity:
     with associated observations.
 
     Attributes:
-        name (str): The unique identifier or name of the entity
+        name (str): The unique identifier or name of the entity within its namespace
         type (str): The type or category of the entity
         observations (List[str]): List of observations or facts about the entity
+        namespace (Optional[str]): The namespace (tenant or user) owning the entity, None for the default namespace
     """
     name: str
     type: str
     observations: List[str]
+    namespace: Optional[str] = None
 
 
 @dataclass
@@ -126,10 +131,12 @@ class Relation:
         source (str): The name/identifier of the source entity
         target (str): The name/identifier of the target entity
         relationType (str): The type of relationship between the entities
+        namespace (Optional[str]): The namespace (tenant or user) owning both entities, None for the default namespace
     """
     source: str
     target: str
     relationType: str
+    namespace: Optional[str] = None
 
 
 @dataclass
@@ -147,6 +154,24 @@ class KnowledgeGraph:
     relations: List[Relation]
 
 
+@dataclass
+class KnowledgeGraphPage:
+    """Represents a single page of the knowledge graph.
+
+    Pages are ordered by the internal id of the entities. Each page carries the
+    relations whose source entity is part of the page, so every relation is
+    returned exactly once when walking all pages.
+
+    Attributes:
+        entities (List[Entity]): Entities contained in this page
+        relations (List[Relation]): Relations originating from the entities in this page
+        next_cursor (Optional[str]): Cursor to pass to fetch the next page, or None if this is the last page
+    """
+    entities: List[Entity]
+    relations: List[Relation]
+    next_cursor: Optional[str] = None
+
+
 @dataclass
 class Observation:
     """Represents an observation about an entity in the knowledge graph.
@@ -156,6 +181,78 @@ class Observation:
     Attributes:
         entityName (str): The name of the entity this observation relates to
         contents (List[str]): List of observation contents or facts
+        namespace (Optional[str]): The namespace (tenant or user) owning the entity, None for the default namespace
     """
     entityName: str
     contents: List[str]
+    namespace: Optional[str] = None
+
+
+@dataclass
+class NamespaceStats:
+    """Represents the size of the memory stored in a namespace.
+
+    Attributes:
+        namespace (str): The namespace the statistics are about
+        entities (int): Number of entities in the namespace
+        relations (int): Number of relations between entities of the namespace
+        observations (int): Number of observations attached to entities of the namespace
+    """
+    namespace: str
+    entities: int
+    relations: int
+    observations: int
+
+
+@dataclass
+class CompactionResult:
+    """Represents the outcome of a memory compaction run.
+
+    Attributes:
+        started_at (float): Unix timestamp at which the run started
+        duration (float): Duration of the run in seconds
+        entities_scanned (int): Number of entities inspected
+        entities_deleted (int): Number of entities deleted because the retention policy expired them
+        observations_merged (int): Number of duplicate observations removed
+    """
+    started_at: float
+    duration: float
+    entities_scanned: int
+    entities_deleted: int
+    observations_merged: int
+
+
+@dataclass
+class CacheStats:
+    """Represents the metrics of the entity cache.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that had to query Neptune
+        hit_rate (float): Ratio of lookups answered from the cache
+        evictions (int): Number of entries evicted to stay within the byte budget
+        entries (int): Number of entries currently cached
+        bytes (int): Estimated size of the cached entries in bytes
+        max_bytes (int): Byte budget of the cache
+    """
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    entries: int
+    bytes: int
+    max_bytes: int
+
+
+@dataclass
+class MemoryStats:
+    """Represents the statistics reported by the memory server.
+
+    Attributes:
+        namespace (NamespaceStats): Size of the requested namespace
+        last_compaction (Optional[CompactionResult]): Outcome of the latest compaction run, None if none ran yet
+        cache (Optional[CacheStats]): Metrics of the entity cache, None if caching is disabled
+    """
+    namespace: NamespaceStats
+    last_compaction: Optional[CompactionResult] = None
+    cache: Optional[CacheStats] = None
@@ -20,13 +20,23 @@ The server exposes various tools through FastMCP for managing the knowledge grap
 """
 
 import argparse
+import atexit
 import logging
 import os
 from mcp.server.fastmcp import FastMCP
-from neptune_memory_mcp_server.memory import KnowledgeGraphManager
-from neptune_memory_mcp_server.models import Entity, KnowledgeGraph, Relation
+from neptune_memory_mcp_server.compaction import MemoryCompactor, RetentionPolicy
+from neptune_memory_mcp_server.memory import DEFAULT_PAGE_SIZE, KnowledgeGraphManager
+from neptune_memory_mcp_server.models import (
+    DEFAULT_NAMESPACE,
+    Entity,
+    KnowledgeGraph,
+    KnowledgeGraphPage,
+    MemoryStats,
+    Observation,
+    Relation,
+)
 from neptune_memory_mcp_server.neptune import NeptuneServer
-from typing import List
+from typing import List, Optional
 
 
 logger = logging.getLogger(__name__)
@@ -39,7 +49,38 @@ logger.info(f"NEPTUNE_MEMORY_ENDPOINT: {endpoint}")
 if endpoint is None:
     raise ValueError("NEPTUNE_MEMORY_ENDPOINT environment variable is not set")
 graph = NeptuneServer(endpoint, use_https=use_https)
-memory = KnowledgeGraphManager(graph, logger)
+
+# Optional write-behind buffer, disabled unless a buffer size is configured
+buffer_size = int(os.environ.get("NEPTUNE_MEMORY_WRITE_BUFFER_SIZE", 0))
+flush_interval = float(os.environ.get("NEPTUNE_MEMORY_FLUSH_INTERVAL", 5))
+# Namespace used by tool calls that do not name one
+namespace = os.environ.get("NEPTUNE_MEMORY_NAMESPACE", DEFAULT_NAMESPACE)
+# Optional read-through entity cache, disabled unless a byte budget is configured
+cache_bytes = int(os.environ.get("NEPTUNE_MEMORY_CACHE_BYTES", 0))
+memory = KnowledgeGraphManager(
+    graph,
+    logger,
+    buffer_size=buffer_size,
+    flush_interval=flush_interval,
+    namespace=namespace,
+    cache_bytes=cache_bytes,
+)
+atexit.register(memory.close)
+
+# Optional retention policy and background compaction, disabled unless an interval is configured
+ttl = os.environ.get("NEPTUNE_MEMORY_TTL_SECONDS")
+half_life = os.environ.get("NEPTUNE_MEMORY_HALF_LIFE_SECONDS")
+policy = RetentionPolicy(
+    ttl=float(ttl) if ttl else None,
+    half_life=float(half_life) if half_life else None,
+    min_score=float(os.environ.get("NEPTUNE_MEMORY_MIN_SCORE", 0.1)),
+)
+compaction_interval = float(os.environ.get("NEPTUNE_MEMORY_COMPACTION_INTERVAL", 0))
+merge_duplicates = os.environ.get("NEPTUNE_MEMORY_MERGE_DUPLICATES", 'False').lower() in ('true', '1', 't')
+compactor = MemoryCompactor(memory, policy, compaction_interval, merge_duplicates=merge_duplicates)
+if compaction_interval > 0:
+    compactor.start()
+    atexit.register(compactor.stop)
 
 
 mcp = FastMCP(
@@ -65,60 +106,137 @@ def get_status() -> str:
 
 @mcp.tool(name="create_entities",
         description="Create multiple new entities in the knowledge graph")
-def create_entities(entities: List[Entity]) -> str:
+def create_entities(entities: List[Entity], namespace: Optional[str] = None) -> str:
     """Create multiple new entities in the knowledge graph.
 
     Args:
         entities (List[Entity]): A list of Entity objects to be created in the graph.
+        namespace (Optional[str]): The namespace (tenant or user) to create the entities in.
 
     Returns:
         str: Confirmation message indicating the result of the operation.
     """
-    result = memory.create_entities(entities)
+    result = memory.create_entities(entities, namespace)
     return f"Successfully created {len(result)} entities."
 
 
 @mcp.tool(name="create_relations",
         description="Create multiple new relations between entities in the knowledge graph. Relations should be in active voice")
-def create_relations(relations: List[Relation]) -> str:
+def create_relations(relations: List[Relation], namespace: Optional[str] = None) -> str:
     """Create multiple new relations between entities in the knowledge graph.
 
     Args:
         relations (List[Relation]): A list of Relation objects defining connections
                                   between entities. Relations should be in active voice.
+        namespace (Optional[str]): The namespace (tenant or user) of the related entities.
 
     Returns:
         str: Confirmation message indicating the result of the operation.
     """
-    result = memory.create_relations(relations)
+    result = memory.create_relations(relations, namespace)
     return f"Successfully created {len(result)} relations."
 
 
+@mcp.tool(name="add_observations",
+        description="Add new observations to existing entities in the knowledge graph")
+def add_observations(observations: List[Observation], namespace: Optional[str] = None) -> str:
+    """Add new observations to existing entities in the knowledge graph.
+
+    Observations that are already stored for an entity are skipped.
+
+    Args:
+        observations (List[Observation]): A list of Observation objects, each naming the entity
+                                        and the observation contents to add to it.
+        namespace (Optional[str]): The namespace (tenant or user) of the entities.
+
+    Returns:
+        str: Confirmation message indicating the result of the operation.
+    """
+    result = memory.add_observations(observations, namespace)
+    added = sum(len(r["addedObservations"] or []) for r in result)
+    return f"Successfully added {added} observations."
+
+
+@mcp.tool(name="flush_memory",
+        description="Write any buffered memory changes to the knowledge graph")
+def flush_memory() -> str:
+    """Write any buffered entities, relations and observations to the knowledge graph.
+
+    Returns:
+        str: Confirmation message indicating the number of changes written.
+    """
+    flushed = memory.flush()
+    return f"Successfully flushed {flushed} changes."
+
+
 @mcp.tool(name="read_memory",
-        description="Read the memory knowledge graph")
-def read_graph() -> KnowledgeGraph:
-    """Read the entire memory knowledge graph.
+        description="Read the memory knowledge graph one page at a time. Pass the returned next_cursor to read the following page")
+def read_graph(
+    cursor: Optional[str] = None, page_size: int = DEFAULT_PAGE_SIZE, namespace: Optional[str] = None
+) -> KnowledgeGraphPage:
+    """Read a page of the memory knowledge graph.
+
+    Args:
+        cursor (Optional[str]): The next_cursor returned by the previous call, omit to start from the beginning.
+        page_size (int): The maximum number of entities to return in the page.
+        namespace (Optional[str]): The namespace (tenant or user) to read.
 
     Returns:
-        KnowledgeGraph: A KnowledgeGraph object containing all entities and relations
-                       in the memory graph.
+        KnowledgeGraphPage: The entities of the page, the relations originating from them
+                           and the cursor of the next page (None once the whole graph was read).
     """
-    return memory.read_graph()
+    return memory.read_graph_page(cursor, page_size, namespace)
 
 
 @mcp.tool(name="search_memory",
         description="Search the memory knowledge graph for a specific entity name")
-def search_graph(query: str) -> KnowledgeGraph:
+def search_graph(query: str, namespace: Optional[str] = None) -> KnowledgeGraph:
     """Search the memory knowledge graph for entities matching a specific name.
 
     Args:
         query (str): The search query string to match against entity names.
+        namespace (Optional[str]): The namespace (tenant or user) to search.
 
     Returns:
         KnowledgeGraph: A KnowledgeGraph object containing the matching entities
                        and their relations.
     """
-    return memory.search_nodes(query)
+    return memory.search_nodes(query, namespace)
+
+
+@mcp.tool(name="get_entities",
+        description="Get specific entities of the memory knowledge graph by their exact names")
+def get_entities(names: List[str], namespace: Optional[str] = None) -> KnowledgeGraph:
+    """Get entities of the memory knowledge graph by their exact names.
+
+    Args:
+        names (List[str]): The exact names of the entities to get.
+        namespace (Optional[str]): The namespace (tenant or user) of the entities.
+
+    Returns:
+        KnowledgeGraph: A KnowledgeGraph object containing the entities found
+                       and the relations attached to them.
+    """
+    return memory.find_nodes(names, namespace)
+
+
+@mcp.tool(name="memory_stats",
+        description="Get the size of a memory namespace, the outcome of the latest memory compaction and the cache hit rate")
+def memory_stats(namespace: Optional[str] = None) -> MemoryStats:
+    """Get the size of the memory stored in a namespace, the latest compaction results and the cache metrics.
+
+    Args:
+        namespace (Optional[str]): The namespace (tenant or user) to measure.
+
+    Returns:
+        MemoryStats: The number of entities, relations and observations in the namespace,
+                    the outcome of the latest compaction run and the entity cache metrics.
+    """
+    return MemoryStats(
+        namespace=memory.get_namespace_stats(namespace),
+        last_compaction=compactor.last_result,
+        cache=memory.cache_stats(),
+    )
 
 
 def main():
@@ -0,0 +1,390 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Memory Import and Export Module
+
+This module provides command line tools to back up, seed and move memory graphs. Graphs are
+exchanged as JSONL in the format used by the reference MCP memory server, one entity or
+relation per line:
+
+    {"type": "entity", "name": "...", "entityType": "...", "observations": ["..."]}
+    {"type": "relation", "from": "...", "to": "...", "relationType": "..."}
+
+Exports page through the graph so that they never hold it in memory. Imports read the file
+in chunks that are written by several workers in parallel, and record the completed chunks
+in a checkpoint file so that an interrupted import resumes where it stopped.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from neptune_memory_mcp_server.memory import MAX_PAGE_SIZE, KnowledgeGraphManager
+from neptune_memory_mcp_server.models import DEFAULT_NAMESPACE, Entity, Relation
+from neptune_memory_mcp_server.neptune import NeptuneServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, TextIO
+
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_WORKERS = 8
+
+
+def entity_to_json(entity: Entity) -> Dict[str, Any]:
+    """Convert an entity to a JSONL record.
+
+    Args:
+        entity (Entity): The entity to convert
+
+    Returns:
+        Dict[str, Any]: The entity record
+    """
+    return {"type": "entity", "name": entity.name, "entityType": entity.type, "observations": entity.observations}
+
+
+def relation_to_json(relation: Relation) -> Dict[str, Any]:
+    """Convert a relation to a JSONL record.
+
+    Args:
+        relation (Relation): The relation to convert
+
+    Returns:
+        Dict[str, Any]: The relation record
+    """
+    return {"type": "relation", "from": relation.source, "to": relation.target, "relationType": relation.relationType}
+
+
+def export_memory(
+    memory: KnowledgeGraphManager,
+    output: TextIO,
+    namespace: Optional[str] = None,
+    page_size: int = MAX_PAGE_SIZE,
+) -> Dict[str, int]:
+    """Write the memory graph of a namespace as JSONL.
+
+    The graph is read one page at a time, each page being written before the next
+    one is fetched. Relations are written with the page of their source entity, so
+    their target entity may only appear later in the file.
+
+    Args:
+        memory (KnowledgeGraphManager): Manager of the graph to export
+        output (TextIO): Stream the JSONL records are written to
+        namespace (str, optional): Namespace to export. Defaults to the manager's namespace.
+        page_size (int, optional): Number of entities read per round trip. Defaults to MAX_PAGE_SIZE.
+
+    Returns:
+        Dict[str, int]: Number of entities and relations exported
+    """
+    counts = {"entities": 0, "relations": 0}
+    for page in memory.iter_graph_pages(page_size, namespace):
+        for entity in page.entities:
+            output.write(json.dumps(entity_to_json(entity)) + "\n")
+        for relation in page.relations:
+            output.write(json.dumps(relation_to_json(relation)) + "\n")
+        counts["entities"] += len(page.entities)
+        counts["relations"] += len(page.relations)
+        logger.info(f"Exported {counts['entities']} entities and {counts['relations']} relations")
+    return counts
+
+
+class ImportCheckpoint:
+    """Records the chunks of an import that were written to Neptune.
+
+    The checkpoint is rewritten atomically after every chunk, so it always
+    reflects chunks that are fully written even if the import is killed.
+    Chunks are identified by their index in the file, so an import can only
+    be resumed with the chunk size it was started with.
+
+    Attributes:
+        path (str): Path of the checkpoint file
+        chunk_size (int): Number of records per chunk
+        completed (Dict[str, Set[int]]): Indexes of the completed chunks, per record type
+    """
+
+    def __init__(self, path: str, chunk_size: int):
+        """Initialize the ImportCheckpoint, loading the progress of a previous run if any.
+
+        Args:
+            path (str): Path of the checkpoint file
+            chunk_size (int): Number of records per chunk
+
+        Raises:
+            ValueError: If the previous run used a different chunk size
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.completed: Dict[str, Set[int]] = {"entity": set(), "relation": set()}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            if state["chunk_size"] != chunk_size:
+                raise ValueError(
+                    f"Checkpoint {path} was written with a chunk size of {state['chunk_size']}, not {chunk_size}"
+                )
+            for kind, chunks in state["completed"].items():
+                self.completed[kind] = set(chunks)
+
+    def is_done(self, kind: str, chunk: int) -> bool:
+        """Check whether a chunk was already written.
+
+        Args:
+            kind (str): Record type of the chunk, entity or relation
+            chunk (int): Index of the chunk
+
+        Returns:
+            bool: True if the chunk can be skipped
+        """
+        return chunk in self.completed[kind]
+
+    def done(self, kind: str, chunk: int):
+        """Record that a chunk was written.
+
+        Args:
+            kind (str): Record type of the chunk, entity or relation
+            chunk (int): Index of the chunk
+        """
+        with self._lock:
+            self.completed[kind].add(chunk)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(
+                    {
+                        "chunk_size": self.chunk_size,
+                        "completed": {name: sorted(chunks) for name, chunks in self.completed.items()},
+                    },
+                    f,
+                )
+            os.replace(tmp, self.path)
+
+    def remove(self):
+        """Delete the checkpoint once the import completed."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def read_chunks(path: str, kind: str, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Read the records of one type from a JSONL file in chunks.
+
+    Args:
+        path (str): Path of the JSONL file
+        kind (str): Record type to read, entity or relation
+        chunk_size (int): Number of records per chunk
+
+    Yields:
+        List[Dict[str, Any]]: The next chunk of records
+    """
+    chunk = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if record.get("type") != kind:
+                continue
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_memory(
+    memory: KnowledgeGraphManager,
+    path: str,
+    namespace: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = DEFAULT_WORKERS,
+    checkpoint: Optional[ImportCheckpoint] = None,
+    retries: int = 3,
+) -> Dict[str, int]:
+    """Load a JSONL memory graph into a namespace.
+
+    Entities are loaded first and relations second, so relations can refer to
+    entities anywhere in the file. Each pass reads the file lazily and keeps at
+    most two chunks per worker in flight. Writes are idempotent merges, so chunks
+    failing with a transient error, such as a concurrent modification, are
+    retried and re-running an import is harmless.
+
+    Args:
+        memory (KnowledgeGraphManager): Manager of the graph to load into
+        path (str): Path of the JSONL file
+        namespace (str, optional): Namespace to load into. Defaults to the manager's namespace.
+        chunk_size (int, optional): Number of records written per transaction. Defaults to DEFAULT_CHUNK_SIZE.
+        workers (int, optional): Number of chunks written in parallel. Defaults to DEFAULT_WORKERS.
+        checkpoint (ImportCheckpoint, optional): Progress of the import, chunks it lists are skipped
+        retries (int, optional): Number of times a failing chunk is retried. Defaults to 3.
+
+    Returns:
+        Dict[str, int]: Number of entities and relations loaded by this run
+    """
+    def write_entities(records: List[Dict[str, Any]]):
+        memory.create_entities(
+            [
+                Entity(name=r["name"], type=r.get("entityType"), observations=r.get("observations") or [])
+                for r in records
+            ],
+            namespace,
+        )
+
+    def write_relations(records: List[Dict[str, Any]]):
+        memory.create_relations(
+            [Relation(source=r["from"], target=r["to"], relationType=r["relationType"]) for r in records],
+            namespace,
+        )
+
+    counts = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for kind, writer, label in (("entity", write_entities, "entities"), ("relation", write_relations, "relations")):
+            counts[label] = _import_chunks(
+                executor, read_chunks(path, kind, chunk_size), kind, writer, workers * 2, checkpoint, retries
+            )
+            logger.info(f"Imported {counts[label]} {label}")
+    memory.flush()
+    return counts
+
+
+def _import_chunks(
+    executor: ThreadPoolExecutor,
+    chunks: Iterator[List[Dict[str, Any]]],
+    kind: str,
+    writer: Callable[[List[Dict[str, Any]]], None],
+    max_in_flight: int,
+    checkpoint: Optional[ImportCheckpoint],
+    retries: int,
+) -> int:
+    """Write chunks of records in parallel.
+
+    Args:
+        executor (ThreadPoolExecutor): Executor running the writes
+        chunks (Iterator[List[Dict[str, Any]]]): The chunks to write
+        kind (str): Record type of the chunks, entity or relation
+        writer (Callable[[List[Dict[str, Any]]], None]): Function writing a chunk
+        max_in_flight (int): Maximum number of chunks submitted but not written yet
+        checkpoint (ImportCheckpoint, optional): Progress of the import
+        retries (int): Number of times a failing chunk is retried
+
+    Returns:
+        int: Number of records written
+    """
+    def write(index: int, records: List[Dict[str, Any]]) -> int:
+        for attempt in range(retries + 1):
+            try:
+                writer(records)
+                break
+            except Exception as e:
+                if attempt == retries:
+                    raise
+                logger.warning(f"Writing {kind} chunk {index} failed, retrying: {e}")
+                time.sleep(2 ** attempt)
+        if checkpoint is not None:
+            checkpoint.done(kind, index)
+        return len(records)
+
+    written = 0
+    in_flight: Set[Future] = set()
+    for index, records in enumerate(chunks):
+        if checkpoint is not None and checkpoint.is_done(kind, index):
+            continue
+        if len(in_flight) >= max_in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            written += sum(future.result() for future in finished)
+        in_flight.add(executor.submit(write, index, records))
+    written += sum(future.result() for future in wait(in_flight).done)
+    return written
+
+
+def _connect(endpoint: Optional[str], parser: argparse.ArgumentParser) -> NeptuneServer:
+    """Connect to the Neptune endpoint given on the command line.
+
+    Args:
+        endpoint (str, optional): Neptune endpoint
+        parser (argparse.ArgumentParser): Parser used to report a missing endpoint
+
+    Returns:
+        NeptuneServer: The Neptune client
+    """
+    if endpoint is None:
+        parser.error('--endpoint or the NEPTUNE_MEMORY_ENDPOINT environment variable must be set')
+    use_https = os.environ.get('NEPTUNE_MEMORY_USE_HTTPS', 'True').lower() in ('true', '1', 't')
+    return NeptuneServer(endpoint, use_https=use_https)
+
+
+def export_main():
+    """Export the memory graph stored in the configured Neptune endpoint as JSONL.
+
+    Command line arguments:
+        --endpoint: Neptune endpoint (defaults to the NEPTUNE_MEMORY_ENDPOINT environment variable)
+        --namespace: Namespace to export (default: NEPTUNE_MEMORY_NAMESPACE or default)
+        --output: File to write, - for the standard output (default: -)
+        --page-size: Number of entities read per round trip (default: 1000)
+    """
+    parser = argparse.ArgumentParser(description='Export a Neptune memory graph as JSONL')
+    parser.add_argument('--endpoint', default=os.environ.get('NEPTUNE_MEMORY_ENDPOINT'), help='Neptune endpoint')
+    parser.add_argument(
+        '--namespace', default=os.environ.get('NEPTUNE_MEMORY_NAMESPACE', DEFAULT_NAMESPACE), help='Namespace to export'
+    )
+    parser.add_argument('--output', default='-', help='File to write, - for the standard output')
+    parser.add_argument('--page-size', type=int, default=MAX_PAGE_SIZE, help='Entities read per round trip')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    memory = KnowledgeGraphManager(_connect(args.endpoint, parser), logger, namespace=args.namespace)
+    if args.output == '-':
+        counts = export_memory(memory, sys.stdout, page_size=args.page_size)
+    else:
+        with open(args.output, 'w') as output:
+            counts = export_memory(memory, output, page_size=args.page_size)
+    logger.info(f'Export complete, {counts["entities"]} entities and {counts["relations"]} relations')
+
+
+def import_main():
+    """Import a JSONL memory graph into the configured Neptune endpoint.
+
+    Command line arguments:
+        input: JSONL file to import
+        --endpoint: Neptune endpoint (defaults to the NEPTUNE_MEMORY_ENDPOINT environment variable)
+        --namespace: Namespace to import into (default: NEPTUNE_MEMORY_NAMESPACE or default)
+        --chunk-size: Number of records written per transaction (default: 1000)
+        --workers: Number of chunks written in parallel (default: 8)
+        --checkpoint: Progress file used to resume an interrupted import (default: <input>.checkpoint)
+    """
+    parser = argparse.ArgumentParser(description='Import a JSONL memory graph into Neptune')
+    parser.add_argument('input', help='JSONL file to import')
+    parser.add_argument('--endpoint', default=os.environ.get('NEPTUNE_MEMORY_ENDPOINT'), help='Neptune endpoint')
+    parser.add_argument(
+        '--namespace',
+        default=os.environ.get('NEPTUNE_MEMORY_NAMESPACE', DEFAULT_NAMESPACE),
+        help='Namespace to import into',
+    )
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Records written per transaction')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Chunks written in parallel')
+    parser.add_argument('--checkpoint', help='Progress file used to resume an interrupted import')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    memory = KnowledgeGraphManager(_connect(args.endpoint, parser), logger, namespace=args.namespace)
+    try:
+        checkpoint = ImportCheckpoint(args.checkpoint or args.input + '.checkpoint', args.chunk_size)
+    except ValueError as e:
+        parser.error(str(e))
+    counts = import_memory(memory, args.input, chunk_size=args.chunk_size, workers=args.workers, checkpoint=checkpoint)
+    checkpoint.remove()
+    logger.info(f'Import complete, {counts["entities"]} entities and {counts["relations"]} relations')
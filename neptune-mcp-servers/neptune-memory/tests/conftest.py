@@ -0,0 +1,30 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Shared test fixtures for the Neptune memory server tests."""
+
+import logging
+import pytest
+from neptune_memory_mcp_server.memory import KnowledgeGraphManager
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def make_manager():
+    """Create KnowledgeGraphManagers whose _query is a mock returning no rows."""
+
+    def make(**kwargs) -> KnowledgeGraphManager:
+        memory = KnowledgeGraphManager(MagicMock(), logging.getLogger('test'), **kwargs)
+        memory._query = MagicMock(return_value=[])
+        return memory
+
+    return make
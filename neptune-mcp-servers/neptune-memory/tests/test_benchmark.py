@@ -0,0 +1,169 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for the memory server benchmark, run against the in-memory stand-in."""
+
+import json
+import pytest
+from neptune_memory_benchmark import cli
+from neptune_memory_benchmark.backends import InMemoryKnowledgeGraph, create_backend
+from neptune_memory_benchmark.runner import replay, summarize
+from neptune_memory_benchmark.workload import (
+    MAX_READ_PAGES,
+    generate_entities,
+    generate_relations,
+    load_synthetic_graph,
+    synthetic_trace,
+)
+from typing import List
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    """Record the backends created by the command line entry point."""
+    created: List[InMemoryKnowledgeGraph] = []
+
+    def create(*args, **kwargs):
+        backend = create_backend(*args, **kwargs)
+        created.append(backend)
+        return backend
+
+    monkeypatch.setattr(cli, 'create_backend', create)
+    return created
+
+
+class TestWorkload:
+    """Tests for the synthetic graphs and workloads."""
+
+    def test_graphs_are_deterministic_for_a_seed(self):
+        """The same seed generates the same entities and relations."""
+        entities = list(generate_entities(20, seed=1))
+        relations = list(generate_relations(20, seed=1))
+        assert list(generate_entities(20, seed=1)) == entities
+        assert list(generate_relations(20, seed=1)) == relations
+        assert list(generate_entities(20, seed=2)) != entities
+
+    def test_traces_are_deterministic_for_a_seed(self):
+        """The same seed generates the same tool calls, another seed different ones."""
+        assert synthetic_trace(200, 50, seed=3) == synthetic_trace(200, 50, seed=3)
+        assert synthetic_trace(200, 50, seed=3) != synthetic_trace(200, 50, seed=4)
+
+    def test_read_memory_calls_read_a_bounded_number_of_pages(self):
+        """Synthetic read_memory calls follow the cursor through 1 to MAX_READ_PAGES pages."""
+        trace = synthetic_trace(2000, 5000, mix={'read_memory': 1.0})
+        pages = {call.arguments['pages'] for call in trace}
+        assert min(pages) == 1
+        assert max(pages) == MAX_READ_PAGES
+
+
+class TestInMemoryKnowledgeGraph:
+    """Tests for the in-memory stand-in backend."""
+
+    def test_workload_runs_without_errors(self):
+        """A synthetic workload replayed against a synthetic graph succeeds."""
+        backend = InMemoryKnowledgeGraph(namespace='benchmark-100')
+        load_synthetic_graph(backend, 100, degree=2, observations=2, chunk_size=30)
+
+        duration, latencies, errors = replay(
+            backend, synthetic_trace(300, 100), concurrency=4
+        )
+
+        result = summarize(
+            'memory', duration, latencies, errors, concurrency=4, entities=100
+        )
+        assert result.calls == 300
+        assert sum(errors.values()) == 0
+
+    def test_pages_cover_every_entity_once(self):
+        """Following the cursor reads each entity of the namespace exactly once."""
+        backend = InMemoryKnowledgeGraph()
+        load_synthetic_graph(backend, 25, degree=1, chunk_size=10)
+
+        names = []
+        cursor = None
+        while True:
+            page = backend.read_graph_page(cursor, page_size=10)
+            names += [entity.name for entity in page.entities]
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert sorted(names) == sorted(entity.name for entity in generate_entities(25))
+
+    def test_delete_namespace_leaves_other_namespaces(self):
+        """Deleting a namespace removes its entities only."""
+        backend = InMemoryKnowledgeGraph(namespace='a')
+        load_synthetic_graph(backend, 10)
+        backend.create_entities(list(generate_entities(3)), 'b')
+
+        assert backend.delete_namespace('a') == 10
+
+        assert backend.read_graph_page(namespace='a').entities == []
+        assert len(backend.read_graph_page(namespace='b').entities) == 3
+
+
+class TestCli:
+    """Tests for the neptune-memory-benchmark entry point."""
+
+    def test_benchmark_namespaces_are_deleted_after_each_run(
+        self, monkeypatch, capsys, backends
+    ):
+        """Each synthetic graph is loaded into its own namespace, deleted after its run."""
+        monkeypatch.setattr(
+            'sys.argv',
+            [
+                'neptune-memory-benchmark',
+                '--entities',
+                '20',
+                '40',
+                '--calls',
+                '50',
+                '--json',
+            ],
+        )
+
+        cli.main()
+
+        results = json.loads(capsys.readouterr().out)
+        assert [result['entities'] for result in results] == [20, 40]
+        assert [backend.namespace for backend in backends] == [
+            'benchmark-20',
+            'benchmark-40',
+        ]
+        assert all(backend.read_graph_page().entities == [] for backend in backends)
+
+    def test_namespaces_are_deleted_when_a_run_fails(self, monkeypatch, backends):
+        """A failing run still deletes the namespace it loaded."""
+        monkeypatch.setattr(
+            'sys.argv',
+            ['neptune-memory-benchmark', '--entities', '20', '--calls', '10'],
+        )
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('replay failed')
+
+        monkeypatch.setattr(cli, 'replay', fail)
+        with pytest.raises(RuntimeError):
+            cli.main()
+
+        assert backends[0].read_graph_page().entities == []
+
+    def test_keep_leaves_the_namespaces(self, monkeypatch, capsys, backends):
+        """With --keep the synthetic graph stays in the namespace."""
+        monkeypatch.setattr(
+            'sys.argv',
+            ['neptune-memory-benchmark', '--entities', '20', '--calls', '10', '--keep'],
+        )
+
+        cli.main()
+
+        assert len(backends[0].read_graph_page().entities) >= 20
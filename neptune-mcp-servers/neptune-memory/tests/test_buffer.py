@@ -0,0 +1,126 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for the write-behind buffer."""
+
+import pytest
+from neptune_memory_mcp_server.buffer import PendingWrites, WriteBuffer
+from neptune_memory_mcp_server.models import Entity, Observation, Relation
+from typing import List
+
+
+def make_buffer(max_size: int = 100):
+    """Create a WriteBuffer collecting its flushed batches in a list."""
+    batches: List[PendingWrites] = []
+    return WriteBuffer(batches.append, max_size), batches
+
+
+class TestWriteBuffer:
+    """Tests for WriteBuffer."""
+
+    def test_entities_are_merged_by_namespace_and_name(self):
+        """The latest type wins and observations are concatenated without duplicates."""
+        buffer, batches = make_buffer()
+        buffer.add_entities(
+            [Entity(name='a', type='person', observations=['x'], namespace='n')]
+        )
+        buffer.add_entities(
+            [Entity(name='a', type='user', observations=['x', 'y'], namespace='n')]
+        )
+        buffer.add_entities(
+            [Entity(name='a', type='person', observations=[], namespace='other')]
+        )
+
+        assert buffer.flush() == 3
+        entities = batches[0].entities
+        assert entities[('n', 'a')].type == 'user'
+        assert entities[('n', 'a')].observations == ['x', 'y']
+        assert ('other', 'a') in entities
+
+    def test_observations_of_a_pending_entity_are_folded_into_it(self):
+        """Observations of an entity that is still pending are added to it."""
+        buffer, batches = make_buffer()
+        buffer.add_entities(
+            [Entity(name='a', type='t', observations=['x'], namespace='n')]
+        )
+        buffer.add_observations(
+            [Observation(entityName='a', contents=['y'], namespace='n')]
+        )
+        buffer.add_observations(
+            [Observation(entityName='b', contents=['z'], namespace='n')]
+        )
+
+        buffer.flush()
+
+        assert batches[0].entities[('n', 'a')].observations == ['x', 'y']
+        assert batches[0].observations == {('n', 'b'): ['z']}
+
+    def test_relations_are_merged_by_source_and_target(self):
+        """The latest relation type between two entities wins."""
+        buffer, batches = make_buffer()
+        buffer.add_relations(
+            [Relation(source='a', target='b', relationType='knows', namespace='n')]
+        )
+        buffer.add_relations(
+            [Relation(source='a', target='b', relationType='likes', namespace='n')]
+        )
+
+        buffer.flush()
+
+        assert list(batches[0].relations.values())[0].relationType == 'likes'
+
+    def test_reaching_max_size_flushes(self):
+        """The buffer is flushed as soon as it holds max_size mutations."""
+        buffer, batches = make_buffer(max_size=2)
+        buffer.add_entities(
+            [Entity(name='a', type='t', observations=[], namespace='n')]
+        )
+        assert batches == []
+
+        buffer.add_entities(
+            [Entity(name='b', type='t', observations=[], namespace='n')]
+        )
+
+        assert len(batches) == 1
+        assert buffer.pending_count() == 0
+
+    def test_failed_flush_restores_the_batch(self):
+        """A batch that fails to be written is retried with the mutations received since."""
+        written = []
+
+        def writer(batch: PendingWrites):
+            if not written:
+                written.append(None)
+                raise ConnectionError('Neptune unavailable')
+            written.append(batch)
+
+        buffer = WriteBuffer(writer, 100)
+        buffer.add_entities(
+            [Entity(name='a', type='t', observations=['x'], namespace='n')]
+        )
+        with pytest.raises(ConnectionError):
+            buffer.flush()
+        assert buffer.pending_count() == 1
+
+        buffer.add_observations(
+            [Observation(entityName='a', contents=['y'], namespace='n')]
+        )
+        assert buffer.flush() == 2
+
+        assert written[1].entities[('n', 'a')].observations == ['x', 'y']
+        assert buffer.pending_count() == 0
+
+    def test_empty_flush_does_not_write(self):
+        """Flushing an empty buffer does not call the writer."""
+        buffer, batches = make_buffer()
+        assert buffer.flush() == 0
+        assert batches == []
@@ -0,0 +1,100 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for the read-through entity cache."""
+
+from neptune_memory_mcp_server.cache import EntityCache, _estimate_size
+from neptune_memory_mcp_server.models import Entity, KnowledgeGraph, Relation
+
+
+def entity(name: str, namespace: str = 'n') -> Entity:
+    """Create an entity with a single observation of 50 characters."""
+    return Entity(name=name, type='t', observations=['o' * 50], namespace=namespace)
+
+
+class TestEntityCache:
+    """Tests for EntityCache."""
+
+    def test_least_recently_used_entries_are_evicted_beyond_the_byte_budget(self):
+        """Entries are evicted in least recently used order once the budget is exceeded."""
+        size = _estimate_size((entity('a'), []))
+        cache = EntityCache(max_bytes=size * 2)
+        generation = cache.generation('n')
+        cache.put_entity(entity('a'), [], generation)
+        cache.put_entity(entity('b'), [], generation)
+        assert cache.get_entity('n', 'a') is not None
+
+        cache.put_entity(entity('c'), [], generation)
+
+        assert cache.get_entity('n', 'b') is None
+        assert cache.get_entity('n', 'a') is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.entries == 2
+        assert stats.bytes <= stats.max_bytes
+
+    def test_values_larger_than_the_budget_are_not_cached(self):
+        """A value that can never fit the budget is not cached."""
+        cache = EntityCache(max_bytes=10)
+        cache.put_entity(entity('a'), [], cache.generation('n'))
+        assert cache.stats().entries == 0
+
+    def test_invalidate_drops_the_entities_and_searches_of_the_namespace(self):
+        """Invalidation drops the written entities and every search of their namespace."""
+        cache = EntityCache(max_bytes=1 << 20)
+        relation = Relation(source='a', target='b', relationType='knows', namespace='n')
+        cache.put_entity(entity('a'), [relation], cache.generation('n'))
+        cache.put_entity(entity('b'), [relation], cache.generation('n'))
+        cache.put_entity(entity('a', 'other'), [], cache.generation('other'))
+        cache.put_search(
+            'n',
+            'a',
+            KnowledgeGraph(entities=[entity('a')], relations=[]),
+            cache.generation('n'),
+        )
+
+        cache.invalidate('n', ['a'])
+
+        assert cache.get_entity('n', 'a') is None
+        assert cache.get_search('n', 'a') is None
+        assert cache.get_entity('n', 'b') is not None
+        assert cache.get_entity('other', 'a') is not None
+
+    def test_fills_started_before_a_write_are_skipped(self):
+        """A value read before a write to its namespace must not be cached after it."""
+        cache = EntityCache(max_bytes=1 << 20)
+        generation = cache.generation('n')
+        cache.invalidate('n', ['a'])
+
+        cache.put_entity(entity('a'), [], generation)
+        cache.put_search(
+            'n', 'a', KnowledgeGraph(entities=[], relations=[]), generation
+        )
+
+        assert cache.get_entity('n', 'a') is None
+        assert cache.get_search('n', 'a') is None
+
+    def test_clear_changes_every_generation(self):
+        """Fills started before a clear are skipped."""
+        cache = EntityCache(max_bytes=1 << 20)
+        generation = cache.generation('n')
+        cache.clear()
+        cache.put_entity(entity('a'), [], generation)
+        assert cache.get_entity('n', 'a') is None
+
+    def test_hit_rate(self):
+        """The hit rate is the share of lookups served from the cache."""
+        cache = EntityCache(max_bytes=1 << 20)
+        cache.put_entity(entity('a'), [], cache.generation('n'))
+        cache.get_entity('n', 'a')
+        cache.get_entity('n', 'b')
+        assert cache.stats().hit_rate == 0.5
@@ -0,0 +1,115 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for the retention policy and the memory compactor."""
+
+from neptune_memory_mcp_server.compaction import MemoryCompactor, RetentionPolicy
+
+
+class TestRetentionPolicy:
+    """Tests for RetentionPolicy."""
+
+    def test_disabled_without_ttl_or_half_life(self):
+        """Without a TTL or a half-life nothing expires."""
+        assert not RetentionPolicy().is_enabled()
+        assert RetentionPolicy(ttl=60).is_enabled()
+        assert RetentionPolicy(half_life=60).is_enabled()
+
+    def test_ttl_expires_entities_not_accessed_for_longer(self):
+        """Entities expire once their last access is older than the TTL."""
+        policy = RetentionPolicy(ttl=100)
+        assert not policy.is_expired(1000, 0, 1100)
+        assert policy.is_expired(1000, 50, 1101)
+
+    def test_score_halves_every_half_life(self):
+        """The access score decays by half every half-life."""
+        policy = RetentionPolicy(half_life=100)
+        assert policy.score(1000, 3, 1000) == 4
+        assert policy.score(1000, 3, 1100) == 2
+        assert policy.score(1000, 3, 1200) == 1
+
+    def test_frequently_accessed_entities_decay_below_min_score_later(self):
+        """Frequently accessed entities are kept longer than rarely accessed ones."""
+        policy = RetentionPolicy(half_life=100, min_score=1)
+        assert policy.is_expired(1000, 0, 1101)
+        assert not policy.is_expired(1000, 3, 1101)
+        assert policy.is_expired(1000, 3, 1201)
+
+
+class TestMemoryCompactor:
+    """Tests for MemoryCompactor."""
+
+    def test_duplicates_keep_the_first_observation_of_each_entity(self):
+        """Observations with the same normalized content are duplicates of the first one."""
+        observations = [
+            {'entity': 'e1', 'id': '3', 'content': 'Likes  TEA'},
+            {'entity': 'e1', 'id': '1', 'content': 'likes tea'},
+            {'entity': 'e1', 'id': '2', 'content': 'likes coffee'},
+            {'entity': 'e2', 'id': '4', 'content': 'likes tea'},
+            {'entity': 'e2', 'id': '5', 'content': None},
+            {'entity': 'e2', 'id': '6', 'content': ''},
+        ]
+        assert MemoryCompactor._duplicates(observations) == ['3', '6']
+
+    def test_run_deletes_expired_entities_and_stamps_legacy_ones(self, make_manager):
+        """Entities without access metadata are stamped once and never expire unstamped."""
+        memory = make_manager()
+
+        def query(query, parameters=None):
+            if 'RETURN id(e) as id, e.last_accessed_at' in query:
+                return [
+                    {'id': '1', 'last_accessed_at': 0.0, 'access_count': 0},
+                    {'id': '2', 'last_accessed_at': None, 'access_count': 0},
+                ]
+            if 'DETACH DELETE' in query:
+                return [{'deleted': len(parameters['ids'])}]
+            if 'SET e.last_accessed_at' in query:
+                return [{'stamped': len(parameters['ids'])}]
+            return []
+
+        memory._query.side_effect = query
+        compactor = MemoryCompactor(
+            memory, RetentionPolicy(ttl=60), interval=0, batch_size=10
+        )
+
+        result = compactor.run_once()
+
+        assert result.entities_scanned == 2
+        assert result.entities_deleted == 1
+        assert result.observations_merged == 0
+        calls = [(c.args[0], c.args[1]) for c in memory._query.call_args_list]
+        assert [p['ids'] for q, p in calls if 'SET e.last_accessed_at' in q] == [['2']]
+        assert [p['ids'] for q, p in calls if 'DETACH DELETE' in q] == [['1']]
+        assert not any('o.content as content' in q for q, _ in calls)
+
+    def test_duplicate_merging_is_opt_in(self, make_manager):
+        """Duplicate observations are merged when merge_duplicates is set."""
+        memory = make_manager()
+
+        def query(query, parameters=None):
+            if 'RETURN id(e) as id, e.last_accessed_at' in query:
+                return [{'id': '1', 'last_accessed_at': 1e12, 'access_count': 0}]
+            if 'MATCH (o:Observation)' in query:
+                return [{'deleted': len(parameters['ids'])}]
+            if 'has_observation' in query:
+                return [
+                    {'entity': '1', 'id': 'a', 'content': 'x'},
+                    {'entity': '1', 'id': 'b', 'content': 'X'},
+                ]
+            return []
+
+        memory._query.side_effect = query
+        compactor = MemoryCompactor(
+            memory, RetentionPolicy(), interval=0, merge_duplicates=True
+        )
+
+        assert compactor.run_once().observations_merged == 1
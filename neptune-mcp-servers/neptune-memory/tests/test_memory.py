@@ -0,0 +1,157 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for the KnowledgeGraphManager, with Neptune replaced by a mocked _query."""
+
+import hashlib
+from neptune_memory_mcp_server.memory import (
+    TOUCH_INTERVAL,
+    observation_id,
+    observation_rows,
+)
+from neptune_memory_mcp_server.models import Entity
+from unittest.mock import patch
+
+
+class TestObservationRows:
+    """Tests for observation_rows and observation_id."""
+
+    def test_ids_are_derived_from_namespace_entity_and_content(self):
+        """The same observation gets the same id, a different entity or namespace another one."""
+        rows = observation_rows('alice', 'Bob', ['likes tea'])
+        oid = observation_id('alice', 'Bob', 'likes tea')
+        assert rows[0]['id'] == oid
+        assert observation_id('alice', 'Carol', 'likes tea') != oid
+        assert observation_id('carol', 'Bob', 'likes tea') != oid
+        assert rows[0]['content'] == 'likes tea'
+        assert len(rows[0]['hash']) == 64
+
+    def test_default_namespace_ids_omit_the_namespace(self):
+        """Observations written before namespaces existed keep their id."""
+        digest = hashlib.sha256('Bob\nlikes tea'.encode('utf-8')).hexdigest()
+        assert observation_id('default', 'Bob', 'likes tea') == 'observation:' + digest
+        assert observation_id('alice', 'Bob', 'likes tea') != 'observation:' + digest
+
+    def test_duplicate_contents_are_dropped_in_order(self):
+        """Repeated contents are written once, in their first position."""
+        rows = observation_rows('default', 'Bob', ['b', 'a', 'b'])
+        assert [row['content'] for row in rows] == ['b', 'a']
+
+
+class TestReadGraphPage:
+    """Tests for KnowledgeGraphManager.read_graph_page."""
+
+    def test_full_page_returns_the_last_id_as_cursor(self, make_manager):
+        """A full page returns its entities, their relations and the cursor of the next page."""
+        memory = make_manager()
+        memory._query.side_effect = [
+            [
+                {'id': '1', 'name': 'a', 'type': 't', 'observations': []},
+                {'id': '2', 'name': 'b', 'type': 't', 'observations': ['x', 'y']},
+            ],
+            [{'source': 'a', 'target': 'b', 'relationType': 'knows'}],
+        ]
+
+        page = memory.read_graph_page(page_size=2)
+
+        assert [entity.name for entity in page.entities] == ['a', 'b']
+        assert page.entities[1].observations == ['x', 'y']
+        assert [(r.source, r.target) for r in page.relations] == [('a', 'b')]
+        assert page.next_cursor == '2'
+        assert memory._query.call_args_list[1].args[1] == {'ids': ['1', '2']}
+
+    def test_cursor_starts_the_page_after_it(self, make_manager):
+        """The cursor is passed to the query and a short page has no next cursor."""
+        memory = make_manager()
+        memory._query.side_effect = [
+            [{'id': '3', 'name': 'c', 'type': 't', 'observations': []}],
+            [],
+        ]
+
+        page = memory.read_graph_page('2', page_size=2)
+
+        query, parameters = memory._query.call_args_list[0].args
+        assert 'id(e) > $cursor' in query
+        assert parameters['cursor'] == '2'
+        assert page.next_cursor is None
+
+    def test_empty_page_ends_the_iteration(self, make_manager):
+        """An empty page does not query the relations."""
+        memory = make_manager()
+
+        page = memory.read_graph_page('9')
+
+        assert page.entities == [] and page.relations == [] and page.next_cursor is None
+        assert memory._query.call_count == 1
+
+
+class TestAccessTracking:
+    """Tests for the access metadata of entities."""
+
+    def test_reads_write_accesses_at_most_once_per_interval(self, make_manager):
+        """Repeated uncached reads of an entity should not each cost a write."""
+        memory = make_manager()
+        memory._query.side_effect = lambda query, parameters=None: (
+            [{'name': 'a', 'type': 't', 'observations': []}]
+            if 'collect(o.content)' in query
+            else []
+        )
+
+        with patch('neptune_memory_mcp_server.memory.time.time', return_value=1000.0):
+            memory.find_nodes(['a'])
+            memory.find_nodes(['a'])
+        writes = [c for c in memory._query.call_args_list if 'SET' in c.args[0]]
+        assert len(writes) == 1
+        assert writes[0].args[1]['names'] == ['a']
+
+        with patch(
+            'neptune_memory_mcp_server.memory.time.time',
+            return_value=1000.0 + TOUCH_INTERVAL,
+        ):
+            memory.find_nodes(['a'])
+        assert len([c for c in memory._query.call_args_list if 'SET' in c.args[0]]) == 2
+
+    def test_read_access_page_does_not_write(self, make_manager):
+        """Scanning the access metadata does not update it."""
+        memory = make_manager()
+
+        memory.read_access_page()
+
+        assert 'SET' not in memory._query.call_args.args[0]
+
+    def test_delete_entities_returns_the_count_of_the_query(self, make_manager):
+        """The deleted count is the one returned by Neptune."""
+        memory = make_manager()
+        memory._query.return_value = [{'deleted': 1}]
+
+        assert memory.delete_entities(['1', '2']) == 1
+        memory._query.return_value = []
+        assert memory.delete_entities(['3']) == 0
+
+
+class TestCachedReads:
+    """Tests for reads through the entity cache."""
+
+    def test_search_racing_with_a_write_is_not_cached(self, make_manager):
+        """A search whose namespace is written while it runs should not fill the cache."""
+        memory = make_manager(cache_bytes=1 << 20)
+
+        def query(query, parameters=None):
+            if 'CONTAINS' in query:
+                # A write lands while the search is running
+                memory.create_entities([Entity(name='b', type='t', observations=[])])
+            return []
+
+        memory._query.side_effect = query
+        memory.search_nodes('a')
+
+        assert memory.cache.get_search('default', 'a') is None
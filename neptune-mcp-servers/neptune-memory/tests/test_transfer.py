@@ -0,0 +1,80 @@
+#
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# or in the 'license' file accompanying this file. This file is distributed on an 'AS IS' BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions
+# and limitations under the License.
+#
+"""Tests for resumable JSONL imports."""
+
+import json
+import pytest
+from neptune_memory_mcp_server.transfer import ImportCheckpoint, import_memory
+from unittest.mock import MagicMock
+
+
+@pytest.fixture
+def jsonl(tmp_path):
+    """Write a JSONL export of five entities and one relation."""
+    path = tmp_path / 'memory.jsonl'
+    records = [
+        {'type': 'entity', 'name': f'e{i}', 'entityType': 't', 'observations': []}
+        for i in range(5)
+    ]
+    records.append(
+        {'type': 'relation', 'from': 'e0', 'to': 'e1', 'relationType': 'knows'}
+    )
+    path.write_text('\n'.join(json.dumps(record) for record in records) + '\n')
+    return str(path)
+
+
+class TestImportCheckpoint:
+    """Tests for ImportCheckpoint and resumed imports."""
+
+    def test_completed_chunks_survive_a_restart(self, tmp_path):
+        """Completed chunks are read back from the checkpoint file."""
+        path = str(tmp_path / 'import.checkpoint')
+        checkpoint = ImportCheckpoint(path, chunk_size=2)
+        checkpoint.done('entity', 0)
+        checkpoint.done('entity', 2)
+
+        resumed = ImportCheckpoint(path, chunk_size=2)
+
+        assert resumed.is_done('entity', 0)
+        assert not resumed.is_done('entity', 1)
+        assert resumed.is_done('entity', 2)
+        assert not resumed.is_done('relation', 0)
+
+    def test_resuming_with_another_chunk_size_fails(self, tmp_path):
+        """A checkpoint cannot be resumed with a different chunk size."""
+        path = str(tmp_path / 'import.checkpoint')
+        ImportCheckpoint(path, chunk_size=2).done('entity', 0)
+
+        with pytest.raises(ValueError):
+            ImportCheckpoint(path, chunk_size=3)
+
+    def test_resumed_import_skips_completed_chunks(self, jsonl, tmp_path):
+        """Only the chunks missing from the checkpoint are written again."""
+        path = str(tmp_path / 'import.checkpoint')
+        ImportCheckpoint(path, chunk_size=2).done('entity', 0)
+        memory = MagicMock()
+
+        checkpoint = ImportCheckpoint(path, chunk_size=2)
+        counts = import_memory(
+            memory, jsonl, chunk_size=2, workers=1, checkpoint=checkpoint
+        )
+
+        written = sorted(
+            entity.name
+            for call in memory.create_entities.call_args_list
+            for entity in call.args[0]
+        )
+        assert written == ['e2', 'e3', 'e4']
+        assert memory.create_relations.call_count == 1
+        assert counts['relations'] == 1
+        assert all(checkpoint.is_done('entity', chunk) for chunk in range(3))
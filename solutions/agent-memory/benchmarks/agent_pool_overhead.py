@@ -0,0 +1,68 @@
+"""Micro-benchmark of the per-invocation setup cost of the sub-agent tools.
+
+Compares building a new Strands Agent on every tool call, as weather_agent and
+general_assistant did, with borrowing an agent from the AgentPool and
+resetting it afterwards. The model is not invoked, so only the setup is
+measured: the Bedrock client, the tool registry and the agent itself. On
+top of this, pooled agents reuse their open HTTPS connections to Bedrock.
+
+Usage:
+    uv run python benchmarks/agent_pool_overhead.py [--iterations 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Creating a Bedrock client needs a region, not credentials
+os.environ.setdefault("AWS_REGION", "us-east-1")
+
+from strands import Agent
+from strands_tools import http_request
+
+from tools.agent_pool import AgentPool
+from tools.general_assistant import GENERAL_ASSISTANT_SYSTEM_PROMPT
+from tools.weather_agent import WEATHER_SYSTEM_PROMPT
+
+
+def new_agent(system_prompt, tools):
+    Agent(system_prompt=system_prompt, tools=tools, callback_handler=None)
+
+
+def pooled_agent(pool):
+    def borrow(system_prompt, tools):
+        with pool.agent(system_prompt, tools) as agent:
+            agent.messages.append({"role": "user", "content": [{"text": "What's the weather in Seattle?"}]})
+    return borrow
+
+
+def measure(invoke, system_prompt, tools, iterations):
+    invoke(system_prompt, tools)  # Leave imports and first-time setup out of the measure
+    started = time.perf_counter()
+    for _ in range(iterations):
+        invoke(system_prompt, tools)
+    return (time.perf_counter() - started) / iterations * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-invocation setup cost of the sub-agent tools")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    pool = AgentPool(factory=lambda **kwargs: Agent(callback_handler=None, **kwargs))
+    print(f"{'sub-agent':<20}{'new agent ms':>14}{'pooled ms':>12}{'speedup':>10}")
+    for name, system_prompt, tools in [
+        ("weather_agent", WEATHER_SYSTEM_PROMPT, [http_request]),
+        ("general_assistant", GENERAL_ASSISTANT_SYSTEM_PROMPT, []),
+    ]:
+        before = measure(new_agent, system_prompt, tools, args.iterations)
+        after = measure(pooled_agent(pool), system_prompt, tools, args.iterations)
+        print(f"{name:<20}{before:>14.3f}{after:>12.3f}{before / after:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Micro-benchmark of the per-query overhead of GraphitiNeptuneDriver._run_query.
+
+Compares the former class-level patch of NeptuneDriver._run_query, which walked
+every parameter (including 1024-float embeddings) and ran a regex over the whole
+query text on every call, with GraphitiNeptuneDriver. Neptune is replaced by a client that returns at once, so
+only the client-side overhead is measured.
+
+Usage:
+    uv run python benchmarks/neptune_driver_overhead.py [--iterations 10000]
+"""
+
+import argparse
+import re
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from graphiti_core.driver.driver import GraphProvider
+from graphiti_core.driver.neptune_driver import NeptuneDriver
+from graphiti_core.models.edges.edge_db_queries import get_entity_edge_save_query
+from graphiti_core.models.nodes.node_db_queries import get_entity_node_save_query
+
+from frameworks.graphiti_neptune import GraphitiNeptuneDriver
+
+
+class NullClient:
+    def query(self, query, params=None):
+        return []
+
+
+def former_run_query(self, cypher_query_, params):
+    """The class-level patch of NeptuneDriver._run_query GraphitiNeptuneDriver replaces."""
+    if 'params' in params and isinstance(params['params'], dict):
+        nested = params.pop('params')
+        params.update(nested)
+
+    cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
+    if params:
+        referenced = set(re.findall(r'\$(\w+)', cypher_query_))
+        params = {k: v for k, v in params.items() if k in referenced and v is not None}
+    result = self.client.query(cypher_query_, params=params)
+    return result, None, None
+
+
+def workload():
+    """Query texts and parameter factories shaped like Graphiti's ingestion queries."""
+    now = datetime.now()
+    search_query = """
+        MATCH (n:Entity)
+        WHERE n.group_id IN $group_ids AND n.name CONTAINS $query
+        RETURN n.uuid AS uuid, n.name AS name, n.summary AS summary, n.created_at AS created_at
+        LIMIT $limit
+    """
+    lookup_query = """
+        MATCH (n:Entity {uuid: $uuid})
+        RETURN n.uuid AS uuid, n.name AS name, n.group_id AS group_id, n.created_at AS created_at
+    """
+    return [
+        ("lookup entity", lookup_query,
+         lambda: {"uuid": str(uuid.uuid4()), "group_id": None, "routing_": "r"}),
+        ("search entities", search_query,
+         lambda: {"params": {"group_ids": ["Alice"]}, "query": "tea", "limit": 10, "created_at": now}),
+        ("save entity", get_entity_node_save_query(GraphProvider.NEPTUNE, labels="Entity"),
+         lambda: {"entity_data": {"uuid": str(uuid.uuid4()), "name": "Alice", "group_id": "Alice",
+                                  "created_at": now, "name_embedding": [0.1] * 1024}}),
+        ("save edge", get_entity_edge_save_query(GraphProvider.NEPTUNE),
+         lambda: {"edge_data": {"uuid": str(uuid.uuid4()), "source_uuid": "a", "target_uuid": "b",
+                                "fact": "Alice likes tea", "created_at": now, "fact_embedding": [0.1] * 1024}}),
+    ]
+
+
+def measure(run_query, driver, query, make_params, iterations):
+    batches = [make_params() for _ in range(iterations)]
+    started = time.perf_counter()
+    for params in batches:
+        run_query(driver, query, params)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the per-query overhead of the Neptune driver")
+    parser.add_argument("--iterations", type=int, default=10000)
+    args = parser.parse_args()
+
+    # The former patch ran on NeptuneDriver, the new code on GraphitiNeptuneDriver
+    former = NeptuneDriver.__new__(NeptuneDriver)
+    former.client = NullClient()
+    driver = GraphitiNeptuneDriver.__new__(GraphitiNeptuneDriver)
+    driver.client = NullClient()
+
+    print(f"{'query':<18}{'before us':>12}{'after us':>12}{'speedup':>10}")
+    for name, query, make_params in workload():
+        before = measure(former_run_query, former, query, make_params, args.iterations)
+        after = measure(GraphitiNeptuneDriver._run_query, driver, query, make_params, args.iterations)
+        print(f"{name:<18}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
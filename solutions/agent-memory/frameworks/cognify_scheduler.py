@@ -0,0 +1,151 @@
+"""Debounced cognify scheduling for Cognee.
+
+cognee.remember() adds the data to a dataset and runs cognify, which builds
+the knowledge graph with LLM extraction, for every single message. The
+CognifyScheduler separates the two steps: data is added to the dataset right
+away, and cognify runs once for everything added to a dataset since the last
+run, either after a quiet period without new data or as soon as enough items
+have accumulated. A chatty conversation then costs a few graph builds instead
+of one per message. A scheduled cognify that fails is scheduled again with an
+exponential backoff. Data is only searchable once cognified, so listeners
+registered with on_cognified() are told when a run completes, e.g. to drop
+cached searches of the dataset. Searches that must see the latest data can
+flush the pending cognify of their dataset first, which defeats the batching
+when agents search right after adding, so it is off by default.
+
+All methods must run on the same event loop (the Cognee backend's loop).
+
+Configuration via environment variables (read by CogneeBackend):
+    COGNIFY_QUIET_PERIOD - Seconds without new data before a dataset is cognified (default: 5)
+    COGNIFY_MAX_PENDING - Added items that trigger a cognify right away (default: 20)
+    COGNIFY_BEFORE_SEARCH - Set to true to make searches flush the pending cognify first (default: false)
+"""
+
+import asyncio
+import functools
+import logging
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class _Dataset:
+    """Scheduling state of one dataset."""
+
+    def __init__(self):
+        self.pending = 0
+        self.failures = 0
+        self.timer: asyncio.TimerHandle | None = None
+        self.lock = asyncio.Lock()
+
+
+class CognifyScheduler:
+    """Runs one cognify per dataset for batches of added data.
+
+    Args:
+        quiet_period: Seconds without new data after which a dataset is cognified.
+        max_pending: Number of added items that triggers a cognify immediately.
+        retry_delay: Seconds before a failed scheduled cognify is retried, doubled after each failure.
+        max_retry_delay: Maximum seconds before a failed scheduled cognify is retried.
+    """
+
+    def __init__(
+        self,
+        quiet_period: float = 5.0,
+        max_pending: int = 20,
+        retry_delay: float = 5.0,
+        max_retry_delay: float = 300.0,
+    ):
+        self.quiet_period = quiet_period
+        self.max_pending = max_pending
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.runs = 0
+        self.items = 0
+        self._datasets: dict[str, _Dataset] = {}
+        self._listeners: list[Callable[[str], None]] = []
+
+    async def add(self, data: str | list[str], dataset: str):
+        """Add data to a dataset and schedule its cognify."""
+        import cognee
+
+        await cognee.add(data, dataset_name=dataset)
+        self.added(dataset, len(data) if isinstance(data, list) else 1)
+
+    def added(self, dataset: str, count: int = 1):
+        """Record data added to a dataset and (re)schedule its cognify."""
+        state = self._datasets.setdefault(dataset, _Dataset())
+        state.pending += count
+        self.items += count
+        if state.timer is not None:
+            state.timer.cancel()
+        delay = 0 if state.pending >= self.max_pending else self.quiet_period
+        state.timer = asyncio.get_running_loop().call_later(delay, self._start, dataset)
+
+    def on_cognified(self, callback: Callable[[str], None]):
+        """Call callback with the dataset name after each completed cognify run."""
+        self._listeners.append(callback)
+
+    def pending(self, dataset: str) -> int:
+        """Number of items of a dataset waiting for cognify."""
+        state = self._datasets.get(dataset)
+        return state.pending if state else 0
+
+    async def flush(self, dataset: str, **cognify_kwargs):
+        """Cognify the pending data of a dataset now, and wait for any cognify of it already running."""
+        import cognee
+
+        state = self._datasets.get(dataset)
+        if state is None:
+            return
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        # Runs of a dataset never overlap; a flush during a run waits for it
+        async with state.lock:
+            if state.pending == 0:
+                return
+            count, state.pending = state.pending, 0
+            try:
+                await cognee.cognify(datasets=[dataset], **cognify_kwargs)
+            except BaseException:
+                state.pending += count
+                raise
+            state.failures = 0
+            self.runs += 1
+            logger.info(f"Cognified {count} items of dataset {dataset}")
+            for callback in self._listeners:
+                try:
+                    callback(dataset)
+                except Exception as e:
+                    logger.warning(f"Cognify listener failed for dataset {dataset}: {e!r}")
+
+    async def flush_all(self):
+        """Cognify the pending data of every dataset."""
+        for dataset in list(self._datasets):
+            await self.flush(dataset)
+
+    def stats(self) -> dict:
+        """Report the items added, the cognify runs, and the items still pending."""
+        return {
+            "items": self.items,
+            "runs": self.runs,
+            "pending": sum(state.pending for state in self._datasets.values()),
+        }
+
+    def _start(self, dataset: str):
+        self._datasets[dataset].timer = None
+        task = asyncio.get_running_loop().create_task(self.flush(dataset))
+        task.add_done_callback(functools.partial(self._retry_failure, dataset))
+
+    def _retry_failure(self, dataset: str, task: asyncio.Task):
+        """Schedule a failed cognify again, backing off exponentially."""
+        if task.cancelled() or task.exception() is None:
+            return
+        state = self._datasets[dataset]
+        state.failures += 1
+        delay = min(self.retry_delay * 2 ** (state.failures - 1), self.max_retry_delay)
+        logger.error(f"Scheduled cognify of dataset {dataset} failed, retrying in {delay:.0f}s: {task.exception()!r}")
+        # Data added in the meantime has already scheduled a run
+        if state.timer is None and state.pending:
+            state.timer = asyncio.get_running_loop().call_later(delay, self._start, dataset)
@@ -0,0 +1,259 @@
+"""Content-addressed cache of text embeddings shared by the memory frameworks.
+
+Mem0, Cognee and Graphiti all embed text with Titan Text Embeddings V2, and
+keep embedding the same texts: repeated queries, re-ingested messages, and
+entity names that Graphiti re-embeds while deduplicating. An embedding only
+depends on the model, its settings and the text, so it is cached under
+(model, dimensions, normalize, sha256(text)).
+
+Recently used embeddings are kept in an in-memory LRU. Behind it, embeddings
+are stored on disk: the vectors of each dimension are float32 rows of a
+memory-mapped file, and a SQLite index maps each key to its row. The disk
+store survives restarts and can be shared by several processes.
+
+Configuration via environment variables:
+    EMBEDDING_CACHE - Set to false to disable the cache (default: true)
+    EMBEDDING_CACHE_DIR - Directory of the disk store (default: .embedding_cache)
+    EMBEDDING_CACHE_MEMORY_ENTRIES - Embeddings kept in memory (default: 10000)
+"""
+
+import hashlib
+import os
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    normalize INTEGER NOT NULL,
+    text_hash TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    PRIMARY KEY (model, dimensions, normalize, text_hash)
+);
+CREATE TABLE IF NOT EXISTS vector_files (
+    dimensions INTEGER PRIMARY KEY,
+    rows INTEGER NOT NULL
+);
+"""
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-level (memory LRU, then disk) cache of embeddings.
+
+    Args:
+        directory: Directory of the SQLite index and the vector files.
+        memory_entries: Number of embeddings kept in the in-memory LRU.
+    """
+
+    def __init__(self, directory: str, memory_entries: int = 10_000):
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._memory: OrderedDict[tuple, list[float]] = OrderedDict()
+        self._vectors: dict[int, np.memmap] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.directory / "index.sqlite3"), check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def get_many(self, model: str, dimensions: int, normalize: bool, texts: list[str]) -> list[list[float] | None]:
+        """Look up the embeddings of texts, None for those not cached."""
+        keys = [(model, dimensions, bool(normalize), text_hash(text)) for text in texts]
+        results: list[list[float] | None] = [None] * len(keys)
+        with self._lock:
+            missing = []
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.append(i)
+                else:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                    self.hits += 1
+
+            for i in missing:
+                key = keys[i]
+                row = self._db.execute(
+                    "SELECT row FROM embeddings WHERE model = ? AND dimensions = ? AND normalize = ? AND text_hash = ?",
+                    (key[0], key[1], int(key[2]), key[3]),
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    continue
+                vector = self._file(dimensions, row[0] + 1)[row[0]].tolist()
+                self._remember(key, vector)
+                results[i] = vector
+                self.disk_hits += 1
+        return results
+
+    def put_many(self, model: str, dimensions: int, normalize: bool, texts: list[str], vectors: list[list[float]]):
+        """Store the embeddings of texts."""
+        keys = [(model, dimensions, bool(normalize), text_hash(text)) for text in texts]
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute("SELECT rows FROM vector_files WHERE dimensions = ?", (dimensions,)).fetchone()
+                start = rows[0] if rows else 0
+                vector_file = self._file(dimensions, start + len(keys))
+                # Vectors are written before the index rows pointing at them are committed
+                vector_file[start:start + len(keys)] = np.asarray(vectors, dtype=np.float32)
+                vector_file.flush()
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, dimensions, normalize, text_hash, row) VALUES (?, ?, ?, ?, ?)",
+                    [(k[0], k[1], int(k[2]), k[3], start + i) for i, k in enumerate(keys)],
+                )
+                self._db.execute(
+                    "INSERT OR REPLACE INTO vector_files (dimensions, rows) VALUES (?, ?)",
+                    (dimensions, start + len(keys)),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            for key, vector in zip(keys, vectors):
+                self._remember(key, list(vector))
+
+    def embed(self, model: str, dimensions: int, normalize: bool, texts: list[str], embed_missing) -> list[list[float]]:
+        """Return the embeddings of texts, calling embed_missing(texts) only for those not cached."""
+        results = self.get_many(model, dimensions, normalize, texts)
+        missing = self._missing(texts, results)
+        if missing:
+            vectors = embed_missing(missing)
+            self.put_many(model, dimensions, normalize, missing, vectors)
+            self._fill(texts, results, dict(zip(missing, vectors)))
+        return results
+
+    async def aembed(self, model: str, dimensions: int, normalize: bool, texts: list[str], embed_missing) -> list[list[float]]:
+        """Async version of embed(), for an async embed_missing(texts)."""
+        results = self.get_many(model, dimensions, normalize, texts)
+        missing = self._missing(texts, results)
+        if missing:
+            vectors = await embed_missing(missing)
+            self.put_many(model, dimensions, normalize, missing, vectors)
+            self._fill(texts, results, dict(zip(missing, vectors)))
+        return results
+
+    def stats(self) -> dict:
+        """Report the number of hits in memory and on disk, misses, and the hit rate."""
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    @staticmethod
+    def _missing(texts: list[str], results: list) -> list[str]:
+        # Each distinct text is embedded once, even if it appears several times
+        return list(dict.fromkeys(text for text, vector in zip(texts, results) if vector is None))
+
+    @staticmethod
+    def _fill(texts: list[str], results: list, embedded: dict):
+        for i, text in enumerate(texts):
+            if results[i] is None:
+                results[i] = embedded[text]
+
+    def _remember(self, key: tuple, vector: list[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _file(self, dimensions: int, rows: int) -> np.memmap:
+        """Map the vector file of a dimension with room for at least the given number of rows.
+
+        Must be called with the lock held.
+        """
+        vector_file = self._vectors.get(dimensions)
+        if vector_file is not None and vector_file.shape[0] >= rows:
+            return vector_file
+
+        path = self.directory / f"vectors-{dimensions}.f32"
+        row_size = dimensions * np.dtype(np.float32).itemsize
+        size = path.stat().st_size if path.exists() else 0
+        if size < rows * row_size:
+            # Grow geometrically so that appends do not remap the file every time
+            with open(path, "ab") as f:
+                f.truncate(max(rows, 2 * (size // row_size), 1024) * row_size)
+            size = path.stat().st_size
+        vector_file = np.memmap(path, dtype=np.float32, mode="r+", shape=(size // row_size, dimensions))
+        self._vectors[dimensions] = vector_file
+        return vector_file
+
+
+_cache: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Return the process-wide embedding cache, or None if EMBEDDING_CACHE is false."""
+    global _cache
+    if os.getenv("EMBEDDING_CACHE", "true").lower() not in ("true", "1", "yes"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            project_dir = pathlib.Path(__file__).parent.parent.resolve()
+            _cache = EmbeddingCache(
+                os.getenv("EMBEDDING_CACHE_DIR", str(project_dir / ".embedding_cache")),
+                memory_entries=int(os.getenv("EMBEDDING_CACHE_MEMORY_ENTRIES", "10000")),
+            )
+        return _cache
+
+
+def cache_mem0_embeddings(memory, cache: EmbeddingCache):
+    """Serve the embeddings of a Mem0 Memory or AsyncMemory client, and of its graph store, from the cache."""
+    _cache_mem0_embedder(memory.embedding_model, cache)
+    graph = getattr(memory, "graph", None)
+    if graph is not None and getattr(graph, "embedding_model", None) is not None:
+        _cache_mem0_embedder(graph.embedding_model, cache)
+
+
+def _cache_mem0_embedder(embedder, cache: EmbeddingCache):
+    # Titan V2 returns normalized 1024-dimension vectors when Mem0 does not set
+    # the dimensions, so they are shared with the other frameworks
+    embed = embedder.embed
+    model = embedder.config.model
+    dimensions = getattr(embedder.config, "embedding_dims", None) or 1024
+
+    def cached_embed(text, memory_action=None):
+        return cache.embed(model, dimensions, True, [text], lambda texts: [embed(t, memory_action) for t in texts])[0]
+
+    embedder.embed = cached_embed
+
+
+def cache_cognee_embeddings(cache: EmbeddingCache):
+    """Serve the embeddings of Cognee's LiteLLM embedding engine from the cache."""
+    from cognee.infrastructure.databases.vector.embeddings.LiteLLMEmbeddingEngine import LiteLLMEmbeddingEngine
+
+    # The method is wrapped as it is, keeping Cognee's decorators such as its
+    # @observe telemetry; when already patched, the patch is replaced rather than nested
+    original_embed_text = getattr(
+        LiteLLMEmbeddingEngine.embed_text, "_uncached_embed_text", LiteLLMEmbeddingEngine.embed_text
+    )
+
+    async def embed_text(self, text: list[str]) -> list[list[float]]:
+        if self.mock:
+            return await original_embed_text(self, text)
+        # litellm routes "bedrock/<model>" to the same Bedrock model the other frameworks use
+        model = self.model.removeprefix("bedrock/")
+        return await cache.aembed(model, self.dimensions, True, text, lambda texts: original_embed_text(self, texts))
+
+    embed_text._uncached_embed_text = original_embed_text
+    LiteLLMEmbeddingEngine.embed_text = embed_text
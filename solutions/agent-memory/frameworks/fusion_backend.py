@@ -0,0 +1,145 @@
+"""Memory backend combining several frameworks.
+
+The FusionBackend searches several backends (e.g. Mem0 and Graphiti)
+concurrently and merges their results with reciprocal rank fusion (RRF): a
+memory ranked r by a backend scores 1 / (k + r), and memories found by several
+backends add up their scores. Each backend has its own timeout, so a slow
+backend only drops its own results instead of delaying the search. Writes are
+sent to all backends concurrently.
+
+A write returns once every backend has answered, rather than dispatching
+background tasks: the result reports which backends stored the memory, and a
+search right after an add sees it. To take ingestion off the agent's turn, wrap
+the FusionBackend in the write-behind queue (MEMORY_WRITE_BEHIND=true), which
+adds what background tasks would not: queued memories survive a restart, are
+retried on failure and are ingested in order per user.
+"""
+
+import asyncio
+import logging
+
+from frameworks.memory_backend import BackgroundEventLoop, MemoryBackend
+from frameworks.search_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+# RRF constant: dampens the weight of the top ranks, 60 is the usual value
+RRF_K = 60
+
+
+def result_items(results) -> list:
+    """Ranked items of a backend's search results."""
+    if isinstance(results, dict):
+        # Mem0 returns {"results": [...], "relations": [...]}
+        return list(results.get("results", []))
+    return list(results or [])
+
+
+def item_text(item) -> str:
+    """Text of a search result: a Mem0 memory, a Graphiti fact or a Cognee context."""
+    if isinstance(item, dict):
+        return str(item.get("memory", item))
+    fact = getattr(item, "fact", None)
+    if fact is not None:
+        return str(fact)
+    return str(item)
+
+
+def reciprocal_rank_fusion(rankings: dict[str, list], k: int = RRF_K) -> list[dict]:
+    """Merge the ranked results of several backends, deduplicating identical memories.
+
+    Returns the memories ordered by fused score, with the backends that found them.
+    """
+    fused: dict[str, dict] = {}
+    for name, items in rankings.items():
+        for rank, item in enumerate(items, start=1):
+            text = item_text(item)
+            entry = fused.setdefault(normalize_query(text), {"memory": text, "score": 0.0, "sources": []})
+            if name not in entry["sources"]:
+                entry["score"] += 1.0 / (k + rank)
+                entry["sources"].append(name)
+    return sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+
+
+class FusionBackend(MemoryBackend):
+    """MemoryBackend that searches and writes to several backends at once.
+
+    Args:
+        backends: Backends by name.
+        timeout: Seconds each backend has to answer a search, either one value
+            for all backends or a value per backend name.
+        k: Reciprocal rank fusion constant.
+    """
+
+    def __init__(self, backends: dict[str, MemoryBackend], timeout: float | dict[str, float] = 5.0, k: int = RRF_K):
+        if not backends:
+            raise ValueError("FusionBackend needs at least one backend")
+        self.backends = backends
+        self.timeouts = timeout if isinstance(timeout, dict) else {name: timeout for name in backends}
+        self.k = k
+        self._loop = BackgroundEventLoop("fusion-memory")
+
+    # --- MemoryBackend API ---
+
+    def search(self, query: str, user_id: str) -> list:
+        return self._loop.run(self.asearch(query, user_id))
+
+    def add(self, content: str, user_id: str) -> dict:
+        return self._loop.run(self.aadd(content, user_id))
+
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        return self._loop.run(self.aadd_many(items, user_id))
+
+    async def asearch(self, query: str, user_id: str) -> list:
+        names = list(self.backends)
+        outcomes = await asyncio.gather(
+            *(self._search(name, query, user_id) for name in names), return_exceptions=True
+        )
+        rankings = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Search on {name} failed, returning the other backends' results: {outcome!r}")
+            else:
+                rankings[name] = result_items(outcome)
+        if not rankings:
+            raise RuntimeError(f"Search failed on all backends: {', '.join(names)}")
+        return reciprocal_rank_fusion(rankings, self.k)
+
+    async def aadd(self, content: str, user_id: str) -> dict:
+        return await self._write(user_id, lambda backend: backend.aadd(content, user_id))
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        return await self._write(user_id, lambda backend: backend.aadd_many(items, user_id))
+
+    def flush(self, user_id: str):
+        self._loop.run(self.aflush(user_id))
+
+    async def aflush(self, user_id: str):
+        await asyncio.gather(*(backend.aflush(user_id) for backend in self.backends.values()))
+
+    def on_indexed(self, callback):
+        for backend in self.backends.values():
+            backend.on_indexed(callback)
+
+    # --- Internals ---
+
+    async def _search(self, name: str, query: str, user_id: str):
+        try:
+            return await asyncio.wait_for(self.backends[name].asearch(query, user_id), self.timeouts.get(name))
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"no answer within {self.timeouts.get(name)}s") from None
+
+    async def _write(self, user_id: str, write) -> dict:
+        # Synchronous fan-out on purpose, see the module docstring
+        names = list(self.backends)
+        outcomes = await asyncio.gather(*(write(self.backends[name]) for name in names), return_exceptions=True)
+        statuses = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.warning(f"Write to {name} failed: {outcome!r}")
+                statuses[name] = f"failed: {outcome}"
+            else:
+                statuses[name] = "added"
+        if all(status != "added" for status in statuses.values()):
+            raise RuntimeError(f"Write failed on all backends: {statuses}")
+        return {"status": "added", "user_id": user_id, "backends": statuses}
@@ -1,20 +1,37 @@
+import asyncio
+import functools
 import json
 import logging
 import os
+import random
+import re
+import time
 import typing
+from datetime import datetime
 from typing import Any, Iterable, Literal
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
 from graphiti_core import Graphiti
-from graphiti_core.driver.neptune_driver import NeptuneDriver
+from graphiti_core.driver.neptune_driver import NeptuneDriver, aoss_indices
 from graphiti_core.embedder.client import EmbedderClient
 from graphiti_core.llm_client.client import LLMClient, get_extraction_language_instruction
 from graphiti_core.llm_client.config import DEFAULT_MAX_TOKENS, LLMConfig, ModelSize
 from graphiti_core.llm_client.errors import RateLimitError
 
+from frameworks.embedding_cache import EmbeddingCache, get_embedding_cache
+from frameworks.response_cache import ResponseCache, get_response_cache, response_key
+
 load_dotenv()
 
 BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-6")
@@ -39,41 +56,153 @@ def _parse_endpoint(endpoint: str) -> str:
     return endpoint
 
 
-# --- Monkey-patch NeptuneDriver at the class level ---
-# Neptune Database's execute_open_cypher_query rejects queries with parameters
-# that are not referenced in the query string OR have None values.
-# graphiti_core's _sanitize_parameters can inline datetime values (removing $param)
-# without removing the param from the dict. It also conditionally builds query clauses
-# but unconditionally passes all params.
-# This patch strips unreferenced and None-valued params after sanitization.
-import re as _re
+_PARAMETER = re.compile(r'\$(\w+)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _referenced_parameters(cypher_query: str) -> frozenset[str]:
+    """Names of the $parameters referenced by a query, cached per query text.
+
+    Graphiti builds its queries from a small set of templates, so the same
+    query texts come back thousands of times during ingestion.
+    """
+    return frozenset(_PARAMETER.findall(cypher_query))
+
+
+_NUMBER_TYPES = frozenset((int, float))
+
+
+# Seconds AOSS needs before newly created indices serve queries, as in NeptuneDriver.create_aoss_indices
+INDEX_CREATION_WAIT = 60
 
-_original_run_query = NeptuneDriver._run_query
+# (AOSS host, index name) of the indices known to exist, shared by all drivers of the process
+_ready_indices: set[tuple[str, str]] = set()
 
 
-def _patched_run_query(self, cypher_query_, params):
-    # Handle nested 'params' dict: search_utils.py passes params=filter_params as a kwarg,
-    # which creates {'params': {'group_ids': [...]}, 'search_vector': [...], ...}.
-    # Flatten by merging the nested 'params' dict into the top level.
-    if 'params' in params and isinstance(params['params'], dict):
-        nested = params.pop('params')
-        params.update(nested)
+def _is_number_list(value) -> bool:
+    # Checking the first item first keeps lists of strings or dicts cheap
+    return (
+        type(value) is list and bool(value) and type(value[0]) in _NUMBER_TYPES
+        and _NUMBER_TYPES.issuperset(map(type, value))
+    )
 
-    cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
-    if params:
-        referenced = set(_re.findall(r'\$(\w+)', cypher_query_))
-        params = {k: v for k, v in params.items() if k in referenced and v is not None}
-    try:
-        result = self.client.query(cypher_query_, params=params)
-    except Exception as e:
-        logger.error('Query: %s', cypher_query_)
-        logger.error('Parameters: %s', params)
-        logger.error('Error executing query: %s', e)
-        raise e
-    return result, None, None
 
+class GraphitiNeptuneDriver(NeptuneDriver):
+    """NeptuneDriver that only sends Neptune the parameters a query references.
 
-NeptuneDriver._run_query = _patched_run_query
+    Neptune Database's execute_open_cypher_query rejects queries with parameters
+    that are not referenced in the query string OR have None values.
+    graphiti_core's _sanitize_parameters can inline datetime values (removing $param)
+    without removing the param from the dict. It also conditionally builds query clauses
+    but unconditionally passes all params.
+    This driver strips unreferenced and None-valued params after sanitization.
+
+    It also checks the AOSS indices concurrently and remembers the ones that
+    exist, instead of checking them one by one and waiting a minute on every
+    build_indices_and_constraints() call.
+    """
+
+    def __init__(self, host: str, aoss_host: str, port: int = 8182, aoss_port: int = 443):
+        super().__init__(host=host, aoss_host=aoss_host, port=port, aoss_port=aoss_port)
+        self.aoss_host = aoss_host
+        self._indices_lock = asyncio.Lock()
+        # Workaround: graphiti_core 0.29.x expects _database on all drivers
+        # but NeptuneDriver doesn't set it. Default to empty string.
+        if not hasattr(self, '_database'):
+            self._database = ""
+
+    async def build_indices_and_constraints(self, delete_existing: bool = False):
+        # Neptune Database has no schema constraints, only the AOSS indices need creating
+        if delete_existing:
+            await self.delete_aoss_indices()
+        await self.ensure_indices()
+
+    async def index_status(self) -> dict[str, bool]:
+        """Check which AOSS indices exist, concurrently."""
+        names = [index['index_name'] for index in aoss_indices]
+        exists = await asyncio.gather(
+            *(asyncio.to_thread(self.aoss_client.indices.exists, index=name) for name in names)
+        )
+        return dict(zip(names, (bool(e) for e in exists)))
+
+    async def ensure_indices(self) -> dict[str, str]:
+        """Create the missing AOSS indices, once per process.
+
+        Returns the state of each index: "ready" (known to exist), "exists" or "created".
+        """
+        async with self._indices_lock:
+            pending = [index for index in aoss_indices if (self.aoss_host, index['index_name']) not in _ready_indices]
+            states = await asyncio.gather(*(asyncio.to_thread(self._ensure_index, index) for index in pending))
+            result = {index['index_name']: "ready" for index in aoss_indices}
+            result.update(zip((index['index_name'] for index in pending), states))
+            if "created" in states:
+                logger.info(f"Created AOSS indices, waiting {INDEX_CREATION_WAIT}s for them to serve queries")
+                await asyncio.sleep(INDEX_CREATION_WAIT)
+            _ready_indices.update((self.aoss_host, index['index_name']) for index in pending)
+            return result
+
+    async def create_aoss_indices(self):
+        await self.ensure_indices()
+
+    async def delete_aoss_indices(self):
+        for index in aoss_indices:
+            _ready_indices.discard((self.aoss_host, index['index_name']))
+        await super().delete_aoss_indices()
+
+    def _ensure_index(self, index: dict) -> str:
+        name = index['index_name']
+        if self.aoss_client.indices.exists(index=name):
+            return "exists"
+        try:
+            self.aoss_client.indices.create(index=name, body=index['body'])
+        except Exception as e:
+            # Another process created it since the check
+            if "resource_already_exists" not in str(e):
+                raise
+            return "exists"
+        return "created"
+
+    def _sanitize_parameters(self, query, params: dict):
+        """Same result as NeptuneDriver._sanitize_parameters, without walking lists of numbers.
+
+        Lists of numbers (embeddings) need no conversion and never change the
+        query, but walking them item by item dominated the cost of saving a
+        node or an edge.
+        """
+        if isinstance(query, list):
+            return super()._sanitize_parameters(query, params)
+        rest = None
+        for k, v in params.items():
+            if _is_number_list(v):
+                if rest is None:
+                    rest = dict(params)
+                del rest[k]
+        if rest is None:
+            return super()._sanitize_parameters(query, params)
+        query = super()._sanitize_parameters(query, rest)
+        params.update(rest)
+        return query
+
+    def _run_query(self, cypher_query_, params):
+        # Handle nested 'params' dict: search_utils.py passes params=filter_params as a kwarg,
+        # which creates {'params': {'group_ids': [...]}, 'search_vector': [...], ...}.
+        # Flatten by merging the nested 'params' dict into the top level.
+        if 'params' in params and isinstance(params['params'], dict):
+            nested = params.pop('params')
+            params.update(nested)
+
+        cypher_query_ = str(self._sanitize_parameters(cypher_query_, params))
+        if params:
+            referenced = _referenced_parameters(cypher_query_)
+            params = {k: v for k, v in params.items() if v is not None and k in referenced}
+        try:
+            result = self.client.query(cypher_query_, params=params)
+        except Exception as e:
+            logger.error('Query: %s', cypher_query_)
+            logger.error('Parameters: %s', params)
+            logger.error('Error executing query: %s', e)
+            raise e
+        return result, None, None
 
 
 class LiteLLMClient(LLMClient):
@@ -81,6 +210,10 @@ class LiteLLMClient(LLMClient):
 
     litellm handles the Bedrock auth (SigV4) natively via boto3 — no tokens or
     OpenAI-compatible endpoints needed.  Model IDs use litellm's 'bedrock/' prefix.
+
+    With cache=True, responses are stored in a persistent ResponseCache (the
+    one configured by LLM_RESPONSE_CACHE_* unless response_cache is given), so
+    that re-ingested or replayed episodes do not call Bedrock again.
     """
 
     StructuredOutputMode = Literal['json_schema', 'json_object']
@@ -91,10 +224,14 @@ class LiteLLMClient(LLMClient):
         cache: bool = False,
         max_tokens: int = 16384,
         structured_output_mode: StructuredOutputMode = 'json_object',
+        response_cache: ResponseCache | None = None,
     ):
         if config is None:
             config = LLMConfig()
-        super().__init__(config, cache)
+        # Graphiti's own cache is replaced by the response cache below
+        super().__init__(config, False)
+        self.cache_enabled = cache
+        self.response_cache = (response_cache or get_response_cache()) if cache else None
         self.max_tokens = max_tokens
         self.structured_output_mode = structured_output_mode
 
@@ -134,6 +271,14 @@ class LiteLLMClient(LLMClient):
                 f'\n\nRespond with a JSON object in the following format:\n\n{serialized_model}'
             )
 
+        key = None
+        if self.response_cache is not None:
+            schema = response_model.model_json_schema() if response_model is not None else None
+            key = response_key(model, self.temperature, max_tokens, schema, litellm_messages)
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                return cached
+
         try:
             response = await litellm.acompletion(**kwargs)
             result = response.choices[0].message.content or ''
@@ -143,11 +288,13 @@ class LiteLLMClient(LLMClient):
             # Strip markdown code fences if present
             stripped = result.strip()
             if stripped.startswith('```'):
-                import re
                 stripped = re.sub(r'^```[a-zA-Z0-9_-]*[ \t]*\r?\n?', '', stripped)
                 stripped = re.sub(r'\r?\n?```[ \t]*$', '', stripped)
                 stripped = stripped.strip()
-            return json.loads(stripped)
+            parsed = json.loads(stripped)
+            if key is not None:
+                self.response_cache.put(key, parsed)
+            return parsed
         except Exception as e:
             if 'rate' in str(e).lower():
                 raise RateLimitError from e
@@ -192,29 +339,106 @@ class LiteLLMClient(LLMClient):
                 raise
 
 
+_THROTTLING_ERRORS = {"ThrottlingException", "TooManyRequestsException", "ServiceUnavailableException"}
+# Transient failures that are retried without being taken as a sign of overload
+_TRANSIENT_ERRORS = {"InternalServerException", "ModelTimeoutException", "ModelNotReadyException"}
+_TRANSIENT_EXCEPTIONS = (EndpointConnectionError, ConnectTimeoutError, ReadTimeoutError, ConnectionClosedError)
+
+
+def _retryable(error: Exception) -> str | None:
+    """Classify a failed Bedrock call: "throttled", "transient", or None if it should not be retried."""
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        if code in _THROTTLING_ERRORS:
+            return "throttled"
+        if code in _TRANSIENT_ERRORS or error.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0) >= 500:
+            return "transient"
+        return None
+    if isinstance(error, _TRANSIENT_EXCEPTIONS):
+        return "transient"
+    return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Bounds the number of concurrent requests, adapting the bound to throttling.
+
+    The bound is halved each time a request is throttled, and grows back by one
+    after as many successful requests as the current bound (AIMD), up to
+    max_concurrency. Requests that failed for another reason leave it unchanged.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, throttled: bool = False, failed: bool = False):
+        async with self._condition:
+            self._in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self._successes = 0
+            elif not failed:
+                self._successes += 1
+                if self.limit < self.max_concurrency and self._successes >= self.limit:
+                    self.limit += 1
+                    self._successes = 0
+            self._condition.notify_all()
+
+
 class BedrockEmbedder(EmbedderClient):
     """Embedder that uses Amazon Bedrock's Titan Text Embeddings model via InvokeModel.
 
     Uses the standard AWS credential chain — no API key needed.
+
+    The blocking boto3 calls run in worker threads so they do not stall the
+    Graphiti event loop. Batches are embedded concurrently, with at most
+    max_concurrency requests in flight; throttled requests lower that bound
+    and are retried with a jittered exponential backoff. Transient failures
+    (connection errors, timeouts, 5xx errors) are retried with the same
+    backoff but leave the bound unchanged. The timing of the last batch is
+    available in last_batch.
+
+    With an EmbeddingCache, texts embedded before are served from the cache
+    and only the others are sent to Bedrock.
     """
 
-    def __init__(self, model_id: str = None, region: str = None, dimensions: int = 1024):
+    def __init__(
+        self,
+        model_id: str = None,
+        region: str = None,
+        dimensions: int = 1024,
+        max_concurrency: int = 8,
+        max_retries: int = 6,
+        cache: EmbeddingCache | None = None,
+    ):
         session = boto3.Session()
         self.region = region or session.region_name or "us-east-1"
         self.model_id = model_id or BEDROCK_EMBEDDING_MODEL_ID
         self.dimensions = dimensions
-        self.client = session.client("bedrock-runtime", region_name=self.region)
-
-    async def create(
-        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
-    ) -> list[float]:
-        """Generate embeddings for a single text input."""
-        if isinstance(input_data, list):
-            # If given a list, embed the first item (Graphiti calls create per-item)
-            text = input_data[0] if input_data else ""
-        else:
-            text = str(input_data)
-
+        self.max_retries = max_retries
+        # Retries are handled here so that throttling also lowers the concurrency,
+        # see _embed for the errors retried
+        self.client = session.client(
+            "bedrock-runtime",
+            region_name=self.region,
+            config=Config(max_pool_connections=max_concurrency, retries={"max_attempts": 0}),
+        )
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+        self.cache = cache
+        self.embedded = 0
+        self.throttled = 0
+        self.retried = 0
+        self.last_batch = None
+
+    def _invoke(self, text: str) -> list[float]:
         body = json.dumps({
             "inputText": text,
             "dimensions": self.dimensions,
@@ -230,15 +454,88 @@ class BedrockEmbedder(EmbedderClient):
         result = json.loads(response["body"].read())
         return result["embedding"]
 
+    async def _embed(self, text: str) -> list[float]:
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire()
+            failure = None
+            try:
+                embedding = await asyncio.to_thread(self._invoke, text)
+                self.embedded += 1
+                return embedding
+            except Exception as e:
+                failure = _retryable(e) or "fatal"
+                if failure == "fatal" or attempt == self.max_retries:
+                    raise
+                if failure == "throttled":
+                    self.throttled += 1
+                else:
+                    self.retried += 1
+                error = e
+            finally:
+                await self.limiter.release(throttled=failure == "throttled", failed=failure is not None)
+            delay = min(20.0, 0.5 * 2 ** attempt)
+            logger.warning(f"Bedrock embedding {'throttled' if failure == 'throttled' else f'failed ({error!r})'}, "
+                           f"retrying in up to {delay:.1f}s (concurrency limit {self.limiter.limit})")
+            await asyncio.sleep(random.uniform(0, delay))
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        """Generate embeddings for a single text input."""
+        if isinstance(input_data, list):
+            # If given a list, embed the first item (Graphiti calls create per-item)
+            text = input_data[0] if input_data else ""
+        else:
+            text = str(input_data)
+        return (await self._embed_cached([text]))[0]
+
+    async def _embed_many(self, texts: list[str]) -> list[list[float]]:
+        return list(await asyncio.gather(*(self._embed(text) for text in texts)))
+
+    async def _embed_cached(self, texts: list[str]) -> list[list[float]]:
+        if self.cache is None:
+            return await self._embed_many(texts)
+        return await self.cache.aembed(self.model_id, self.dimensions, True, texts, self._embed_many)
+
     async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
-        """Generate embeddings for multiple texts."""
-        embeddings = []
-        for text in input_data_list:
-            embedding = await self.create(text)
-            embeddings.append(embedding)
+        """Generate embeddings for multiple texts concurrently, in input order."""
+        started = time.perf_counter()
+        embedded, throttled = self.embedded, self.throttled
+        embeddings = await self._embed_cached(input_data_list)
+        seconds = time.perf_counter() - started
+        self.last_batch = {
+            "count": len(input_data_list),
+            "cached": len(input_data_list) - (self.embedded - embedded),
+            "seconds": seconds,
+            "texts_per_second": len(input_data_list) / seconds if seconds else 0.0,
+            "throttled": self.throttled - throttled,
+            "concurrency_limit": self.limiter.limit,
+        }
+        logger.debug(f"Embedded batch: {self.last_batch}")
         return embeddings
 
 
+def create_neptune_driver() -> GraphitiNeptuneDriver:
+    """Create the Neptune + AOSS driver from GRAPHITI_NEPTUNE_ENDPOINT and GRAPHITI_AOSS_ENDPOINT."""
+    neptune_uri = os.environ.get("GRAPHITI_NEPTUNE_ENDPOINT", "")
+    aoss_host = _parse_endpoint(os.environ.get("GRAPHITI_AOSS_ENDPOINT", ""))
+
+    if not neptune_uri:
+        raise ValueError("GRAPHITI_NEPTUNE_ENDPOINT must be set")
+
+    if not aoss_host:
+        raise ValueError("GRAPHITI_AOSS_ENDPOINT must be set")
+
+    driver = GraphitiNeptuneDriver(
+        host=neptune_uri,
+        port=int(os.environ.get("GRAPHITI_NEPTUNE_PORT", 8182)),
+        aoss_host=aoss_host,
+    )
+    # Increase AOSS timeout to handle serverless cold starts (default is 10s)
+    driver.aoss_client.transport.kwargs['timeout'] = 30
+    return driver
+
+
 class GraphitiDemo:
     """Wrapper over Graphiti for graph-based memory using Amazon Neptune
     with Amazon Bedrock as the LLM and embedding provider.
@@ -257,27 +554,7 @@ class GraphitiDemo:
     """
 
     def __init__(self, group_id: str):
-        neptune_uri = os.environ.get("GRAPHITI_NEPTUNE_ENDPOINT", "")
-        aoss_host = _parse_endpoint(os.environ.get("GRAPHITI_AOSS_ENDPOINT", ""))
-
-        if not neptune_uri:
-            raise ValueError("GRAPHITI_NEPTUNE_ENDPOINT must be set")
-
-        if not aoss_host:
-            raise ValueError("GRAPHITI_AOSS_ENDPOINT must be set")
-
-        # Set up Neptune graph driver
-        self.driver = NeptuneDriver(
-            host=neptune_uri,
-            port=int(os.environ.get("GRAPHITI_NEPTUNE_PORT", 8182)),
-            aoss_host=aoss_host,
-        )
-        # Increase AOSS timeout to handle serverless cold starts (default is 10s)
-        self.driver.aoss_client.transport.kwargs['timeout'] = 30
-        # Workaround: graphiti_core 0.29.x expects _database on all drivers
-        # but NeptuneDriver doesn't set it. Default to empty string.
-        if not hasattr(self.driver, '_database'):
-            self.driver._database = ""
+        self.driver = create_neptune_driver()
 
         # Configure Graphiti to use Bedrock via litellm (no token/mantle needed)
         llm_config = LLMConfig(
@@ -288,12 +565,13 @@ class GraphitiDemo:
         llm_client = LiteLLMClient(
             config=llm_config,
             structured_output_mode="json_object",
+            cache=get_response_cache() is not None,
         )
 
         # Use Bedrock Titan for embeddings
         session = boto3.Session()
         region = session.region_name or "us-east-1"
-        embedder = BedrockEmbedder(region=region)
+        embedder = BedrockEmbedder(region=region, cache=get_embedding_cache())
 
         # Use the LLM-based reranker via litellm
         from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
@@ -0,0 +1,298 @@
+"""Durable write-behind ingestion queue for memory backends.
+
+Adding a memory with Cognee or Graphiti runs LLM extraction, embedding and
+several graph writes, which blocks the agent's turn for seconds. The
+QueuedMemoryBackend wraps any MemoryBackend: add() records the memory in a
+local SQLite queue and returns immediately, and a pool of worker threads
+drains the queue into the wrapped backend.
+
+Memories of a user are ingested one at a time, in the order they were added,
+while different users are ingested in parallel. A batch of memories added with
+add_many() is queued as a single job and ingested with one add_many() call. Queued memories survive a
+restart. Searches are eventually consistent by default; with read-your-writes
+consistency a search first waits for the user's queued memories to be
+ingested, and flushes what the backend still indexes in the background, such
+as Cognee's pending cognify. Ingested memories are kept for done_retention seconds, for status
+reports, and then deleted so that the queue does not grow without bound.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from frameworks.memory_backend import MemoryBackend
+
+logger = logging.getLogger(__name__)
+
+EVENTUAL = "eventual"
+READ_YOUR_WRITES = "read_your_writes"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    batch INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL DEFAULT 0,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, user_id, id);
+"""
+
+
+class QueuedMemoryBackend(MemoryBackend):
+    """MemoryBackend that ingests memories asynchronously through a SQLite queue.
+
+    Args:
+        backend: The backend memories are ingested into and searches are sent to.
+        path: Path of the SQLite queue database.
+        workers: Number of users ingested in parallel.
+        consistency: EVENTUAL, or READ_YOUR_WRITES to make searches wait for
+            the user's queued memories.
+        max_attempts: Number of times a memory is tried before it is marked failed.
+        retry_delay: Seconds before a failed memory is retried, doubled after each attempt.
+        wait_timeout: Maximum seconds a read-your-writes search waits for ingestion.
+        done_retention: Seconds an ingested memory is kept in the queue before it is deleted.
+    """
+
+    def __init__(
+        self,
+        backend: MemoryBackend,
+        path: str,
+        workers: int = 2,
+        consistency: str = EVENTUAL,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        wait_timeout: float = 60.0,
+        done_retention: float = 3600.0,
+    ):
+        if consistency not in (EVENTUAL, READ_YOUR_WRITES):
+            raise ValueError(f"Unknown consistency '{consistency}'. Valid options: {EVENTUAL}, {READ_YOUR_WRITES}")
+        self.backend = backend
+        self.consistency = consistency
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.wait_timeout = wait_timeout
+        self.done_retention = done_retention
+
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        if "batch" not in {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}:
+            # Queues created before batches were queued as a single job
+            self._db.execute("ALTER TABLE jobs ADD COLUMN batch INTEGER NOT NULL DEFAULT 0")
+        # Memories that were being ingested when the process stopped are retried
+        self._db.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+        self._prune(time.time())
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._closed = False
+        self._workers = [
+            threading.Thread(target=self._work, name=f"memory-ingest-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    # --- MemoryBackend API ---
+
+    def search(self, query: str, user_id: str) -> list:
+        if self.consistency == READ_YOUR_WRITES:
+            self.flush(user_id)
+        return self.backend.search(query, user_id)
+
+    def add(self, content: str, user_id: str) -> dict:
+        job_id = self.enqueue([content], user_id)[0]
+        return {"status": "queued", "user_id": user_id, "job_id": job_id}
+
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        job_id = self.enqueue_batch(items, user_id)
+        return {"status": "queued", "user_id": user_id, "job_id": job_id, "count": len(items)}
+
+    async def asearch(self, query: str, user_id: str) -> list:
+        if self.consistency == READ_YOUR_WRITES:
+            await self.aflush(user_id)
+        return await self.backend.asearch(query, user_id)
+
+    async def aadd(self, content: str, user_id: str) -> dict:
+        return self.add(content, user_id)
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        return self.add_many(items, user_id)
+
+    def flush(self, user_id: str):
+        """Wait for the user's queued memories to be ingested, then make them searchable."""
+        self.wait_for(user_id, self.wait_timeout)
+        self.backend.flush(user_id)
+
+    async def aflush(self, user_id: str):
+        await asyncio.to_thread(self.wait_for, user_id, self.wait_timeout)
+        await self.backend.aflush(user_id)
+
+    def on_indexed(self, callback):
+        self.backend.on_indexed(callback)
+
+    # --- Queue API ---
+
+    def enqueue(self, items: list[str], user_id: str) -> list[int]:
+        """Queue memories of a user and return their job ids."""
+        now = time.time()
+        with self._lock:
+            job_ids = []
+            self._db.execute("BEGIN IMMEDIATE")
+            for content in items:
+                cursor = self._db.execute(
+                    "INSERT INTO jobs (user_id, content, enqueued_at) VALUES (?, ?, ?)", (user_id, content, now)
+                )
+                job_ids.append(cursor.lastrowid)
+            self._db.execute("COMMIT")
+            self._changed.notify_all()
+        return job_ids
+
+    def enqueue_batch(self, items: list[str], user_id: str) -> int:
+        """Queue memories of a user as one job, ingested with a single add_many() call, and return its id."""
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO jobs (user_id, content, batch, enqueued_at) VALUES (?, ?, 1, ?)",
+                (user_id, json.dumps(items), time.time()),
+            )
+            self._changed.notify_all()
+        return cursor.lastrowid
+
+    def status(self, user_id: str | None = None) -> dict:
+        """Report the number of queued, running, done and failed memories and the ingestion lag.
+
+        The lag is the age in seconds of the oldest memory not ingested yet. Done
+        memories are the ones ingested in the last done_retention seconds.
+        """
+        where, params = ("WHERE user_id = ?", (user_id,)) if user_id else ("", ())
+        with self._lock:
+            counts = dict(self._db.execute(f"SELECT status, count(*) FROM jobs {where} GROUP BY status", params))
+            oldest = self._db.execute(
+                f"SELECT min(enqueued_at) FROM jobs {where} {'AND' if where else 'WHERE'} "
+                "status IN ('pending', 'running')",
+                params,
+            ).fetchone()[0]
+        return {
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "lag_seconds": time.time() - oldest if oldest else 0.0,
+        }
+
+    def job_status(self, job_id: int) -> dict | None:
+        """Report the state of a queued memory, None if the job id is unknown."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT user_id, status, attempts, error, enqueued_at, finished_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("user_id", "status", "attempts", "error", "enqueued_at", "finished_at")
+        return {"job_id": job_id, **dict(zip(keys, row))}
+
+    def wait_for(self, user_id: str, timeout: float | None = None) -> bool:
+        """Wait until the memories queued so far for a user are ingested.
+
+        Returns False if the timeout expired first.
+        """
+        with self._lock:
+            last = self._db.execute(
+                "SELECT max(id) FROM jobs WHERE user_id = ? AND status IN ('pending', 'running')", (user_id,)
+            ).fetchone()[0]
+            if last is None:
+                return True
+            return self._changed.wait_for(
+                lambda: self._db.execute(
+                    "SELECT 1 FROM jobs WHERE user_id = ? AND id <= ? AND status IN ('pending', 'running') LIMIT 1",
+                    (user_id, last),
+                ).fetchone() is None,
+                timeout,
+            )
+
+    def close(self, timeout: float | None = None):
+        """Stop the workers once they finish the memory they are ingesting.
+
+        Memories still queued stay in the database and are ingested on the next start.
+        """
+        with self._lock:
+            self._closed = True
+            self._changed.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+
+    # --- Workers ---
+
+    def _claim(self) -> tuple[int, str, str, int] | None:
+        """Mark the next memory to ingest as running.
+
+        Only the oldest memory not ingested yet of each user can be claimed, so
+        the memories of a user are ingested one at a time and in order, even
+        when one of them is waiting to be retried. Must be called with the lock held.
+        """
+        row = self._db.execute(
+            """
+            SELECT id, user_id, content, batch FROM jobs
+            WHERE status = 'pending'
+              AND available_at <= ?
+              AND id IN (SELECT min(id) FROM jobs WHERE status IN ('pending', 'running') GROUP BY user_id)
+            ORDER BY id LIMIT 1
+            """,
+            (time.time(),),
+        ).fetchone()
+        if row is not None:
+            self._db.execute("UPDATE jobs SET status = 'running', attempts = attempts + 1 WHERE id = ?", (row[0],))
+        return row
+
+    def _work(self):
+        while True:
+            with self._lock:
+                job = None
+                while not self._closed:
+                    job = self._claim()
+                    if job is not None:
+                        break
+                    # Wake up periodically to pick up memories whose retry delay expired
+                    self._changed.wait(1.0)
+                if job is None:
+                    return
+            job_id, user_id, content, batch = job
+            try:
+                if batch:
+                    self.backend.add_many(json.loads(content), user_id)
+                else:
+                    self.backend.add(content, user_id)
+                status, error = "done", None
+            except Exception as e:
+                logger.warning(f"Ingesting memory {job_id} for user {user_id} failed: {e}")
+                status, error = "pending", str(e)
+            now = time.time()
+            with self._lock:
+                available_at = now
+                if status == "pending":
+                    attempts = self._db.execute("SELECT attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+                    if attempts >= self.max_attempts:
+                        status = "failed"
+                    available_at = now + self.retry_delay * 2 ** (attempts - 1)
+                self._db.execute(
+                    "UPDATE jobs SET status = ?, error = ?, available_at = ?, finished_at = ? WHERE id = ?",
+                    (status, error, available_at, now if status != "pending" else None, job_id),
+                )
+                if status == "done":
+                    self._prune(now)
+                self._changed.notify_all()
+
+    def _prune(self, now: float):
+        """Delete the memories ingested more than done_retention seconds ago. Must be called with the lock held."""
+        self._db.execute(
+            "DELETE FROM jobs WHERE status = 'done' AND finished_at <= ?", (now - self.done_retention,)
+        )
@@ -15,6 +15,8 @@ import os
 from dotenv import load_dotenv
 from mem0.memory.main import Memory
 
+from frameworks.embedding_cache import cache_mem0_embeddings, get_embedding_cache
+
 load_dotenv()
 
 BEDROCK_MODEL_ID = os.getenv("BEDROCK_MODEL_ID", "us.anthropic.claude-sonnet-4-6")
@@ -55,7 +57,11 @@ class Mem0Demo():
         }
 
         self.user_id = user_id
+        self.config = config
         self.client = Memory.from_config(config)
+        cache = get_embedding_cache()
+        if cache is not None:
+            cache_mem0_embeddings(self.client, cache)
 
     async def reset(self):
         self.client.delete_all(self.user_id)
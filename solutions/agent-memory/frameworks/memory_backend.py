@@ -5,18 +5,83 @@ The active backend is selected via the MEMORY_FRAMEWORK environment variable.
 """
 
 import asyncio
+import atexit
+import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def chunk_items(items: list[str], max_items: int, max_chars: int) -> list[list[str]]:
+    """Split items into consecutive chunks of at most max_items items and max_chars characters.
+
+    An item longer than max_chars gets a chunk of its own.
+    """
+    chunks, chunk, size = [], [], 0
+    for item in items:
+        if chunk and (len(chunk) == max_items or size + len(item) > max_chars):
+            chunks.append(chunk)
+            chunk, size = [], 0
+        chunk.append(item)
+        size += len(item)
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+class BackgroundEventLoop:
+    """A long-lived event loop running in a daemon thread.
+
+    The async frameworks (Cognee, Graphiti) keep clients, connection pools and
+    aiohttp sessions bound to the event loop they were first used on. Running
+    every call on the same loop lets that state be reused across agent turns,
+    instead of being rebuilt by a fresh asyncio.run() on each call.
+    """
+
+    def __init__(self, name: str):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def run(self, coro, timeout: float | None = None):
+        """Run a coroutine on the loop and wait for its result from a sync caller."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block on the memory event loop from a coroutine running on it")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    async def arun(self, coro):
+        """Run a coroutine on the loop and await its result from another event loop."""
+        if threading.current_thread() is self._thread:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    def close(self):
+        """Stop the loop and wait for its thread to exit."""
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
 
 class MemoryBackend(ABC):
     """Common interface for memory operations across all frameworks."""
 
+    # Bulk ingestion sends items in chunks small enough for one extraction pass
+    max_chunk_items = 20
+    max_chunk_chars = 20_000
+
     @abstractmethod
     def search(self, query: str, user_id: str) -> list:
         """Search memories for a user."""
@@ -27,6 +92,53 @@ class MemoryBackend(ABC):
         """Store a new memory for a user."""
         ...
 
+    @abstractmethod
+    async def asearch(self, query: str, user_id: str) -> list:
+        """Search memories for a user without blocking the caller's event loop."""
+        ...
+
+    @abstractmethod
+    async def aadd(self, content: str, user_id: str) -> dict:
+        """Store a new memory for a user without blocking the caller's event loop."""
+        ...
+
+    @abstractmethod
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        """Store several memories for a user through the framework's bulk ingestion path."""
+        ...
+
+    @abstractmethod
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        """Store several memories for a user in one call."""
+        ...
+
+    def flush(self, user_id: str):
+        """Make the memories added for a user searchable now, for frameworks that index them in the background."""
+
+    async def aflush(self, user_id: str):
+        """Make the memories added for a user searchable now without blocking the caller's event loop."""
+
+    def on_indexed(self, callback: Callable[[str], None]):
+        """Register a callback called with a user id when memories indexed in the background become searchable."""
+
+    def chunks(self, items: list[str]) -> list[list[str]]:
+        """Split items into the chunks sent to the framework by add_many."""
+        return chunk_items(items, self.max_chunk_items, self.max_chunk_chars)
+
+    def _bulk_result(self, user_id: str, count: int, chunks: int, started: float) -> dict:
+        """Log and report the throughput of a bulk ingestion."""
+        seconds = time.perf_counter() - started
+        rate = count / seconds if seconds else 0.0
+        logger.info(f"{type(self).__name__}: added {count} memories for {user_id} in {chunks} chunks ({rate:.1f} messages/s)")
+        return {
+            "status": "added",
+            "user_id": user_id,
+            "count": count,
+            "chunks": chunks,
+            "seconds": seconds,
+            "messages_per_second": rate,
+        }
+
 
 class Mem0Backend(MemoryBackend):
     """Memory backend using Mem0 with Neptune Analytics + Bedrock.
@@ -35,9 +147,25 @@ class Mem0Backend(MemoryBackend):
     enabling entity-relationship graph construction alongside vector search.
     """
 
+    # Each chunk is sent as one conversation, extracted in a single LLM call
+    max_chunk_chars = 8_000
+
     def __init__(self):
         from frameworks.mem0_neptune import Mem0Demo
         self._demo = Mem0Demo("")
+        self._async_client = None
+
+    @property
+    def async_client(self):
+        """AsyncMemory client sharing the sync client's configuration, created on first use."""
+        if self._async_client is None:
+            from mem0.memory.main import AsyncMemory
+            from frameworks.embedding_cache import cache_mem0_embeddings, get_embedding_cache
+            self._async_client = AsyncMemory.from_config(self._demo.config)
+            cache = get_embedding_cache()
+            if cache is not None:
+                cache_mem0_embeddings(self._async_client, cache)
+        return self._async_client
 
     def search(self, query: str, user_id: str) -> list:
         return self._demo.client.search(query, user_id=user_id)
@@ -45,12 +173,39 @@ class Mem0Backend(MemoryBackend):
     def add(self, content: str, user_id: str) -> dict:
         return self._demo.client.add(content, user_id=user_id)
 
+    async def asearch(self, query: str, user_id: str) -> list:
+        return await self.async_client.search(query, user_id=user_id)
+
+    async def aadd(self, content: str, user_id: str) -> dict:
+        return await self.async_client.add(content, user_id=user_id)
+
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        started = time.perf_counter()
+        chunks = self.chunks(items)
+        for chunk in chunks:
+            self._demo.client.add(self._messages(chunk), user_id=user_id)
+        return self._bulk_result(user_id, len(items), len(chunks), started)
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        started = time.perf_counter()
+        chunks = self.chunks(items)
+        for chunk in chunks:
+            await self.async_client.add(self._messages(chunk), user_id=user_id)
+        return self._bulk_result(user_id, len(items), len(chunks), started)
+
+    @staticmethod
+    def _messages(items: list[str]) -> list[dict]:
+        # Mem0 extracts facts from a whole conversation in a single LLM call
+        return [{"role": "user", "content": item} for item in items]
+
 
 class CogneeBackend(MemoryBackend):
     """Memory backend using Cognee with Neptune Analytics + Bedrock.
 
-    Uses cognee.remember() and cognee.recall() directly. Cognee manages its own
-    internal state (SQLite for metadata, Neptune Analytics for graph/vector).
+    Adds data with cognee.add() and builds the graph with debounced, batched
+    cognify runs (see CognifyScheduler), then searches with cognee.recall().
+    Cognee manages its own internal state (SQLite for metadata, Neptune
+    Analytics for graph/vector).
     """
 
     def __init__(self):
@@ -93,46 +248,88 @@ class CogneeBackend(MemoryBackend):
             "embedding_dimensions": 1024,
         })
 
-    def search(self, query: str, user_id: str) -> list:
-        import asyncio
-        import cognee
+        from frameworks.embedding_cache import cache_cognee_embeddings, get_embedding_cache
+        cache = get_embedding_cache()
+        if cache is not None:
+            cache_cognee_embeddings(cache)
+
+        from frameworks.cognify_scheduler import CognifyScheduler
+        self.cognify = CognifyScheduler(
+            quiet_period=float(os.getenv("COGNIFY_QUIET_PERIOD", "5")),
+            max_pending=int(os.getenv("COGNIFY_MAX_PENDING", "20")),
+        )
+        self.cognify_before_search = os.getenv("COGNIFY_BEFORE_SEARCH", "false").lower() in ("true", "1", "yes")
+
+        self._loop = BackgroundEventLoop("cognee-memory")
+        # Registered after the loop's own atexit handler, so it runs before the loop stops
+        atexit.register(self._flush_at_exit)
 
-        async def _search():
-            try:
-                results = await cognee.recall(query, datasets=[user_id], only_context=True)
-                return [str(r) for r in results] if results else []
-            except Exception as e:
-                if "RecallPreconditionError" in str(type(e).__name__) or "prerequisites not met" in str(e).lower():
-                    return []
-                raise
+    def flush(self, user_id: str):
+        """Cognify the pending data of a user now."""
+        self._loop.run(self.cognify.flush(user_id))
 
+    async def aflush(self, user_id: str):
+        await self._loop.arun(self.cognify.flush(user_id))
+
+    def on_indexed(self, callback: Callable[[str], None]):
+        # Added data is only searchable once the scheduler has cognified it
+        self.cognify.on_cognified(callback)
+
+    def _flush_at_exit(self):
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    return pool.submit(asyncio.run, _search()).result()
-        except RuntimeError:
-            pass
-        return asyncio.run(_search())
+            self._loop.run(self.cognify.flush_all())
+        except Exception as e:
+            logger.warning(f"Could not cognify pending data at exit: {e}")
 
-    def add(self, content: str, user_id: str) -> dict:
-        import asyncio
+    async def _search(self, query: str, user_id: str) -> list:
         import cognee
 
-        async def _add():
-            await cognee.remember(content, dataset_name=user_id)
-            return {"status": "added", "user_id": user_id}
-
+        if self.cognify_before_search:
+            await self.cognify.flush(user_id)
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    return pool.submit(asyncio.run, _add()).result()
-        except RuntimeError:
-            pass
-        return asyncio.run(_add())
+            results = await cognee.recall(query, datasets=[user_id], only_context=True)
+            return [str(r) for r in results] if results else []
+        except Exception as e:
+            if "RecallPreconditionError" in str(type(e).__name__) or "prerequisites not met" in str(e).lower():
+                return []
+            raise
+
+    async def _add(self, content: str | list[str], user_id: str) -> dict:
+        await self.cognify.add(content, user_id)
+        return {"status": "added", "user_id": user_id, "pending_cognify": self.cognify.pending(user_id)}
+
+    async def _add_many(self, items: list[str], user_id: str) -> dict:
+        import cognee
+
+        # All items are ingested in a single add and processed, together with
+        # any data still pending, by a single cognify run, which extracts the
+        # graph max_chunk_items documents at a time
+        started = time.perf_counter()
+        if not items:
+            return self._bulk_result(user_id, 0, 0, started)
+        batch = min(len(items), self.max_chunk_items)
+        await cognee.add(items, dataset_name=user_id, data_per_batch=batch)
+        self.cognify.added(user_id, len(items))
+        await self.cognify.flush(user_id, data_per_batch=batch)
+        return self._bulk_result(user_id, len(items), -(-len(items) // batch), started)
+
+    def search(self, query: str, user_id: str) -> list:
+        return self._loop.run(self._search(query, user_id))
+
+    def add(self, content: str, user_id: str) -> dict:
+        return self._loop.run(self._add(content, user_id))
+
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        return self._loop.run(self._add_many(items, user_id))
+
+    async def asearch(self, query: str, user_id: str) -> list:
+        return await self._loop.arun(self._search(query, user_id))
+
+    async def aadd(self, content: str, user_id: str) -> dict:
+        return await self._loop.arun(self._add(content, user_id))
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        return await self._loop.arun(self._add_many(items, user_id))
 
 
 class GraphitiBackend(MemoryBackend):
@@ -146,46 +343,74 @@ class GraphitiBackend(MemoryBackend):
 
         from frameworks.graphiti_neptune import GraphitiDemo
         self._demo = GraphitiDemo("")
+        self._loop = BackgroundEventLoop("graphiti-memory")
+
+        # Create missing indices up front, so that no search or write pays for it
+        if os.getenv("GRAPHITI_BOOTSTRAP_INDICES", "true").lower() in ("true", "1", "yes"):
+            started = time.perf_counter()
+            indices = self._loop.run(self._demo.driver.ensure_indices())
+            logger.info(f"Graphiti indices checked in {time.perf_counter() - started:.2f}s: {indices}")
+
+    async def _search(self, query: str, user_id: str) -> list:
+        return await self._demo.client.search(query, group_ids=[user_id])
+
+    async def _add(self, content: str, user_id: str) -> dict:
+        from graphiti_core.nodes import EpisodeType
+
+        await self._demo.client.add_episode(
+            name=f"memory_{datetime.utcnow().isoformat()}",
+            episode_body=content,
+            source=EpisodeType.message,
+            source_description="user_message",
+            reference_time=datetime.utcnow(),
+            group_id=user_id,
+        )
+        return {"status": "added", "user_id": user_id}
+
+    async def _add_many(self, items: list[str], user_id: str) -> dict:
+        from graphiti_core.nodes import EpisodeType
+        from graphiti_core.utils.bulk_utils import RawEpisode
+
+        # add_episode_bulk extracts and deduplicates the episodes of a chunk
+        # together; chunks are added in order so that later ones are resolved
+        # against the facts extracted from the earlier ones
+        started = time.perf_counter()
+        chunks = self.chunks(items)
+        now = datetime.utcnow()
+        index = 0
+        for chunk in chunks:
+            episodes = []
+            for item in chunk:
+                # Distinct reference times keep the items in order within a chunk
+                reference_time = now + timedelta(microseconds=index)
+                episodes.append(RawEpisode(
+                    name=f"memory_{reference_time.isoformat()}",
+                    content=item,
+                    source=EpisodeType.message,
+                    source_description="user_message",
+                    reference_time=reference_time,
+                ))
+                index += 1
+            await self._demo.client.add_episode_bulk(episodes, group_id=user_id)
+        return self._bulk_result(user_id, len(items), len(chunks), started)
 
     def search(self, query: str, user_id: str) -> list:
-        async def _search():
-            try:
-                results = await self._demo.client.search(query, group_ids=[user_id])
-                return results
-            except Exception as e:
-                if "index_not_found" in str(e):
-                    # First time use — create indexes
-                    await self._demo.client.build_indices_and_constraints()
-                    return []
-                raise
-
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, _search()).result()
-        return asyncio.run(_search())
+        return self._loop.run(self._search(query, user_id))
 
     def add(self, content: str, user_id: str) -> dict:
-        from graphiti_core.nodes import EpisodeType
+        return self._loop.run(self._add(content, user_id))
 
-        async def _add():
-            await self._demo.client.add_episode(
-                name=f"memory_{datetime.utcnow().isoformat()}",
-                episode_body=content,
-                source=EpisodeType.message,
-                source_description="user_message",
-                reference_time=datetime.utcnow(),
-                group_id=user_id,
-            )
-            return {"status": "added", "user_id": user_id}
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        return self._loop.run(self._add_many(items, user_id))
+
+    async def asearch(self, query: str, user_id: str) -> list:
+        return await self._loop.arun(self._search(query, user_id))
 
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                return pool.submit(asyncio.run, _add()).result()
-        return asyncio.run(_add())
+    async def aadd(self, content: str, user_id: str) -> dict:
+        return await self._loop.arun(self._add(content, user_id))
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        return await self._loop.arun(self._add_many(items, user_id))
 
 
 BACKENDS = {
@@ -198,13 +423,66 @@ BACKENDS = {
 def get_memory_backend() -> MemoryBackend:
     """Create the configured memory backend.
 
-    Set MEMORY_FRAMEWORK env var to one of: mem0, cognee, graphiti.
+    Set MEMORY_FRAMEWORK env var to one of: mem0, cognee, graphiti, fusion.
     Defaults to mem0.
+
+    fusion searches and writes to several frameworks at once (see
+    frameworks/fusion_backend.py), configured with:
+        MEMORY_FUSION_FRAMEWORKS - Comma-separated frameworks (default: mem0,cognee,graphiti)
+        MEMORY_FUSION_TIMEOUT - Seconds each framework has to answer a search (default: 5)
+
+    Set MEMORY_SEARCH_CACHE_TTL to a number of seconds to cache search results
+    per user and normalized query (see frameworks/search_cache.py). Adding a
+    memory for a user drops the user's cached searches.
+
+    Set MEMORY_WRITE_BEHIND=true to ingest added memories in the background
+    through a durable local queue (see frameworks/ingestion_queue.py), tuned with:
+        MEMORY_QUEUE_PATH - SQLite queue file (default: .memory_queue.sqlite3)
+        MEMORY_QUEUE_WORKERS - Users ingested in parallel (default: 2)
+        MEMORY_QUEUE_DONE_RETENTION - Seconds ingested memories stay in the queue (default: 3600)
+        MEMORY_CONSISTENCY - eventual (default) or read_your_writes
     """
     framework = os.getenv("MEMORY_FRAMEWORK", "mem0").lower()
-    if framework not in BACKENDS:
+    if framework == "fusion":
+        from frameworks.fusion_backend import FusionBackend
+
+        names = [n.strip().lower() for n in os.getenv("MEMORY_FUSION_FRAMEWORKS", "mem0,cognee,graphiti").split(",") if n.strip()]
+        unknown = [n for n in names if n not in BACKENDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown MEMORY_FUSION_FRAMEWORKS '{', '.join(unknown)}'. "
+                f"Valid options: {', '.join(BACKENDS.keys())}"
+            )
+        backend = FusionBackend(
+            {name: BACKENDS[name]() for name in names},
+            timeout=float(os.getenv("MEMORY_FUSION_TIMEOUT", "5")),
+        )
+    elif framework in BACKENDS:
+        backend = BACKENDS[framework]()
+    else:
         raise ValueError(
             f"Unknown MEMORY_FRAMEWORK '{framework}'. "
-            f"Valid options: {', '.join(BACKENDS.keys())}"
+            f"Valid options: {', '.join(BACKENDS.keys())}, fusion"
+        )
+
+    search_cache_ttl = float(os.getenv("MEMORY_SEARCH_CACHE_TTL", "0"))
+    if search_cache_ttl > 0:
+        from frameworks.search_cache import CachedMemoryBackend
+
+        backend = CachedMemoryBackend(backend, ttl=search_cache_ttl)
+
+    if os.getenv("MEMORY_WRITE_BEHIND", "false").lower() in ("true", "1", "yes"):
+        # The queue wraps the search cache, so that cached searches are dropped
+        # when a memory is ingested rather than when it is queued
+        import pathlib
+        from frameworks.ingestion_queue import QueuedMemoryBackend
+
+        project_dir = pathlib.Path(__file__).parent.parent.resolve()
+        backend = QueuedMemoryBackend(
+            backend,
+            path=os.getenv("MEMORY_QUEUE_PATH", str(project_dir / ".memory_queue.sqlite3")),
+            workers=int(os.getenv("MEMORY_QUEUE_WORKERS", "2")),
+            done_retention=float(os.getenv("MEMORY_QUEUE_DONE_RETENTION", "3600")),
+            consistency=os.getenv("MEMORY_CONSISTENCY", "eventual").lower(),
         )
-    return BACKENDS[framework]()
+    return backend
@@ -0,0 +1,157 @@
+"""Persistent cache of LLM responses.
+
+Graphiti sends an entity extraction, edge extraction and several dedup
+prompts to the LLM for each episode. Re-ingesting or replaying episodes sends
+the very same prompts again. The ResponseCache stores the parsed response of
+each prompt in SQLite, keyed by the model, the sampling settings, the
+response schema and a hash of the messages, so that a replay is served
+locally. The cache is bounded in size: the least recently used responses are
+evicted first.
+
+Configuration via environment variables:
+    LLM_RESPONSE_CACHE - Set to true to cache Graphiti's LLM responses (default: false)
+    LLM_RESPONSE_CACHE_PATH - SQLite file of the cache (default: .llm_response_cache.sqlite3)
+    LLM_RESPONSE_CACHE_MAX_MB - Maximum size of the cached responses (default: 256)
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def response_key(
+    model: str, temperature: float, max_tokens: int, schema: dict | None, messages: list[dict]
+) -> str:
+    """Hash everything that determines the response of a prompt."""
+    payload = json.dumps(
+        {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "schema": schema,
+            "messages": messages,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded cache of LLM responses.
+
+    Args:
+        path: Path of the SQLite database.
+        max_bytes: Size of the cached responses above which the least recently
+            used ones are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._bytes = self._db.execute("SELECT total(size) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached response of a prompt, None if it is not cached."""
+        with self._lock:
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, response: Any):
+        """Cache the response of a prompt, evicting old responses if the cache is full."""
+        value = json.dumps(response)
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            # A replaced response no longer counts towards the size
+            self._bytes += size - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict:
+        """Report the hits, misses, evictions, hit rate and size of the cache."""
+        with self._lock:
+            entries = self._db.execute("SELECT count(*) FROM responses").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._bytes = 0
+
+    def _evict(self):
+        """Delete the least recently used responses until the cache is 90% full.
+
+        Must be called with the lock held.
+        """
+        # Other processes may share the database, so start from the actual size
+        self._bytes = self._db.execute("SELECT total(size) FROM responses").fetchone()[0]
+        target = self.max_bytes * 0.9
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for key, size in rows:
+            if self._bytes <= target:
+                break
+            evicted.append((key,))
+            self._bytes -= size
+        rows.close()
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the process-wide LLM response cache, or None unless LLM_RESPONSE_CACHE is true."""
+    global _cache
+    if os.getenv("LLM_RESPONSE_CACHE", "false").lower() not in ("true", "1", "yes"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            project_dir = pathlib.Path(__file__).parent.parent.resolve()
+            _cache = ResponseCache(
+                os.getenv("LLM_RESPONSE_CACHE_PATH", str(project_dir / ".llm_response_cache.sqlite3")),
+                max_bytes=int(float(os.getenv("LLM_RESPONSE_CACHE_MAX_MB", "256")) * 1024 * 1024),
+            )
+        return _cache
@@ -0,0 +1,131 @@
+"""Compaction of memory search results before they are returned to the agent.
+
+Backends return their raw search results: Mem0 memories with ids, hashes and
+metadata, Graphiti EntityEdge objects with embeddings and episode lists.
+Stringified, they can take thousands of tokens of the agent's next LLM call.
+compact_results() ranks fused results by score, keeps the backend's order
+otherwise, drops duplicate facts, keeps only the fact, its validity date and its
+score, and stops at a token budget. Mem0 scores are not ranked on: they are the
+raw score of its vector store, a distance on Neptune Analytics where lower is
+closer, and Mem0 already returns its results closest first.
+
+Tokens are estimated at 4 characters per token, which is close enough for
+English text to budget a tool result without a tokenizer.
+
+Configuration via environment variables:
+    MEMORY_RESULT_TOKEN_BUDGET - Tokens of search results returned to the agent, 0 to return raw results (default: 1000)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+from frameworks.search_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def result_token_budget() -> int:
+    """Token budget of search results from MEMORY_RESULT_TOKEN_BUDGET, 0 if compaction is disabled."""
+    return int(os.getenv("MEMORY_RESULT_TOKEN_BUDGET", "1000"))
+
+
+def _date(value) -> str | None:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value) if value else None
+
+
+def project(item) -> dict:
+    """Compact fields of a search result: a Mem0 memory or relation, a fused memory, a Graphiti edge or a Cognee context."""
+    if isinstance(item, dict):
+        if "memory" in item:
+            fields = {
+                "fact": str(item["memory"]),
+                "valid_at": _date(item.get("updated_at") or item.get("created_at")),
+                "score": item.get("score"),
+            }
+        elif "relationship" in item:
+            # Mem0 graph relation
+            target = item.get("destination", item.get("target", ""))
+            fields = {"fact": f"{item.get('source', '')} {item['relationship']} {target}"}
+        else:
+            fields = {"fact": json.dumps(item, default=str)}
+    elif getattr(item, "fact", None) is not None:
+        fields = {"fact": str(item.fact), "valid_at": _date(getattr(item, "valid_at", None))}
+    else:
+        fields = {"fact": str(item)}
+    if isinstance(fields.get("score"), float):
+        fields["score"] = round(fields["score"], 3)
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _items(results) -> list:
+    if isinstance(results, dict):
+        # Mem0 returns {"results": [...], "relations": [...]}
+        return list(results.get("results", [])) + list(results.get("relations", []))
+    return list(results or [])
+
+
+def _is_similarity(item) -> bool:
+    """Whether a search result carries a score where higher is better: a reciprocal rank fusion score."""
+    return isinstance(item, dict) and "sources" in item and isinstance(item.get("score"), (int, float))
+
+
+def compact_results(results, budget: int) -> dict:
+    """Rank, deduplicate, project and truncate search results to a token budget.
+
+    Fused results are ranked by score. Other results keep the backend's order,
+    after the fused ones, as their score may be a distance rather than a similarity.
+    Returns the compact memories, the number of memories left out, the tokens
+    of the compact memories, and the tokens saved over the raw results.
+    """
+    raw = _items(results)
+    items = [project(item) for item in raw]
+    ranked = sorted(
+        enumerate(items),
+        key=lambda entry: (-entry[1]["score"], entry[0]) if _is_similarity(raw[entry[0]]) else (float("inf"), entry[0]),
+    )
+
+    memories = []
+    seen = set()
+    tokens = 2  # the enclosing brackets
+    omitted = 0
+    for _, memory in ranked:
+        key = normalize_query(memory["fact"])
+        if key in seen:
+            continue
+        seen.add(key)
+        cost = estimate_tokens(json.dumps(memory)) + 1
+        if omitted or tokens + cost > budget:
+            if memories:
+                # Lower ranked memories are left out once one does not fit
+                omitted += 1
+                continue
+            # A single memory larger than the budget is cut rather than dropped
+            overflow = (tokens + cost - budget) * CHARS_PER_TOKEN
+            memory = dict(memory, fact=memory["fact"][:max(len(memory["fact"]) - overflow, 0)] + "...")
+            cost = estimate_tokens(json.dumps(memory)) + 1
+        memories.append(memory)
+        tokens += cost
+
+    raw_tokens = estimate_tokens(str(results))
+    tokens = estimate_tokens(json.dumps(memories))
+    compacted = {
+        "memories": memories,
+        "omitted": omitted,
+        "tokens": tokens,
+        "tokens_saved": max(raw_tokens - tokens, 0),
+    }
+    logger.info(
+        f"Compacted {len(items)} search results to {len(memories)} memories "
+        f"({raw_tokens} -> {tokens} tokens, {compacted['tokens_saved']} saved)"
+    )
+    return compacted
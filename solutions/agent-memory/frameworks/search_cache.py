@@ -0,0 +1,154 @@
+"""Search result cache for memory backends.
+
+Agents often call search_memory several times per turn with near-identical
+queries, and each call embeds the query and runs a vector and a graph search.
+The CachedMemoryBackend wraps any MemoryBackend and keeps search results for
+a few minutes, keyed by user and normalized query. Adding a memory for a user
+drops all the cached searches of that user, and so does the wrapped backend
+when it finishes indexing memories in the background (Cognee's cognify), so
+that a search never misses a searchable memory added through the same backend.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from frameworks.memory_backend import MemoryBackend
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize case, punctuation and whitespace, so that near-identical queries share an entry."""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", query.lower())).strip()
+
+
+class CachedMemoryBackend(MemoryBackend):
+    """MemoryBackend that caches search results per user and normalized query.
+
+    Args:
+        backend: The backend searches and writes are sent to.
+        ttl: Seconds a search result is served from the cache.
+        max_entries: Number of search results kept, least recently used are dropped first.
+    """
+
+    def __init__(self, backend: MemoryBackend, ttl: float = 60.0, max_entries: int = 1024):
+        self.backend = backend
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+        # (user_id, normalized query) -> (expires_at, results, seconds the search took)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list, float]] = OrderedDict()
+        # Incremented on each write of a user, so that a search that overlaps a
+        # write does not cache results computed before the write
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        backend.on_indexed(self.invalidate)
+
+    # --- MemoryBackend API ---
+
+    def search(self, query: str, user_id: str) -> list:
+        key = (user_id, normalize_query(query))
+        cached, generation = self._lookup(key)
+        if cached is not None:
+            return cached
+        started = time.perf_counter()
+        results = self.backend.search(query, user_id)
+        self._store(key, generation, results, time.perf_counter() - started)
+        return results
+
+    def add(self, content: str, user_id: str) -> dict:
+        self.invalidate(user_id)
+        try:
+            return self.backend.add(content, user_id)
+        finally:
+            self.invalidate(user_id)
+
+    def add_many(self, items: list[str], user_id: str) -> dict:
+        self.invalidate(user_id)
+        try:
+            return self.backend.add_many(items, user_id)
+        finally:
+            self.invalidate(user_id)
+
+    async def asearch(self, query: str, user_id: str) -> list:
+        key = (user_id, normalize_query(query))
+        cached, generation = self._lookup(key)
+        if cached is not None:
+            return cached
+        started = time.perf_counter()
+        results = await self.backend.asearch(query, user_id)
+        self._store(key, generation, results, time.perf_counter() - started)
+        return results
+
+    async def aadd(self, content: str, user_id: str) -> dict:
+        self.invalidate(user_id)
+        try:
+            return await self.backend.aadd(content, user_id)
+        finally:
+            self.invalidate(user_id)
+
+    async def aadd_many(self, items: list[str], user_id: str) -> dict:
+        self.invalidate(user_id)
+        try:
+            return await self.backend.aadd_many(items, user_id)
+        finally:
+            self.invalidate(user_id)
+
+    def flush(self, user_id: str):
+        self.backend.flush(user_id)
+
+    async def aflush(self, user_id: str):
+        await self.backend.aflush(user_id)
+
+    def on_indexed(self, callback):
+        self.backend.on_indexed(callback)
+
+    # --- Cache API ---
+
+    def invalidate(self, user_id: str):
+        """Drop the cached searches of a user."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """Report the hits, misses, hit rate, and the search time saved by the hits."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "saved_seconds": self.saved_seconds,
+            "entries": len(self._entries),
+        }
+
+    def _lookup(self, key: tuple[str, str]) -> tuple[list | None, int]:
+        """Return the cached results of a search, and the generation of the user."""
+        with self._lock:
+            generation = self._generations.get(key[0], 0)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_seconds += entry[2]
+                return entry[1], generation
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None, generation
+
+    def _store(self, key: tuple[str, str], generation: int, results: list, seconds: float):
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, results, seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
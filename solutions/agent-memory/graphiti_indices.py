@@ -0,0 +1,39 @@
+"""Manage the OpenSearch Serverless indices used by Graphiti.
+
+GraphitiBackend creates missing indices when it starts; this script checks or
+creates them ahead of a deployment, so that not even the first backend pays
+for it.
+
+Usage:
+    uv run python graphiti_indices.py check     # Report which indices exist
+    uv run python graphiti_indices.py create    # Create the missing indices
+    uv run python graphiti_indices.py recreate  # Delete and recreate all indices (drops their data)
+"""
+
+import argparse
+import asyncio
+import time
+
+from frameworks.graphiti_neptune import create_neptune_driver
+
+
+async def main(command: str):
+    driver = create_neptune_driver()
+    started = time.perf_counter()
+    if command == "check":
+        indices = {name: "exists" if exists else "missing" for name, exists in (await driver.index_status()).items()}
+    else:
+        if command == "recreate":
+            await driver.delete_aoss_indices()
+        indices = await driver.ensure_indices()
+    for name, state in indices.items():
+        print(f"{name:<24}{state}")
+    print(f"Done in {time.perf_counter() - started:.2f}s")
+    return all(state != "missing" for state in indices.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the Graphiti AOSS indices")
+    parser.add_argument("command", choices=["check", "create", "recreate"])
+    args = parser.parse_args()
+    raise SystemExit(0 if asyncio.run(main(args.command)) else 1)
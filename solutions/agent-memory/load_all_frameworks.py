@@ -1,7 +1,8 @@
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 from graphiti_core.nodes import EpisodeType
+from graphiti_core.utils.bulk_utils import RawEpisode
 from frameworks import *
 import logging
 import threading
@@ -41,9 +42,8 @@ async def load_cognee(user_id):
     cognee = CogneeDemo(user_id)
     await cognee.reset()
     logger.info("Cognee reset complete")
-    data = []
-    for msg in messages:
-        data = msg['content']        
+    # A single add followed by a single cognify processes all messages in one pipeline run
+    data = [msg['content'] for msg in messages]
     await cognee.add(data)
     await cognee.cognify()
     logger.info("Cognee load complete")
@@ -54,14 +54,21 @@ async def load_graphiti(user_id):
     graphiti = GraphitiDemo(user_id)
     await graphiti.reset()
     logger.info("Graphiti reset complete")
-    for index, msg in enumerate(messages):
-        resp = await graphiti.client.add_episode(
-                name=f'Msg_{index}_{msg["role"]}',
-                episode_body=msg['content'],
-                source=EpisodeType.message,
-                source_description=f'Msg_{index}_{msg["role"]}',
-                reference_time=datetime.utcnow(),
+    # Bulk ingestion extracts and deduplicates all messages together instead
+    # of running the full add_episode pipeline once per message. Reference
+    # times increase with the message index to keep the conversation order.
+    base_time = datetime.utcnow()
+    episodes = [
+        RawEpisode(
+            name=f'Msg_{index}_{msg["role"]}',
+            content=msg['content'],
+            source=EpisodeType.message,
+            source_description=f'Msg_{index}_{msg["role"]}',
+            reference_time=base_time + timedelta(microseconds=index),
         )
+        for index, msg in enumerate(messages)
+    ]
+    await graphiti.client.add_episode_bulk(episodes)
     await graphiti.client.build_communities()
     logger.info("Graphiti load complete")
     return graphiti
@@ -4,7 +4,10 @@ Exposes search_memory and add_memory as MCP tools that can be used by
 any MCP-compatible client (kiro-cli, Claude Code, Cursor, etc.).
 
 Configuration via environment variables:
-    MEMORY_FRAMEWORK - Backend: mem0, cognee, graphiti (default: mem0)
+    MEMORY_FRAMEWORK - Backend: mem0, cognee, graphiti, fusion (default: mem0)
+    MEMORY_WRITE_BEHIND - Ingest added memories in the background (default: false)
+    MEMORY_WARMUP - Build and warm up the backend when the server starts (default: true)
+    MEMORY_RESULT_TOKEN_BUDGET - Tokens of search results returned, 0 for raw results (default: 1000)
     BEDROCK_MODEL_ID - Bedrock model for the memory framework's LLM
     AWS_REGION - AWS region
     + Backend-specific endpoint vars (see .env.example)
@@ -13,25 +16,113 @@ Usage:
     uv run python mcp_server.py
 """
 
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("agentmemory")
+logger = logging.getLogger(__name__)
 
-# Lazy-loaded memory backend — initialized on first tool call to keep server
-# startup fast (kiro-cli has a timeout for MCP server initialization).
+# The memory backend is built in a background task, so that server startup
+# stays fast (kiro-cli has a timeout for MCP server initialization). With
+# MEMORY_WARMUP, the task starts with the server and also sends a probe search
+# that opens the Bedrock and database connections; otherwise it starts on the
+# first tool call. Tool calls only wait for the backend to be built.
 _memory = None
+_memory_task: asyncio.Task | None = None
+
+# User of the warm-up probe search, which has no memories
+WARMUP_USER_ID = "__warmup__"
+
+# Tools are async: FastMCP runs them on its event loop, so a slow memory call
+# for one user does not hold up the requests of other users.
 
 
-def _get_memory():
+async def _build_memory():
     global _memory
-    if _memory is None:
-        from frameworks.memory_backend import get_memory_backend
-        _memory = get_memory_backend()
+    started = time.perf_counter()
+    from frameworks import memory_backend
+    imported = time.perf_counter()
+    # Building a backend creates clients and connects synchronously, keep it off the event loop
+    _memory = await asyncio.to_thread(memory_backend.get_memory_backend)
+    logger.info(
+        f"Memory backend {type(_memory).__name__} ready in {time.perf_counter() - started:.2f}s "
+        f"(imports {imported - started:.2f}s, construction {time.perf_counter() - imported:.2f}s)"
+    )
     return _memory
 
 
+async def _get_memory():
+    global _memory_task
+    if _memory is not None:
+        return _memory
+    if _memory_task is None:
+        _memory_task = asyncio.create_task(_build_memory())
+    task = _memory_task
+    try:
+        # Shielded: a cancelled tool call must not cancel the build other calls wait on
+        return await asyncio.shield(task)
+    except Exception:
+        # Let the next tool call try again
+        if task.done() and _memory_task is task:
+            _memory_task = None
+        raise
+
+
+def _cache_stats(memory) -> dict:
+    """Collect the stats of the search cache in the backend's wrappers and of the process-wide caches."""
+    from frameworks.embedding_cache import get_embedding_cache
+    from frameworks.response_cache import get_response_cache
+    from frameworks.search_cache import CachedMemoryBackend
+
+    stats = {}
+    backend = memory
+    while backend is not None:
+        if isinstance(backend, CachedMemoryBackend):
+            stats["search"] = backend.stats()
+        backend = getattr(backend, "backend", None)
+    for name, cache in (("embedding", get_embedding_cache()), ("llm_response", get_response_cache())):
+        if cache is not None:
+            stats[name] = cache.stats()
+    return stats
+
+
+async def _warm_up():
+    started = time.perf_counter()
+    try:
+        memory = await _get_memory()
+        probe_started = time.perf_counter()
+        await memory.asearch("warm-up", WARMUP_USER_ID)
+        logger.info(f"Memory backend warm-up probe took {time.perf_counter() - probe_started:.2f}s")
+    except Exception as e:
+        logger.warning(f"Memory backend warm-up failed, tool calls will retry: {e!r}")
+    logger.info(f"Memory backend warm-up finished {time.perf_counter() - started:.2f}s after startup")
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    warm_up = None
+    if os.getenv("MEMORY_WARMUP", "true").lower() in ("true", "1", "yes"):
+        # Runs in the background while the server answers the client's initialization
+        warm_up = asyncio.create_task(_warm_up())
+    try:
+        yield
+    finally:
+        if warm_up is not None:
+            warm_up.cancel()
+        if _memory is not None:
+            logger.info(f"Memory cache stats at shutdown: {_cache_stats(_memory)}")
+
+
+mcp = FastMCP("agentmemory", lifespan=_lifespan)
+
+
 @mcp.tool()
-def search_memory(query: str, user_id: str):
+async def search_memory(query: str, user_id: str):
     """Search a user's stored memories for relevant information.
 
     Use this to recall past conversations, preferences, facts, or context
@@ -41,15 +132,24 @@ def search_memory(query: str, user_id: str):
         query: What to search for in the user's memories
         user_id: The user whose memories to search
     """
-    memory = _get_memory()
-    results = memory.search(query, user_id)
+    from frameworks.result_compaction import compact_results, result_token_budget
+
+    memory = await _get_memory()
+    results = await memory.asearch(query, user_id)
     if not results:
         return f"No memories found for user '{user_id}'. This user has no stored memories yet — use add_memory to start building their memory."
-    return str(results)
+    budget = result_token_budget()
+    if budget <= 0:
+        return str(results)
+    compacted = compact_results(results, budget)
+    response = json.dumps(compacted["memories"])
+    if compacted["omitted"]:
+        response += f"\n({compacted['omitted']} less relevant memories omitted, refine the query to see them)"
+    return response
 
 
 @mcp.tool()
-def add_memory(content: str, user_id: str):
+async def add_memory(content: str, user_id: str):
     """Store new information in a user's memory for future recall.
 
     Use this to save important facts, preferences, decisions, or context
@@ -59,10 +159,42 @@ def add_memory(content: str, user_id: str):
         content: The information to remember
         user_id: The user to store the memory for
     """
-    memory = _get_memory()
-    result = memory.add(content, user_id)
+    memory = await _get_memory()
+    result = await memory.aadd(content, user_id)
     return str(result)
 
 
+@mcp.tool()
+async def memory_ingestion_status(user_id: str = ""):
+    """Report how many added memories are still waiting to be stored.
+
+    Use this to check whether recently added memories are searchable yet,
+    or whether some of them failed to be stored.
+
+    Args:
+        user_id: The user to report on, or empty for all users
+    """
+    from frameworks.ingestion_queue import QueuedMemoryBackend
+
+    memory = await _get_memory()
+    if not isinstance(memory, QueuedMemoryBackend):
+        return "Write-behind ingestion is disabled: memories are stored as soon as they are added."
+    return str(memory.status(user_id or None))
+
+
+@mcp.tool()
+async def cache_stats():
+    """Report the hits, misses, hit rate and size of the memory caches.
+
+    Covers the search result cache, the embedding cache and the LLM response
+    cache, whichever are enabled.
+    """
+    memory = await _get_memory()
+    stats = _cache_stats(memory)
+    if not stats:
+        return "No memory cache is enabled."
+    return json.dumps(stats)
+
+
 if __name__ == "__main__":
     mcp.run()
@@ -13,6 +13,8 @@ def set_test_env(monkeypatch):
     monkeypatch.delenv("COGNEE_ENDPOINT", raising=False)
     monkeypatch.delenv("GRAPHITI_NEPTUNE_ENDPOINT", raising=False)
     monkeypatch.delenv("GRAPHITI_AOSS_ENDPOINT", raising=False)
+    # Keep the shared embedding cache out of the project directory
+    monkeypatch.setenv("EMBEDDING_CACHE", "false")
 
 
 def has_mem0_config():
@@ -0,0 +1,108 @@
+"""Tests for the pool of reusable sub-agents."""
+
+import threading
+from types import SimpleNamespace
+
+from tools.agent_pool import AgentPool
+
+
+def fake_agent(system_prompt, tools):
+    return SimpleNamespace(
+        system_prompt=system_prompt,
+        tools=tools,
+        messages=[],
+        state=None,
+        event_loop_metrics=None,
+        conversation_manager=SimpleNamespace(removed_message_count=0),
+    )
+
+
+class TestAgentPool:
+    def test_reuses_agents_with_a_blank_conversation(self):
+        """A borrowed agent should be reused by the next call, without the previous conversation."""
+        pool = AgentPool(factory=fake_agent)
+
+        with pool.agent("prompt", []) as first:
+            first.messages.append({"role": "user", "content": [{"text": "hi"}]})
+            first.conversation_manager.removed_message_count = 3
+        with pool.agent("prompt", []) as second:
+            assert second is first
+            assert second.messages == []
+            assert second.conversation_manager.removed_message_count == 0
+            assert second.state.get() == {}
+
+        assert pool.stats() == {"created": 1, "reused": 1, "idle": 1}
+
+    def test_agents_are_keyed_by_prompt_and_tools(self):
+        """Agents with another system prompt or tool set should not be shared."""
+        pool = AgentPool(factory=fake_agent)
+        tool = object()
+
+        with pool.agent("prompt", []) as plain:
+            pass
+        with pool.agent("prompt", [tool]) as with_tool:
+            assert with_tool is not plain
+            assert with_tool.tools == [tool]
+        with pool.agent("other", []) as other:
+            assert other is not plain
+
+    def test_concurrent_calls_get_distinct_agents(self):
+        """An agent borrowed by one call should not be handed to another."""
+        pool = AgentPool(factory=fake_agent)
+        borrowed = []
+        barrier = threading.Barrier(3)
+
+        def call():
+            with pool.agent("prompt", []) as agent:
+                borrowed.append(agent)
+                barrier.wait(timeout=5)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(agent) for agent in borrowed}) == 3
+
+    def test_keeps_at_most_max_idle_agents(self):
+        """Agents beyond max_idle should be dropped when they are returned."""
+        pool = AgentPool(factory=fake_agent, max_idle=1)
+
+        with pool.agent("prompt", []), pool.agent("prompt", []):
+            pass
+
+        assert pool.stats()["idle"] == 1
+
+    def test_agent_is_returned_when_the_call_fails(self):
+        """A failed call should still reset and return its agent."""
+        pool = AgentPool(factory=fake_agent)
+
+        try:
+            with pool.agent("prompt", []) as agent:
+                agent.messages.append({"role": "user", "content": []})
+                raise RuntimeError("model error")
+        except RuntimeError:
+            pass
+
+        with pool.agent("prompt", []) as again:
+            assert again is agent
+            assert again.messages == []
+
+    def test_discard_drops_agents_bound_to_the_tools(self):
+        """Agents of a discarded tool set should not be handed out again, even those in use."""
+        pool = AgentPool(factory=fake_agent)
+        old_tools, other_tools = [object()], [object()]
+
+        with pool.agent("prompt", old_tools) as in_use:
+            with pool.agent("prompt", old_tools):
+                pass
+            with pool.agent("prompt", other_tools) as other:
+                pass
+            pool.discard(old_tools)
+        assert pool.stats()["idle"] == 1
+
+        with pool.agent("prompt", old_tools) as fresh:
+            assert fresh is not in_use
+        with pool.agent("prompt", other_tools) as reused:
+            assert reused is other
@@ -0,0 +1,205 @@
+"""Tests for the debounced cognify scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from frameworks.cognify_scheduler import CognifyScheduler
+
+
+@pytest.fixture
+def cognee_mocks():
+    with patch("cognee.add", new_callable=AsyncMock) as add, \
+            patch("cognee.cognify", new_callable=AsyncMock) as cognify:
+        yield add, cognify
+
+
+class TestCognifyScheduler:
+    async def test_adds_are_cognified_once_after_the_quiet_period(self, cognee_mocks):
+        """Data added in quick succession should be cognified by a single run."""
+        add, cognify = cognee_mocks
+        scheduler = CognifyScheduler(quiet_period=0.05, max_pending=100)
+
+        for message in ("a", "b", "c"):
+            await scheduler.add(message, "Alice")
+        assert add.await_count == 3
+        cognify.assert_not_awaited()
+        assert scheduler.pending("Alice") == 3
+
+        await asyncio.sleep(0.2)
+        cognify.assert_awaited_once()
+        assert cognify.await_args.kwargs["datasets"] == ["Alice"]
+        assert scheduler.stats() == {"items": 3, "runs": 1, "pending": 0}
+
+    async def test_max_pending_triggers_a_cognify_right_away(self, cognee_mocks):
+        """Reaching max_pending items should cognify without waiting for the quiet period."""
+        _, cognify = cognee_mocks
+        scheduler = CognifyScheduler(quiet_period=60, max_pending=2)
+
+        await scheduler.add("a", "Alice")
+        await scheduler.add("b", "Alice")
+        await asyncio.sleep(0.05)
+
+        cognify.assert_awaited_once()
+        assert scheduler.pending("Alice") == 0
+
+    async def test_datasets_are_scheduled_independently(self, cognee_mocks):
+        """Flushing a dataset should not cognify the data of another one."""
+        _, cognify = cognee_mocks
+        scheduler = CognifyScheduler(quiet_period=60)
+
+        await scheduler.add("a", "Alice")
+        await scheduler.add("b", "Bob")
+        await scheduler.flush("Alice")
+
+        assert [c.kwargs["datasets"] for c in cognify.await_args_list] == [["Alice"]]
+        assert scheduler.pending("Bob") == 1
+
+    async def test_flush_without_pending_data_does_nothing(self, cognee_mocks):
+        """A flush with nothing pending should not run cognify."""
+        _, cognify = cognee_mocks
+        scheduler = CognifyScheduler(quiet_period=60)
+
+        await scheduler.flush("Alice")
+        await scheduler.add("a", "Alice")
+        await scheduler.flush("Alice")
+        await scheduler.flush("Alice")
+
+        cognify.assert_awaited_once()
+
+    async def test_flush_waits_for_a_running_cognify(self, cognee_mocks):
+        """A flush during a run should wait for it, then cognify the data added meanwhile."""
+        _, cognify = cognee_mocks
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_cognify(**kwargs):
+            started.set()
+            await release.wait()
+
+        cognify.side_effect = slow_cognify
+        scheduler = CognifyScheduler(quiet_period=60)
+        await scheduler.add("a", "Alice")
+        first = asyncio.create_task(scheduler.flush("Alice"))
+        await started.wait()
+
+        await scheduler.add("b", "Alice")
+        second = asyncio.create_task(scheduler.flush("Alice"))
+        await asyncio.sleep(0.01)
+        assert cognify.await_count == 1
+
+        release.set()
+        await asyncio.gather(first, second)
+        assert cognify.await_count == 2
+        assert scheduler.pending("Alice") == 0
+
+    async def test_failed_cognify_keeps_the_data_pending(self, cognee_mocks):
+        """Data of a failed run should be cognified by the next one."""
+        _, cognify = cognee_mocks
+        cognify.side_effect = [RuntimeError("throttled"), None]
+        scheduler = CognifyScheduler(quiet_period=60)
+
+        await scheduler.add("a", "Alice")
+        with pytest.raises(RuntimeError):
+            await scheduler.flush("Alice")
+        assert scheduler.pending("Alice") == 1
+
+        await scheduler.flush("Alice")
+        assert scheduler.pending("Alice") == 0
+        assert scheduler.runs == 1
+
+    async def test_completed_runs_notify_listeners(self, cognee_mocks):
+        """Listeners should be told when a dataset is cognified, and not when the run fails."""
+        _, cognify = cognee_mocks
+        cognify.side_effect = [RuntimeError("throttled"), None]
+        scheduler = CognifyScheduler(quiet_period=60)
+        cognified = []
+        scheduler.on_cognified(cognified.append)
+
+        await scheduler.add("a", "Alice")
+        with pytest.raises(RuntimeError):
+            await scheduler.flush("Alice")
+        assert cognified == []
+
+        await scheduler.flush("Alice")
+        assert cognified == ["Alice"]
+
+    async def test_failed_scheduled_cognify_is_retried_with_backoff(self, cognee_mocks):
+        """A scheduled run that fails should be scheduled again without waiting for new data."""
+        _, cognify = cognee_mocks
+        cognify.side_effect = [RuntimeError("throttled"), RuntimeError("throttled"), None]
+        scheduler = CognifyScheduler(quiet_period=0.01, retry_delay=0.05)
+
+        await scheduler.add("a", "Alice")
+        await asyncio.sleep(0.03)
+        assert cognify.await_count == 1
+        assert scheduler.pending("Alice") == 1
+
+        # Retried after 0.05s, then after 0.1s
+        await asyncio.sleep(0.1)
+        assert cognify.await_count == 2
+        await asyncio.sleep(0.15)
+        assert cognify.await_count == 3
+        assert scheduler.pending("Alice") == 0
+        assert scheduler.runs == 1
+
+
+class TestCogneeBackendCognify:
+    def _backend(self, cognify_before_search: bool):
+        from frameworks.memory_backend import BackgroundEventLoop, CogneeBackend
+
+        backend = CogneeBackend.__new__(CogneeBackend)
+        backend.cognify = CognifyScheduler(quiet_period=60)
+        backend.cognify_before_search = cognify_before_search
+        backend._loop = BackgroundEventLoop("test-cognee")
+        return backend
+
+    def test_search_cognifies_pending_data_first(self, cognee_mocks):
+        """A search should see the data added just before it."""
+        _, cognify = cognee_mocks
+        backend = self._backend(cognify_before_search=True)
+        try:
+            with patch("cognee.recall", new_callable=AsyncMock, return_value=["context"]) as recall:
+                result = backend.add("I like tea", "Alice")
+                assert result["pending_cognify"] == 1
+                cognify.assert_not_awaited()
+
+                assert backend.search("drinks", "Alice") == ["context"]
+            cognify.assert_awaited_once()
+            recall.assert_awaited_once()
+        finally:
+            backend._loop.close()
+
+    def test_search_can_skip_pending_cognify(self, cognee_mocks):
+        """With COGNIFY_BEFORE_SEARCH=false, a search should not wait for pending data."""
+        _, cognify = cognee_mocks
+        backend = self._backend(cognify_before_search=False)
+        try:
+            with patch("cognee.recall", new_callable=AsyncMock, return_value=[]):
+                backend.add("I like tea", "Alice")
+                backend.search("drinks", "Alice")
+            cognify.assert_not_awaited()
+
+            backend.flush("Alice")
+            cognify.assert_awaited_once()
+        finally:
+            backend._loop.close()
+
+    def test_cached_searches_are_dropped_once_cognified(self, cognee_mocks):
+        """A search cached before cognify should not hide the memory once it is searchable."""
+        from frameworks.search_cache import CachedMemoryBackend
+
+        backend = self._backend(cognify_before_search=False)
+        cached = CachedMemoryBackend(backend, ttl=60)
+        try:
+            with patch("cognee.recall", new_callable=AsyncMock, side_effect=[[], ["likes tea"]]) as recall:
+                cached.add("I like tea", "Alice")
+                assert cached.search("drinks", "Alice") == []
+                assert cached.search("drinks", "Alice") == []
+                assert recall.await_count == 1
+
+                backend.flush("Alice")
+                assert cached.search("drinks", "Alice") == ["likes tea"]
+        finally:
+            backend._loop.close()
@@ -0,0 +1,152 @@
+"""Unit tests for frameworks/embedding_cache.py - the shared embedding cache."""
+
+import pytest
+
+MODEL = "amazon.titan-embed-text-v2:0"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from frameworks.embedding_cache import EmbeddingCache
+    return EmbeddingCache(str(tmp_path), memory_entries=2)
+
+
+class Embedder:
+    """Counts the texts it is asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5, -1.0] for t in texts]
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_repeated_texts_are_not_embedded_again(self, cache):
+        """Only texts never seen before should reach the embedder."""
+        embed = Embedder()
+        first = cache.embed(MODEL, 3, True, ["a", "bb"], embed)
+        second = cache.embed(MODEL, 3, True, ["bb", "ccc", "a"], embed)
+
+        assert embed.calls == [["a", "bb"], ["ccc"]]
+        assert first == [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0]]
+        assert second == [[2.0, 0.5, -1.0], [3.0, 0.5, -1.0], [1.0, 0.5, -1.0]]
+
+    def test_duplicate_texts_in_a_batch_are_embedded_once(self, cache):
+        embed = Embedder()
+        assert len(cache.embed(MODEL, 3, True, ["a", "a", "b"], embed)) == 3
+        assert embed.calls == [["a", "b"]]
+
+    def test_key_includes_model_settings(self, cache):
+        """The same text embedded with other settings should be a different entry."""
+        embed = Embedder()
+        cache.embed(MODEL, 3, True, ["a"], embed)
+        cache.embed(MODEL, 3, False, ["a"], embed)
+        cache.embed("other-model", 3, True, ["a"], embed)
+        assert len(embed.calls) == 3
+
+    def test_evicted_embeddings_are_read_from_disk(self, cache):
+        """Embeddings evicted from the memory LRU should be served from the memory-mapped store."""
+        embed = Embedder()
+        cache.embed(MODEL, 3, True, ["a", "bb", "ccc"], embed)
+        assert cache.stats()["memory_entries"] == 2
+
+        assert cache.get_many(MODEL, 3, True, ["a"]) == [[1.0, 0.5, -1.0]]
+        assert cache.stats()["disk_hits"] == 1
+        assert len(embed.calls) == 1
+
+    def test_store_survives_a_restart(self, cache, tmp_path):
+        """A new cache on the same directory should serve the stored embeddings."""
+        from frameworks.embedding_cache import EmbeddingCache
+
+        cache.embed(MODEL, 3, True, [f"text {i}" for i in range(2000)], Embedder())
+
+        reopened = EmbeddingCache(str(tmp_path))
+        embed = Embedder()
+        assert reopened.embed(MODEL, 3, True, ["text 1999"], embed) == [[9.0, 0.5, -1.0]]
+        assert embed.calls == []
+
+    async def test_aembed_uses_the_async_embedder(self, cache):
+        calls = []
+
+        async def embed(texts):
+            calls.append(texts)
+            return [[1.0, 2.0, 3.0] for _ in texts]
+
+        await cache.aembed(MODEL, 3, True, ["a"], embed)
+        assert await cache.aembed(MODEL, 3, True, ["a"], embed) == [[1.0, 2.0, 3.0]]
+        assert calls == [["a"]]
+
+    async def test_bedrock_embedder_uses_the_cache(self, cache):
+        """BedrockEmbedder should only call Bedrock for texts not in the cache."""
+        from frameworks.graphiti_neptune import AdaptiveConcurrencyLimiter, BedrockEmbedder
+
+        embedder = BedrockEmbedder.__new__(BedrockEmbedder)
+        embedder.model_id = MODEL
+        embedder.dimensions = 3
+        embedder.max_retries = 0
+        embedder.limiter = AdaptiveConcurrencyLimiter(4)
+        embedder.cache = cache
+        embedder.embedded = 0
+        embedder.throttled = 0
+        invoked = []
+        embedder._invoke = lambda text: invoked.append(text) or [1.0, 2.0, 3.0]
+
+        await embedder.create("Alice")
+        await embedder.create_batch(["Alice", "Bob"])
+
+        assert invoked == ["Alice", "Bob"]
+        assert embedder.last_batch["cached"] == 1
+
+    def test_mem0_embedder_uses_the_cache(self, cache):
+        """Mem0 embedders wrapped by cache_mem0_embeddings should share the cache."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+        from frameworks.embedding_cache import cache_mem0_embeddings
+
+        embedder = SimpleNamespace(
+            config=SimpleNamespace(model=MODEL, embedding_dims=3),
+            embed=MagicMock(return_value=[1.0, 2.0, 3.0]),
+        )
+        original = embedder.embed
+        memory = SimpleNamespace(embedding_model=embedder, graph=None)
+        cache_mem0_embeddings(memory, cache)
+
+        assert embedder.embed("likes tea", "search") == [1.0, 2.0, 3.0]
+        assert embedder.embed("likes tea", "add") == [1.0, 2.0, 3.0]
+        original.assert_called_once_with("likes tea", "search")
+
+
+class TestCogneeEmbeddings:
+    """Tests for cache_cognee_embeddings."""
+
+    async def test_keeps_cognee_decorators_and_patches_once(self, cache, monkeypatch):
+        """Cache misses should go through Cognee's decorated method, once even if patched twice."""
+        import functools
+        from types import SimpleNamespace
+        from cognee.infrastructure.databases.vector.embeddings.LiteLLMEmbeddingEngine import LiteLLMEmbeddingEngine
+        from frameworks.embedding_cache import cache_cognee_embeddings
+
+        observed = []
+
+        async def embed_text(self, text):
+            return [[float(len(t)), 0.5, -1.0] for t in text]
+
+        @functools.wraps(embed_text)
+        async def observed_embed_text(self, text):
+            # Stands in for Cognee's @observe telemetry decorator
+            observed.append(list(text))
+            return await embed_text(self, text)
+
+        monkeypatch.setattr(LiteLLMEmbeddingEngine, "embed_text", observed_embed_text)
+        cache_cognee_embeddings(cache)
+        cache_cognee_embeddings(cache)
+
+        engine = SimpleNamespace(mock=False, model=f"bedrock/{MODEL}", dimensions=3)
+        assert await LiteLLMEmbeddingEngine.embed_text(engine, ["a", "bb"]) == [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0]]
+        await LiteLLMEmbeddingEngine.embed_text(engine, ["bb"])
+
+        assert observed == [["a", "bb"]]
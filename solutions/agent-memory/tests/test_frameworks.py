@@ -169,6 +169,256 @@ class TestGraphitiDemoAPI:
         assert inspect.iscoroutinefunction(GraphitiDemo.reset)
 
 
+class TestGraphitiNeptuneDriver:
+    """Tests for the Neptune driver used by Graphiti."""
+
+    @staticmethod
+    def params_cases():
+        from datetime import datetime
+
+        now = datetime(2025, 4, 1, 12, 30)
+        return [
+            {"uuid": "a", "created_at": now, "missing": None},
+            {"group_ids": ["Alice", "Bob"], "limit": 10},
+            {"dates": [now, now]},
+            {"names": ["The Tea", "coffee"]},
+            {"entity_data": {"uuid": "a", "created_at": now, "name_embedding": [0.1, 2, 0.3]}},
+            {"edges": [{"valid_at": now, "fact_embedding": [0.5, 0.25]}], "search_vector": [0.1, 0.2]},
+        ]
+
+    @pytest.mark.parametrize("case", range(6))
+    def test_sanitize_matches_neptune_driver(self, case):
+        """The fast sanitization should produce the same query and parameters as NeptuneDriver's."""
+        from graphiti_core.driver.neptune_driver import NeptuneDriver
+        from frameworks.graphiti_neptune import GraphitiNeptuneDriver
+
+        query = "MATCH (n) WHERE n.x IN $group_ids AND n.t IN $dates AND n.n IN $names RETURN $entity_data, $edges"
+        expected_params, params = self.params_cases()[case], self.params_cases()[case]
+
+        expected = NeptuneDriver._sanitize_parameters(NeptuneDriver.__new__(NeptuneDriver), query, expected_params)
+        driver = GraphitiNeptuneDriver.__new__(GraphitiNeptuneDriver)
+        assert driver._sanitize_parameters(query, params) == expected
+        assert params == expected_params
+
+    def test_run_query_sends_only_referenced_parameters(self):
+        """Unreferenced and None-valued parameters should not reach Neptune."""
+        from unittest.mock import MagicMock
+        from frameworks.graphiti_neptune import GraphitiNeptuneDriver
+
+        driver = GraphitiNeptuneDriver.__new__(GraphitiNeptuneDriver)
+        driver.client = MagicMock()
+        driver._run_query(
+            "MATCH (n {uuid: $uuid}) WHERE n.group_id IN $group_ids RETURN n",
+            {"uuid": "a", "name": "unused", "routing_": None, "params": {"group_ids": ["Alice"]}},
+        )
+        assert driver.client.query.call_args.kwargs["params"] == {"uuid": "a", "group_ids": ["Alice"]}
+
+
+class TestGraphitiIndices:
+    """Tests for the AOSS index bootstrap of the Neptune driver."""
+
+    @staticmethod
+    def driver(host: str, existing: set[str]):
+        import asyncio
+        from unittest.mock import MagicMock
+        from frameworks.graphiti_neptune import GraphitiNeptuneDriver
+
+        driver = GraphitiNeptuneDriver.__new__(GraphitiNeptuneDriver)
+        driver.aoss_host = host
+        driver._indices_lock = asyncio.Lock()
+        driver.aoss_client = MagicMock()
+        driver.aoss_client.indices.exists.side_effect = lambda index: index in existing
+        driver.aoss_client.indices.create.side_effect = lambda index, body: existing.add(index)
+        return driver
+
+    async def test_creates_missing_indices_once(self):
+        """Missing indices should be created, then not checked again by any driver of the process."""
+        from unittest.mock import AsyncMock, patch
+
+        driver = self.driver("create.example", {"community_name", "episode_content"})
+        with patch("frameworks.graphiti_neptune.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            states = await driver.ensure_indices()
+            sleep.assert_awaited_once()
+
+            assert states == {
+                "node_name_and_summary": "created",
+                "community_name": "exists",
+                "episode_content": "exists",
+                "edge_name_and_fact": "created",
+            }
+            other = self.driver("create.example", set())
+            assert set((await other.ensure_indices()).values()) == {"ready"}
+            other.aoss_client.indices.exists.assert_not_called()
+            sleep.assert_awaited_once()
+
+    async def test_existing_indices_need_no_wait(self):
+        """When all indices exist, the bootstrap should not wait for index creation."""
+        from unittest.mock import AsyncMock, patch
+        from graphiti_core.driver.neptune_driver import aoss_indices
+
+        driver = self.driver("existing.example", {index["index_name"] for index in aoss_indices})
+        with patch("frameworks.graphiti_neptune.asyncio.sleep", new_callable=AsyncMock) as sleep:
+            assert set((await driver.ensure_indices()).values()) == {"exists"}
+            sleep.assert_not_awaited()
+        driver.aoss_client.indices.create.assert_not_called()
+
+    async def test_deleting_indices_forgets_them(self):
+        """After delete_aoss_indices, build_indices_and_constraints should create the indices again."""
+        from unittest.mock import AsyncMock, patch
+        from graphiti_core.driver.neptune_driver import aoss_indices
+
+        existing = {index["index_name"] for index in aoss_indices}
+        driver = self.driver("delete.example", existing)
+        driver.aoss_client.indices.delete.side_effect = lambda index: existing.discard(index)
+        with patch("frameworks.graphiti_neptune.asyncio.sleep", new_callable=AsyncMock):
+            await driver.ensure_indices()
+            await driver.build_indices_and_constraints(delete_existing=True)
+        assert driver.aoss_client.indices.create.call_count == len(aoss_indices)
+        assert existing == {index["index_name"] for index in aoss_indices}
+
+
+@pytest.fixture
+def embedder():
+    """BedrockEmbedder whose blocking InvokeModel call is replaced by _invoke."""
+    from frameworks.graphiti_neptune import AdaptiveConcurrencyLimiter, BedrockEmbedder
+
+    embedder = BedrockEmbedder.__new__(BedrockEmbedder)
+    embedder.max_retries = 3
+    embedder.limiter = AdaptiveConcurrencyLimiter(4)
+    embedder.cache = None
+    embedder.embedded = 0
+    embedder.throttled = 0
+    embedder.retried = 0
+    embedder.last_batch = None
+    return embedder
+
+
+class TestBedrockEmbedder:
+    """Tests for the concurrent BedrockEmbedder."""
+
+    async def test_create_batch_keeps_input_order(self, embedder):
+        """Embeddings should come back in input order even when calls finish out of order."""
+        import random
+        import time
+
+        def invoke(text):
+            time.sleep(random.uniform(0, 0.02))
+            return [float(text)]
+
+        embedder._invoke = invoke
+        texts = [str(i) for i in range(20)]
+        assert await embedder.create_batch(texts) == [[float(i)] for i in range(20)]
+        assert embedder.last_batch["count"] == 20
+        assert embedder.last_batch["seconds"] > 0
+
+    async def test_create_batch_bounds_concurrency(self, embedder):
+        """No more than max_concurrency calls should be in flight, and they should overlap."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def invoke(text):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return [0.0]
+
+        embedder._invoke = invoke
+        await embedder.create_batch(["text"] * 16)
+        assert peak[0] == 4
+
+    async def test_create_does_not_block_the_event_loop(self, embedder):
+        """Other coroutines should run while an embedding call is in flight."""
+        import asyncio
+        import time
+
+        embedder._invoke = lambda text: time.sleep(0.1) or [0.0]
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(embedder.create("text"), ticker())
+        assert len(ticks) == 3 and ticks[-1] - ticks[0] < 0.09
+
+    async def test_throttling_lowers_concurrency_and_retries(self, embedder, monkeypatch):
+        """Throttled calls should halve the concurrency limit and be retried."""
+        import asyncio
+        from botocore.exceptions import ClientError
+
+        calls = []
+
+        def invoke(text):
+            calls.append(text)
+            if len(calls) == 1:
+                raise ClientError({"Error": {"Code": "ThrottlingException"}}, "InvokeModel")
+            return [1.0]
+
+        async def no_sleep(delay):
+            pass
+
+        embedder._invoke = invoke
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        assert await embedder.create("text") == [1.0]
+        assert len(calls) == 2
+        assert embedder.throttled == 1
+        assert embedder.limiter.limit == 2
+
+    @pytest.mark.parametrize("error", [
+        "InternalServerException",
+        "ModelTimeoutException",
+        "endpoint",
+        "read_timeout",
+    ])
+    async def test_transient_errors_are_retried_without_lowering_concurrency(self, embedder, monkeypatch, error):
+        """Connection errors, timeouts and 5xx errors should be retried with the concurrency limit kept."""
+        import asyncio
+        from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+        errors = {
+            "endpoint": EndpointConnectionError(endpoint_url="https://bedrock-runtime"),
+            "read_timeout": ReadTimeoutError(endpoint_url="https://bedrock-runtime"),
+        }
+        calls = []
+
+        def invoke(text):
+            calls.append(text)
+            if len(calls) == 1:
+                raise errors.get(error) or ClientError({"Error": {"Code": error}}, "InvokeModel")
+            return [1.0]
+
+        async def no_sleep(delay):
+            pass
+
+        embedder._invoke = invoke
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        assert await embedder.create("text") == [1.0]
+        assert len(calls) == 2
+        assert embedder.retried == 1
+        assert embedder.throttled == 0
+        assert embedder.limiter.limit == 4
+
+    async def test_other_errors_are_not_retried(self, embedder):
+        """Errors other than throttling and transient failures should reach the caller at once."""
+        from botocore.exceptions import ClientError
+
+        def invoke(text):
+            raise ClientError({"Error": {"Code": "ValidationException"}}, "InvokeModel")
+
+        embedder._invoke = invoke
+        with pytest.raises(ClientError):
+            await embedder.create("text")
+        assert embedder.limiter.limit == 4
+
+
 class TestStrandsAgentAPI:
     """Tests that validate strands-agents API compatibility."""
 
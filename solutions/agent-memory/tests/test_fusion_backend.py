@@ -0,0 +1,147 @@
+"""Unit tests for frameworks/fusion_backend.py - multi-framework search with rank fusion."""
+
+import asyncio
+import pytest
+
+
+class FakeBackend:
+    """Returns fixed results after a delay, or raises."""
+
+    def __init__(self, results=None, delay=0.0, error=None):
+        self.results = results if results is not None else []
+        self.delay = delay
+        self.error = error
+        self.added = []
+        self.flushed = []
+        self.listeners = []
+
+    async def asearch(self, query, user_id):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.results
+
+    async def aadd(self, content, user_id):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.added.append((user_id, content))
+        return {"status": "added"}
+
+    async def aadd_many(self, items, user_id):
+        for item in items:
+            await self.aadd(item, user_id)
+        return {"status": "added"}
+
+    async def aflush(self, user_id):
+        self.flushed.append(user_id)
+
+    def on_indexed(self, callback):
+        self.listeners.append(callback)
+
+
+@pytest.fixture
+def make_fusion():
+    from frameworks.fusion_backend import FusionBackend
+
+    backends = []
+
+    def make(backends_by_name, **kwargs):
+        backend = FusionBackend(backends_by_name, **kwargs)
+        backends.append(backend)
+        return backend
+
+    yield make
+    for backend in backends:
+        backend._loop.close()
+
+
+class TestReciprocalRankFusion:
+    """Tests for the result merging."""
+
+    def test_memories_found_by_several_backends_rank_first(self):
+        from frameworks.fusion_backend import reciprocal_rank_fusion
+
+        fused = reciprocal_rank_fusion({
+            "mem0": [{"memory": "Likes tea"}, {"memory": "Lives in Seattle"}],
+            "cognee": ["Travels to Japan", "likes tea."],
+        })
+        assert [entry["memory"] for entry in fused][0] == "Likes tea"
+        assert fused[0]["sources"] == ["mem0", "cognee"]
+        assert fused[0]["score"] == pytest.approx(1 / 61 + 1 / 62)
+        assert len(fused) == 3
+
+    def test_result_shapes_of_each_framework(self):
+        """Mem0 dicts, Graphiti edges and Cognee strings should all be understood."""
+        from types import SimpleNamespace
+        from frameworks.fusion_backend import item_text, result_items
+
+        assert result_items({"results": [{"memory": "a"}], "relations": []}) == [{"memory": "a"}]
+        assert result_items(None) == []
+        assert item_text({"memory": "likes tea"}) == "likes tea"
+        assert item_text(SimpleNamespace(fact="Alice likes tea")) == "Alice likes tea"
+        assert item_text("context") == "context"
+
+
+class TestFusionBackend:
+    """Tests for FusionBackend."""
+
+    async def test_searches_run_concurrently(self, make_fusion):
+        fusion = make_fusion({
+            "a": FakeBackend(["one"], delay=0.2),
+            "b": FakeBackend(["two"], delay=0.2),
+        })
+        started = asyncio.get_running_loop().time()
+        results = await fusion.asearch("query", "Alice")
+        assert asyncio.get_running_loop().time() - started < 0.35
+        assert {r["memory"] for r in results} == {"one", "two"}
+
+    async def test_slow_backend_returns_partial_results(self, make_fusion):
+        fusion = make_fusion(
+            {"fast": FakeBackend(["one"]), "slow": FakeBackend(["two"], delay=5)},
+            timeout={"fast": 1, "slow": 0.05},
+        )
+        results = await fusion.asearch("query", "Alice")
+        assert [r["memory"] for r in results] == ["one"]
+
+    def test_failing_backend_returns_partial_results(self, make_fusion):
+        fusion = make_fusion({"ok": FakeBackend(["one"]), "broken": FakeBackend(error=ConnectionError("down"))})
+        assert [r["memory"] for r in fusion.search("query", "Alice")] == ["one"]
+
+    def test_all_backends_failing_raises(self, make_fusion):
+        fusion = make_fusion({"broken": FakeBackend(error=ConnectionError("down"))})
+        with pytest.raises(RuntimeError):
+            fusion.search("query", "Alice")
+
+    def test_writes_fan_out_to_all_backends(self, make_fusion):
+        a, b = FakeBackend(delay=0.1), FakeBackend(delay=0.1)
+        fusion = make_fusion({"a": a, "b": b})
+        result = fusion.add("likes tea", "Alice")
+        assert a.added == b.added == [("Alice", "likes tea")]
+        assert result["backends"] == {"a": "added", "b": "added"}
+
+    def test_failed_write_is_reported_per_backend(self, make_fusion):
+        ok = FakeBackend()
+        fusion = make_fusion({"ok": ok, "broken": FakeBackend(error=ConnectionError("down"))})
+        result = fusion.add_many(["a", "b"], "Alice")
+        assert result["backends"]["ok"] == "added"
+        assert result["backends"]["broken"].startswith("failed")
+        assert len(ok.added) == 2
+
+    def test_get_memory_backend_rejects_unknown_fusion_frameworks(self, monkeypatch):
+        from frameworks.memory_backend import get_memory_backend
+
+        monkeypatch.setenv("MEMORY_FRAMEWORK", "fusion")
+        monkeypatch.setenv("MEMORY_FUSION_FRAMEWORKS", "mem0,letta")
+        with pytest.raises(ValueError, match="letta"):
+            get_memory_backend()
+
+    def test_flush_and_indexing_listeners_reach_every_backend(self, make_fusion):
+        """Read-your-writes flushes and cache invalidation should cover each fused framework."""
+        backends = {"a": FakeBackend(), "b": FakeBackend()}
+        fusion = make_fusion(backends)
+        fusion.on_indexed(print)
+        fusion.flush("Alice")
+
+        assert [backend.flushed for backend in backends.values()] == [["Alice"], ["Alice"]]
+        assert [backend.listeners for backend in backends.values()] == [[print], [print]]
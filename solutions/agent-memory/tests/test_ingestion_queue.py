@@ -0,0 +1,225 @@
+"""Unit tests for frameworks/ingestion_queue.py - the durable write-behind queue."""
+
+import threading
+import time
+import pytest
+
+
+class FakeBackend:
+    """Records added memories; add() blocks while the gate is closed."""
+
+    def __init__(self, failures: int = 0):
+        self.added = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.failures = failures
+        self.searched = []
+        self.batches = []
+        self.flushed = []
+
+    def add(self, content, user_id):
+        self.gate.wait(5)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Neptune unavailable")
+        self.added.append((user_id, content))
+        return {"status": "added"}
+
+    def add_many(self, items, user_id):
+        self.batches.append((user_id, items))
+        for content in items:
+            self.add(content, user_id)
+        return {"status": "added", "count": len(items)}
+
+    def search(self, query, user_id):
+        self.searched.append([c for u, c in self.added if u == user_id])
+        return []
+
+    async def asearch(self, query, user_id):
+        return self.search(query, user_id)
+
+    def flush(self, user_id):
+        self.flushed.append([c for u, c in self.added if u == user_id])
+
+    async def aflush(self, user_id):
+        self.flush(user_id)
+
+    def on_indexed(self, callback):
+        pass
+
+
+@pytest.fixture
+def make_queue(tmp_path):
+    from frameworks.ingestion_queue import QueuedMemoryBackend
+
+    queues = []
+
+    def make(backend, **kwargs):
+        queue = QueuedMemoryBackend(backend, path=str(tmp_path / "queue.sqlite3"), **kwargs)
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close(5)
+
+
+class TestQueuedMemoryBackend:
+    """Tests for QueuedMemoryBackend."""
+
+    def test_add_returns_before_ingestion(self, make_queue):
+        """add() should return a queued job id while the backend is still busy."""
+        backend = FakeBackend()
+        backend.gate.clear()
+        queue = make_queue(backend)
+
+        result = queue.add("likes tea", "Alice")
+        assert result["status"] == "queued"
+        assert queue.job_status(result["job_id"])["status"] in ("pending", "running")
+
+        backend.gate.set()
+        assert queue.wait_for("Alice", 5)
+        assert backend.added == [("Alice", "likes tea")]
+        assert queue.job_status(result["job_id"])["status"] == "done"
+
+    def test_memories_of_a_user_are_ingested_in_order(self, make_queue):
+        """Several workers should never reorder the memories of one user."""
+        backend = FakeBackend()
+        queue = make_queue(backend, workers=4)
+
+        for i in range(20):
+            queue.add(f"a{i}", "Alice")
+            queue.add(f"b{i}", "Bob")
+        assert queue.wait_for("Alice", 5) and queue.wait_for("Bob", 5)
+
+        assert [c for u, c in backend.added if u == "Alice"] == [f"a{i}" for i in range(20)]
+        assert [c for u, c in backend.added if u == "Bob"] == [f"b{i}" for i in range(20)]
+
+    def test_status_reports_counts_and_lag(self, make_queue):
+        """status() should count queued memories and report the age of the oldest one."""
+        backend = FakeBackend()
+        backend.gate.clear()
+        queue = make_queue(backend, workers=1)
+
+        queue.add("first", "Alice")
+        queue.add("second", "Alice")
+        time.sleep(0.05)
+        status = queue.status("Alice")
+        assert status["pending"] + status["running"] == 2
+        assert status["lag_seconds"] > 0
+        assert queue.status("Bob")["pending"] == 0
+
+        backend.gate.set()
+        queue.wait_for("Alice", 5)
+        assert queue.status() == {"pending": 0, "running": 0, "done": 2, "failed": 0, "lag_seconds": 0.0}
+
+    def test_read_your_writes_search_waits_for_queued_memories(self, make_queue):
+        """With read-your-writes consistency a search should see the user's earlier adds."""
+        from frameworks.ingestion_queue import READ_YOUR_WRITES
+
+        backend = FakeBackend()
+        queue = make_queue(backend, consistency=READ_YOUR_WRITES)
+
+        queue.add("likes tea", "Alice")
+        queue.search("drinks", "Alice")
+        assert backend.searched == [["likes tea"]]
+
+    async def test_read_your_writes_search_flushes_background_indexing(self, make_queue):
+        """Once ingested, the memories a backend still indexes in the background should be flushed first."""
+        from frameworks.ingestion_queue import READ_YOUR_WRITES
+
+        backend = FakeBackend()
+        queue = make_queue(backend, consistency=READ_YOUR_WRITES)
+
+        queue.add("likes tea", "Alice")
+        await queue.asearch("drinks", "Alice")
+        assert backend.flushed == [["likes tea"]]
+
+    def test_eventual_search_does_not_flush(self, make_queue):
+        backend = FakeBackend()
+        queue = make_queue(backend)
+
+        queue.search("drinks", "Alice")
+        assert backend.flushed == []
+
+    def test_rejects_unknown_consistency(self, make_queue):
+        with pytest.raises(ValueError):
+            make_queue(FakeBackend(), consistency="strong")
+
+    def test_failed_memory_is_retried(self, make_queue):
+        """A memory should be retried after a failure, without being reordered."""
+        backend = FakeBackend(failures=1)
+        queue = make_queue(backend, workers=2, retry_delay=0.05)
+
+        job_id = queue.add("first", "Alice")["job_id"]
+        queue.add("second", "Alice")
+        assert queue.wait_for("Alice", 5)
+
+        assert backend.added == [("Alice", "first"), ("Alice", "second")]
+        assert queue.job_status(job_id)["attempts"] == 2
+
+    def test_failed_memory_is_marked_failed(self, make_queue):
+        """A memory that keeps failing should be marked failed after max_attempts."""
+        backend = FakeBackend(failures=10)
+        queue = make_queue(backend, max_attempts=2, retry_delay=0)
+
+        job_id = queue.add("likes tea", "Alice")["job_id"]
+        assert queue.wait_for("Alice", 10)
+
+        job = queue.job_status(job_id)
+        assert job["status"] == "failed"
+        assert job["attempts"] == 2
+        assert "Neptune unavailable" in job["error"]
+
+    def test_queued_memories_survive_a_restart(self, make_queue):
+        """Memories left in the queue when the process stops should be ingested on the next start."""
+        backend = FakeBackend()
+        backend.gate.clear()
+        queue = make_queue(backend, workers=1)
+        queue.add("first", "Alice")
+        queue.add("second", "Alice")
+        # Simulate a crash: workers are gone while the first memory is running
+        queue._closed = True
+        with queue._lock:
+            queue._changed.notify_all()
+
+        restarted_backend = FakeBackend()
+        restarted = make_queue(restarted_backend)
+        assert restarted.wait_for("Alice", 5)
+        assert [c for u, c in restarted_backend.added] == ["first", "second"]
+        backend.gate.set()
+
+    def test_ingested_memories_are_deleted_after_the_retention(self, make_queue):
+        """Done jobs should not accumulate in the queue."""
+        backend = FakeBackend()
+        queue = make_queue(backend, done_retention=0)
+
+        job_id = queue.add("likes tea", "Alice")["job_id"]
+        assert queue.wait_for("Alice", 5)
+
+        assert queue.job_status(job_id) is None
+        assert queue.status()["done"] == 0
+
+    def test_old_ingested_memories_are_pruned_on_start(self, make_queue):
+        backend = FakeBackend()
+        queue = make_queue(backend)
+        job_id = queue.add("likes tea", "Alice")["job_id"]
+        assert queue.wait_for("Alice", 5)
+        assert queue.job_status(job_id)["status"] == "done"
+        queue.close(5)
+
+        restarted = make_queue(FakeBackend(), done_retention=0)
+        assert restarted.job_status(job_id) is None
+
+    def test_add_many_is_ingested_as_one_batch(self, make_queue):
+        """A queued batch should reach the backend's add_many once, not add per item."""
+        backend = FakeBackend()
+        queue = make_queue(backend)
+
+        result = queue.add_many(["likes tea", "lives in Paris"], "Alice")
+        assert result["count"] == 2
+        assert queue.wait_for("Alice", 5)
+
+        assert backend.batches == [("Alice", ["likes tea", "lives in Paris"])]
+        assert queue.job_status(result["job_id"])["status"] == "done"
+        assert queue.status()["done"] == 1
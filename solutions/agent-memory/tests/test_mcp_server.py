@@ -0,0 +1,107 @@
+"""Tests for the MCP server's background build and warm-up of the memory backend."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# The server is written against FastMCP, which mcp 2.x renamed
+pytest.importorskip("mcp.server.fastmcp")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    import mcp_server
+
+    monkeypatch.setattr(mcp_server, "_memory", None)
+    monkeypatch.setattr(mcp_server, "_memory_task", None)
+    return mcp_server
+
+
+@pytest.fixture
+def backend():
+    # Not a MagicMock: the shutdown stats walk the chain of wrapped backends
+    return SimpleNamespace(asearch=AsyncMock(return_value=[]))
+
+
+@pytest.fixture
+def build(backend):
+    """get_memory_backend, taking a little while like a real backend construction."""
+    def slow_build():
+        time.sleep(0.05)
+        return backend
+
+    with patch("frameworks.memory_backend.get_memory_backend", side_effect=slow_build) as get_memory_backend:
+        yield get_memory_backend
+
+
+class TestGetMemory:
+    async def test_concurrent_calls_wait_on_a_single_build(self, server, build, backend):
+        """Tool calls arriving during the build should all get the backend it builds."""
+        memories = await asyncio.gather(*(server._get_memory() for _ in range(5)))
+
+        assert memories == [backend] * 5
+        build.assert_called_once()
+        assert await server._get_memory() is backend
+        build.assert_called_once()
+
+    async def test_failed_build_is_retried_by_the_next_call(self, server, build, backend):
+        """A build that fails should not be cached; the next tool call builds again."""
+        build.side_effect = [RuntimeError("Neptune unreachable"), backend]
+
+        with pytest.raises(RuntimeError):
+            await server._get_memory()
+        assert server._memory_task is None
+
+        assert await server._get_memory() is backend
+        assert build.call_count == 2
+
+    async def test_cancelled_call_does_not_cancel_the_build(self, server, build, backend):
+        """A tool call cancelled by its client should leave the build running for the others."""
+        call = asyncio.create_task(server._get_memory())
+        await asyncio.sleep(0.01)
+        call.cancel()
+
+        assert await server._get_memory() is backend
+        build.assert_called_once()
+
+
+class TestWarmUp:
+    async def test_warm_up_builds_and_probes_the_backend(self, server, build, backend):
+        await server._warm_up()
+
+        build.assert_called_once()
+        backend.asearch.assert_awaited_once_with("warm-up", server.WARMUP_USER_ID)
+
+    async def test_failed_warm_up_is_left_to_tool_calls(self, server, build, backend):
+        """A warm-up failure should be logged, and the backend built by the next tool call."""
+        build.side_effect = [RuntimeError("Neptune unreachable"), backend]
+
+        await server._warm_up()
+
+        assert server._memory is None
+        assert await server._get_memory() is backend
+
+    async def test_lifespan_warms_up_in_the_background(self, server, build, backend, monkeypatch):
+        monkeypatch.setenv("MEMORY_WARMUP", "true")
+
+        async with server._lifespan(None):
+            # Startup does not wait for the build
+            build.assert_not_called()
+            await asyncio.sleep(0.2)
+            build.assert_called_once()
+            backend.asearch.assert_awaited_once()
+
+    async def test_warm_up_disabled_defers_the_build(self, server, build, backend, monkeypatch):
+        """With MEMORY_WARMUP=false the backend should only be built by the first tool call."""
+        monkeypatch.setenv("MEMORY_WARMUP", "false")
+
+        async with server._lifespan(None):
+            await asyncio.sleep(0.2)
+            build.assert_not_called()
+
+            assert await server._get_memory() is backend
+        build.assert_called_once()
+        backend.asearch.assert_not_awaited()
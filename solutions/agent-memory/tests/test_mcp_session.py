@@ -0,0 +1,116 @@
+"""Tests for the long-lived MCP client session."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from tools.mcp_session import MCPSession
+
+
+def fake_client_factory(clients: list):
+    def create():
+        client = MagicMock()
+        client.list_tools_sync.return_value = [f"tool-{len(clients)}"]
+        clients.append(client)
+        return client
+    return create
+
+
+class TestMCPSession:
+    def test_starts_once_and_reuses_the_tool_list(self):
+        """The server should be started on first use and its tools reused by later calls."""
+        clients = []
+        session = MCPSession(fake_client_factory(clients), health_check_interval=60)
+
+        first = session.tools()
+        second = session.tools()
+
+        assert first is second
+        assert len(clients) == 1
+        clients[0].start.assert_called_once()
+        clients[0].list_tools_sync.assert_called_once()
+
+    def test_restarts_a_server_that_stopped_answering(self):
+        """A failed health check should stop the client and start a new one."""
+        clients = []
+        session = MCPSession(fake_client_factory(clients), health_check_interval=0)
+
+        session.tools()
+        clients[0].list_tools_sync.side_effect = RuntimeError("broken pipe")
+
+        assert session.tools() == ["tool-1"]
+        clients[0].stop.assert_called_once()
+        assert session.starts == 2
+
+    def test_health_check_only_after_the_interval(self):
+        """Within the interval, uses should not send any request to the server."""
+        clients = []
+        session = MCPSession(fake_client_factory(clients), health_check_interval=60)
+
+        session.tools()
+        session.tools()
+        assert clients[0].list_tools_sync.call_count == 1
+
+        session.mark_unhealthy()
+        session.tools()
+        assert clients[0].list_tools_sync.call_count == 2
+        assert session.starts == 1
+
+    def test_failed_start_is_retried_by_the_next_use(self):
+        """A server that fails to start should be started again on the next use."""
+        clients = []
+        create = fake_client_factory(clients)
+
+        def flaky():
+            client = create()
+            if len(clients) == 1:
+                client.list_tools_sync.side_effect = RuntimeError("handshake failed")
+            return client
+
+        session = MCPSession(flaky)
+        with pytest.raises(RuntimeError):
+            session.tools()
+        clients[0].stop.assert_called_once()
+
+        assert session.tools() == ["tool-1"]
+
+    def test_concurrent_uses_share_one_session(self):
+        """Concurrent first uses should start a single server."""
+        clients = []
+        session = MCPSession(fake_client_factory(clients))
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(session.tools())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(clients) == 1
+        assert all(tools is results[0] for tools in results)
+
+    def test_close_stops_the_server(self):
+        """close() should stop the client, and the next use should start a new one."""
+        clients = []
+        session = MCPSession(fake_client_factory(clients))
+
+        session.tools()
+        session.close()
+        clients[0].stop.assert_called_once()
+
+        session.tools()
+        assert len(clients) == 2
+
+    def test_restart_hands_the_dead_tools_to_on_stop(self):
+        """Whatever was built on the tools of a stopped server should be told to let go of them."""
+        clients = []
+        stopped = []
+        session = MCPSession(fake_client_factory(clients), health_check_interval=0, on_stop=stopped.append)
+
+        first = session.tools()
+        clients[0].list_tools_sync.side_effect = RuntimeError("broken pipe")
+        second = session.tools()
+        session.close()
+
+        assert stopped == [first, second]
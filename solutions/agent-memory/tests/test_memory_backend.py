@@ -0,0 +1,202 @@
+"""Unit tests for frameworks/memory_backend.py - backend plumbing shared by all frameworks."""
+
+import asyncio
+import threading
+import pytest
+
+
+class TestBackgroundEventLoop:
+    """Tests for the persistent event loop used by the async backends."""
+
+    def test_runs_coroutines_on_the_same_loop(self):
+        """Every call should run on the same long-lived loop and thread."""
+        from frameworks.memory_backend import BackgroundEventLoop
+
+        async def where():
+            return asyncio.get_running_loop(), threading.current_thread().name
+
+        loop = BackgroundEventLoop("test-memory")
+        try:
+            first = loop.run(where())
+            second = loop.run(where())
+            assert first == second
+            assert first[1] == "test-memory"
+        finally:
+            loop.close()
+
+    async def test_can_be_called_while_a_loop_is_running(self):
+        """Sync callers inside a running loop (e.g. async agents) should not need asyncio.run."""
+        from frameworks.memory_backend import BackgroundEventLoop
+
+        async def answer():
+            return 42
+
+        loop = BackgroundEventLoop("test-memory")
+        try:
+            assert loop.run(answer()) == 42
+        finally:
+            loop.close()
+
+    def test_propagates_exceptions(self):
+        """Exceptions raised by the coroutine should reach the caller."""
+        from frameworks.memory_backend import BackgroundEventLoop
+
+        async def fail():
+            raise KeyError("missing")
+
+        loop = BackgroundEventLoop("test-memory")
+        try:
+            with pytest.raises(KeyError):
+                loop.run(fail())
+        finally:
+            loop.close()
+
+    def test_rejects_blocking_from_its_own_thread(self):
+        """Blocking on the loop from a coroutine running on it would deadlock."""
+        from frameworks.memory_backend import BackgroundEventLoop
+
+        async def noop():
+            return None
+
+        loop = BackgroundEventLoop("test-memory")
+
+        async def reenter():
+            return loop.run(noop())
+
+        try:
+            with pytest.raises(RuntimeError):
+                loop.run(reenter())
+        finally:
+            loop.close()
+
+
+@pytest.fixture
+def graphiti_backend():
+    """GraphitiBackend wired to a mocked Graphiti client, without real infrastructure."""
+    from unittest.mock import AsyncMock, MagicMock
+    from frameworks.memory_backend import BackgroundEventLoop, GraphitiBackend
+
+    backend = GraphitiBackend.__new__(GraphitiBackend)
+    backend._demo = MagicMock()
+    backend._demo.client.search = AsyncMock(return_value=["fact"])
+    backend._demo.client.add_episode = AsyncMock()
+    backend._demo.client.add_episode_bulk = AsyncMock()
+    backend._loop = BackgroundEventLoop("test-graphiti")
+    yield backend
+    backend._loop.close()
+
+
+class TestAsyncBackendAPI:
+    """Tests for the native async asearch / aadd / aadd_many API."""
+
+    def test_async_methods_are_abstract(self):
+        """Every backend must implement the async API."""
+        from frameworks.memory_backend import MemoryBackend
+        assert {"asearch", "aadd", "aadd_many"} <= MemoryBackend.__abstractmethods__
+
+    async def test_mem0_asearch_uses_async_memory(self):
+        """Mem0Backend.asearch should await the AsyncMemory client."""
+        from unittest.mock import AsyncMock, MagicMock
+        from frameworks.memory_backend import Mem0Backend
+
+        backend = Mem0Backend.__new__(Mem0Backend)
+        backend._async_client = MagicMock()
+        backend._async_client.search = AsyncMock(return_value=[{"memory": "likes tea"}])
+
+        assert await backend.asearch("drinks", "Alice") == [{"memory": "likes tea"}]
+        backend._async_client.search.assert_awaited_once_with("drinks", user_id="Alice")
+
+    async def test_mem0_aadd_many_sends_one_conversation(self):
+        """Mem0Backend.aadd_many should add all items in a single call."""
+        from unittest.mock import AsyncMock, MagicMock
+        from frameworks.memory_backend import Mem0Backend
+
+        backend = Mem0Backend.__new__(Mem0Backend)
+        backend._async_client = MagicMock()
+        backend._async_client.add = AsyncMock(return_value={"results": []})
+
+        await backend.aadd_many(["a", "b"], "Alice")
+        backend._async_client.add.assert_awaited_once_with(
+            [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}], user_id="Alice"
+        )
+
+    async def test_graphiti_asearch_runs_on_the_backend_loop(self, graphiti_backend):
+        """Graphiti calls should run on the backend's loop, not the caller's."""
+        threads = []
+
+        async def search(query, group_ids):
+            threads.append(threading.current_thread().name)
+            return ["fact"]
+
+        graphiti_backend._demo.client.search.side_effect = search
+        assert await graphiti_backend.asearch("query", "Alice") == ["fact"]
+        assert threads == ["test-graphiti"]
+
+    async def test_graphiti_aadd_many_adds_episodes_in_bulk(self, graphiti_backend):
+        """Episodes should be added with the bulk API, in order."""
+        result = await graphiti_backend.aadd_many(["first", "second"], "Alice")
+
+        call = graphiti_backend._demo.client.add_episode_bulk.await_args
+        episodes = call.args[0]
+        assert [e.content for e in episodes] == ["first", "second"]
+        assert episodes[0].reference_time < episodes[1].reference_time
+        assert call.kwargs["group_id"] == "Alice"
+        assert result["count"] == 2
+        graphiti_backend._demo.client.add_episode.assert_not_called()
+
+
+class TestAddMany:
+    """Tests for the bulk add_many API."""
+
+    def test_chunk_items_limits_items_and_characters(self):
+        """Chunks should respect both limits and keep the items in order."""
+        from frameworks.memory_backend import chunk_items
+
+        assert chunk_items(["a", "b", "c"], max_items=2, max_chars=100) == [["a", "b"], ["c"]]
+        assert chunk_items(["aaa", "bbb", "c"], max_items=10, max_chars=5) == [["aaa"], ["bbb", "c"]]
+        assert chunk_items(["a" * 10, "b"], max_items=10, max_chars=5) == [["a" * 10], ["b"]]
+        assert chunk_items([], max_items=10, max_chars=5) == []
+
+    def test_mem0_add_many_sends_one_conversation_per_chunk(self):
+        """Mem0Backend.add_many should send each chunk as a multi-message add and report throughput."""
+        from unittest.mock import MagicMock
+        from frameworks.memory_backend import Mem0Backend
+
+        backend = Mem0Backend.__new__(Mem0Backend)
+        backend._demo = MagicMock()
+        backend.max_chunk_items = 2
+
+        result = backend.add_many(["a", "b", "c"], "Alice")
+
+        calls = backend._demo.client.add.call_args_list
+        assert [c.args[0] for c in calls] == [
+            [{"role": "user", "content": "a"}, {"role": "user", "content": "b"}],
+            [{"role": "user", "content": "c"}],
+        ]
+        assert result["count"] == 3
+        assert result["chunks"] == 2
+        assert result["messages_per_second"] > 0
+
+    def test_cognee_add_many_runs_one_add_and_one_cognify(self):
+        """CogneeBackend.add_many should ingest all items with a single add and a single cognify."""
+        from unittest.mock import AsyncMock, patch
+        from frameworks.cognify_scheduler import CognifyScheduler
+        from frameworks.memory_backend import BackgroundEventLoop, CogneeBackend
+
+        backend = CogneeBackend.__new__(CogneeBackend)
+        backend.cognify = CognifyScheduler()
+        backend._loop = BackgroundEventLoop("test-cognee")
+        try:
+            with patch("cognee.add", new_callable=AsyncMock) as add, \
+                    patch("cognee.cognify", new_callable=AsyncMock) as cognify:
+                result = backend.add_many(["a", "b", "c"], "Alice")
+
+            add.assert_awaited_once()
+            assert add.await_args.args[0] == ["a", "b", "c"]
+            assert add.await_args.kwargs["dataset_name"] == "Alice"
+            cognify.assert_awaited_once()
+            assert cognify.await_args.kwargs["datasets"] == ["Alice"]
+            assert result["count"] == 3
+            assert backend.cognify.pending("Alice") == 0
+        finally:
+            backend._loop.close()
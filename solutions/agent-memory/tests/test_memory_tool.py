@@ -6,14 +6,15 @@ either real infrastructure or patching Memory.from_config before import.
 
 import sys
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 @pytest.fixture
 def mock_memory_module(monkeypatch):
     """Import memory_tool with Mem0Demo fully mocked to avoid needing real infra.
 
-    This patches Memory.from_config before memory_tool.py's Mem0Backend initialization.
+    This patches Memory.from_config before memory_tool.py's Mem0Backend initialization,
+    and replaces the backend's AsyncMemory client used by the async tools.
     """
     # Ensure we use the mem0 backend for these tests
     monkeypatch.setenv("MEMORY_FRAMEWORK", "mem0")
@@ -24,59 +25,72 @@ def mock_memory_module(monkeypatch):
             del sys.modules[mod_name]
 
     mock_client = MagicMock()
-    mock_client.search.return_value = [{"memory": "likes hiking", "score": 0.9}]
-    mock_client.add.return_value = {"id": "mem_123"}
+    mock_client.search = AsyncMock(return_value=[{"memory": "likes hiking", "score": 0.9}])
+    mock_client.add = AsyncMock(return_value={"id": "mem_123"})
 
-    with patch("mem0.memory.main.Memory.from_config", return_value=mock_client):
+    with patch("mem0.memory.main.Memory.from_config", return_value=MagicMock()):
         import tools.memory_tool as mt
-        # The memory backend is a Mem0Backend with _demo.client
-        mt.memory._demo.client = mock_client
+        # The memory tools go through the Mem0Backend's AsyncMemory client
+        mt.memory._async_client = mock_client
         yield mt, mock_client
 
 
 class TestSearchMemory:
     """Tests for the search_memory tool function."""
 
-    def test_search_memory_calls_client_with_user_id(self, mock_memory_module):
+    async def test_search_memory_calls_client_with_user_id(self, mock_memory_module):
         """search_memory should pass user_id directly (mem0 1.x API)."""
         mt, mock_client = mock_memory_module
 
         mt.memory_agent.state.set("user_id", "Alice")
         # Call the underlying function via __wrapped__
-        result = mt.search_memory.__wrapped__(query="what do I like?")
+        result = await mt.search_memory.__wrapped__(query="what do I like?")
 
         mock_client.search.assert_called_once_with(
             "what do I like?", user_id="Alice"
         )
 
-    def test_search_memory_returns_results(self, mock_memory_module):
-        """search_memory should return whatever the client returns."""
+    async def test_search_memory_returns_compact_results(self, mock_memory_module):
+        """search_memory should return the client's results compacted to fact and score."""
         mt, mock_client = mock_memory_module
+        mock_client.search.return_value = [
+            {"id": "mem_1", "memory": "prefers window seats", "hash": "abc", "score": 0.95}
+        ]
+
+        mt.memory_agent.state.set("user_id", "Bob")
+        result = await mt.search_memory.__wrapped__(query="seat preferences")
+
+        assert result == [{"fact": "prefers window seats", "score": 0.95}]
+
+    async def test_search_memory_returns_raw_results_without_budget(self, mock_memory_module, monkeypatch):
+        """With MEMORY_RESULT_TOKEN_BUDGET=0, search_memory should return whatever the client returns."""
+        mt, mock_client = mock_memory_module
+        monkeypatch.setenv("MEMORY_RESULT_TOKEN_BUDGET", "0")
         mock_client.search.return_value = [
             {"memory": "prefers window seats", "score": 0.95}
         ]
 
         mt.memory_agent.state.set("user_id", "Bob")
-        result = mt.search_memory.__wrapped__(query="seat preferences")
+        result = await mt.search_memory.__wrapped__(query="seat preferences")
 
         assert result == [{"memory": "prefers window seats", "score": 0.95}]
 
-    def test_add_memory_calls_client_with_user_id(self, mock_memory_module):
+    async def test_add_memory_calls_client_with_user_id(self, mock_memory_module):
         """add_memory should pass user_id directly (not via filters)."""
         mt, mock_client = mock_memory_module
 
         mt.memory_agent.state.set("user_id", "Bob")
-        mt.add_memory.__wrapped__(query="I love sushi")
+        await mt.add_memory.__wrapped__(query="I love sushi")
 
         mock_client.add.assert_called_once_with("I love sushi", user_id="Bob")
 
-    def test_add_memory_returns_result(self, mock_memory_module):
+    async def test_add_memory_returns_result(self, mock_memory_module):
         """add_memory should return the client's response."""
         mt, mock_client = mock_memory_module
         mock_client.add.return_value = {"id": "mem_456", "status": "created"}
 
         mt.memory_agent.state.set("user_id", "Chris")
-        result = mt.add_memory.__wrapped__(query="I'm allergic to peanuts")
+        result = await mt.add_memory.__wrapped__(query="I'm allergic to peanuts")
 
         assert result == {"id": "mem_456", "status": "created"}
 
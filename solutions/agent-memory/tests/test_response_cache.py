@@ -0,0 +1,109 @@
+"""Unit tests for frameworks/response_cache.py - the persistent LLM response cache."""
+
+import pytest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from frameworks.response_cache import ResponseCache
+    return ResponseCache(str(tmp_path / "responses.sqlite3"))
+
+
+def key(**overrides):
+    from frameworks.response_cache import response_key
+
+    args = {
+        "model": "bedrock/model",
+        "temperature": 0.0,
+        "max_tokens": 1000,
+        "schema": {"type": "object"},
+        "messages": [{"role": "user", "content": "Alice likes tea"}],
+    }
+    args.update(overrides)
+    return response_key(**args)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_round_trip_and_metrics(self, cache):
+        assert cache.get(key()) is None
+        cache.put(key(), {"entities": ["Alice"]})
+        assert cache.get(key()) == {"entities": ["Alice"]}
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_replacing_a_response_does_not_grow_the_size(self, cache):
+        """Putting a key again should count the new response only."""
+        cache.put(key(), {"entities": ["Alice"]})
+        cache.put(key(), {"entities": ["Alice", "Bob"]})
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["bytes"] == len('{"entities": ["Alice", "Bob"]}')
+
+    def test_key_covers_every_setting(self):
+        """Changing any input of the prompt should change the key."""
+        assert len({
+            key(),
+            key(model="bedrock/other"),
+            key(temperature=1.0),
+            key(max_tokens=10),
+            key(schema=None),
+            key(messages=[{"role": "user", "content": "Bob likes tea"}]),
+        }) == 6
+
+    def test_least_recently_used_responses_are_evicted(self, tmp_path):
+        """The cache should stay under max_bytes, evicting what was used least recently first."""
+        from frameworks.response_cache import ResponseCache
+
+        cache = ResponseCache(str(tmp_path / "responses.sqlite3"), max_bytes=250)
+        for i in range(3):
+            cache.put(f"k{i}", "x" * 70)
+        cache.get("k0")
+        cache.put("k3", "x" * 70)
+
+        assert cache.get("k1") is None
+        assert cache.get("k0") is not None
+        assert cache.stats()["bytes"] <= 250
+        assert cache.stats()["evictions"] >= 1
+
+    def test_responses_survive_a_restart(self, cache, tmp_path):
+        from frameworks.response_cache import ResponseCache
+
+        cache.put(key(), {"entities": ["Alice"]})
+        assert ResponseCache(str(tmp_path / "responses.sqlite3")).get(key()) == {"entities": ["Alice"]}
+
+
+class TestLiteLLMClientCache:
+    """Tests for the response cache of the Graphiti LLM client."""
+
+    async def test_replayed_prompt_is_served_from_the_cache(self, cache):
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from pydantic import BaseModel
+        from graphiti_core.llm_client.config import LLMConfig
+        from graphiti_core.prompts.models import Message
+        from frameworks.graphiti_neptune import LiteLLMClient
+
+        class Entities(BaseModel):
+            names: list[str]
+
+        client = LiteLLMClient(LLMConfig(api_key="unused", model="model", temperature=0), cache=True, response_cache=cache)
+        response = MagicMock()
+        response.choices[0].message.content = '{"names": ["Alice"]}'
+
+        with patch("litellm.acompletion", new_callable=AsyncMock, return_value=response) as completion:
+            for _ in range(2):
+                messages = [Message(role="system", content="Extract"), Message(role="user", content="Alice likes tea")]
+                assert await client._generate_response(messages, Entities) == {"names": ["Alice"]}
+
+        completion.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+
+    def test_cache_is_disabled_by_default(self):
+        from graphiti_core.llm_client.config import LLMConfig
+        from frameworks.graphiti_neptune import LiteLLMClient
+
+        assert LiteLLMClient(LLMConfig(api_key="unused")).response_cache is None
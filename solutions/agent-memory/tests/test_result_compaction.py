@@ -0,0 +1,83 @@
+"""Tests for the compaction of memory search results."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from frameworks.result_compaction import compact_results, estimate_tokens, project
+
+
+class TestProject:
+    def test_mem0_memory_keeps_fact_date_and_score(self):
+        """A Mem0 memory should be reduced to its text, date and score."""
+        memory = {
+            "id": "mem_1", "memory": "Likes tea", "hash": "abc", "metadata": None,
+            "score": 0.87654, "created_at": "2025-04-01T12:00:00", "updated_at": None, "user_id": "Alice",
+        }
+        assert project(memory) == {"fact": "Likes tea", "valid_at": "2025-04-01T12:00:00", "score": 0.877}
+
+    def test_graphiti_edge_keeps_fact_and_valid_at(self):
+        """A Graphiti edge should be reduced to its fact and validity date."""
+        edge = SimpleNamespace(
+            fact="Alice likes tea", valid_at=datetime(2025, 4, 1), fact_embedding=[0.1] * 1024, episodes=["e1"]
+        )
+        assert project(edge) == {"fact": "Alice likes tea", "valid_at": "2025-04-01T00:00:00"}
+
+    def test_mem0_relation_and_cognee_context(self):
+        """Mem0 graph relations and Cognee contexts should become plain facts."""
+        assert project({"source": "alice", "relationship": "likes", "destination": "tea"}) == {"fact": "alice likes tea"}
+        assert project("Alice likes tea") == {"fact": "Alice likes tea"}
+
+
+class TestCompactResults:
+    def test_ranks_fused_results_by_score_and_drops_duplicates(self):
+        """Fused results should be ordered by score, with duplicate facts returned once."""
+        results = [
+            {"memory": "Likes tea", "score": 0.02, "sources": ["mem0"]},
+            {"memory": "Lives in Paris", "score": 0.03, "sources": ["mem0", "graphiti"]},
+            {"memory": "likes tea.", "score": 0.01, "sources": ["graphiti"]},
+            "alice lives_in paris",
+        ]
+
+        compacted = compact_results(results, budget=1000)
+
+        assert [m["fact"] for m in compacted["memories"]] == ["Lives in Paris", "Likes tea", "alice lives_in paris"]
+        assert compacted["omitted"] == 0
+
+    def test_mem0_distance_scores_keep_backend_order(self):
+        """Mem0 scores may be distances, so the closest memory Mem0 returned first should be kept."""
+        results = {"results": [
+            {"memory": "closest fact", "score": 0.12},
+            {"memory": "far fact " + "x" * 300, "score": 0.95},
+        ]}
+
+        compacted = compact_results(results, budget=90)
+
+        assert [m["fact"] for m in compacted["memories"]] == ["closest fact"]
+        assert compacted["omitted"] == 1
+
+    def test_unscored_results_keep_backend_order(self):
+        """Results without a score should keep the order the backend ranked them in."""
+        edges = [SimpleNamespace(fact=fact, valid_at=None) for fact in ("b", "a", "c")]
+        assert [m["fact"] for m in compact_results(edges, budget=1000)["memories"]] == ["b", "a", "c"]
+
+    def test_truncates_to_the_budget_and_reports_tokens_saved(self):
+        """Memories beyond the budget should be left out, and the tokens saved reported."""
+        edges = [
+            SimpleNamespace(fact=f"Fact number {i} " + "x" * 100, valid_at=None, fact_embedding=[0.123456] * 256)
+            for i in range(20)
+        ]
+
+        compacted = compact_results(edges, budget=100)
+
+        assert compacted["tokens"] <= 100
+        assert len(compacted["memories"]) + compacted["omitted"] == 20
+        assert compacted["memories"][0]["fact"].startswith("Fact number 0")
+        assert compacted["tokens_saved"] == estimate_tokens(str(edges)) - compacted["tokens"]
+
+    def test_single_memory_larger_than_the_budget_is_cut(self):
+        """A first memory larger than the budget should be cut to fit rather than dropped."""
+        compacted = compact_results(["word " * 500], budget=50)
+
+        assert len(compacted["memories"]) == 1
+        assert compacted["memories"][0]["fact"].endswith("...")
+        assert compacted["tokens"] <= 50
@@ -0,0 +1,121 @@
+"""Unit tests for frameworks/search_cache.py - the search result cache."""
+
+import time
+import pytest
+
+
+class FakeBackend:
+    """Returns the memories added so far; searches take a few milliseconds."""
+
+    def __init__(self):
+        self.memories = {}
+        self.searches = 0
+        self.listeners = []
+
+    def search(self, query, user_id):
+        self.searches += 1
+        time.sleep(0.005)
+        return list(self.memories.get(user_id, []))
+
+    def add(self, content, user_id):
+        self.memories.setdefault(user_id, []).append(content)
+        return {"status": "added"}
+
+    def add_many(self, items, user_id):
+        for item in items:
+            self.add(item, user_id)
+        return {"status": "added", "count": len(items)}
+
+    async def asearch(self, query, user_id):
+        return self.search(query, user_id)
+
+    async def aadd(self, content, user_id):
+        return self.add(content, user_id)
+
+    def on_indexed(self, callback):
+        self.listeners.append(callback)
+
+    def index_in_background(self, content, user_id):
+        """Make a memory searchable later, as Cognee does once cognify completes."""
+        self.memories.setdefault(user_id, []).append(content)
+        for callback in self.listeners:
+            callback(user_id)
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def cached(backend):
+    from frameworks.search_cache import CachedMemoryBackend
+    return CachedMemoryBackend(backend, ttl=60)
+
+
+class TestCachedMemoryBackend:
+    """Tests for CachedMemoryBackend."""
+
+    def test_normalize_query(self):
+        from frameworks.search_cache import normalize_query
+        assert normalize_query("  What does Alice   like?") == normalize_query("what does alice like")
+
+    def test_near_identical_queries_hit_the_cache(self, cached, backend):
+        backend.add("likes tea", "Alice")
+        assert cached.search("What does Alice like?", "Alice") == ["likes tea"]
+        assert cached.search("what does alice like", "Alice") == ["likes tea"]
+        assert backend.searches == 1
+
+        stats = cached.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["saved_seconds"] >= 0.005
+
+    def test_add_invalidates_only_that_user(self, cached, backend):
+        cached.search("drinks", "Alice")
+        cached.search("drinks", "Bob")
+        cached.add("likes tea", "Alice")
+
+        assert cached.search("drinks", "Alice") == ["likes tea"]
+        cached.search("drinks", "Bob")
+        assert backend.searches == 3
+
+    def test_background_indexing_invalidates_that_user(self, cached, backend):
+        """Memories that become searchable after add returned should not be hidden by cached searches."""
+        assert cached.search("drinks", "Alice") == []
+        cached.search("drinks", "Bob")
+
+        backend.index_in_background("likes tea", "Alice")
+
+        assert cached.search("drinks", "Alice") == ["likes tea"]
+        cached.search("drinks", "Bob")
+        assert backend.searches == 3
+
+    async def test_async_api_shares_the_cache(self, cached, backend):
+        await cached.asearch("drinks", "Alice")
+        assert cached.search("drinks", "Alice") == []
+        await cached.aadd("likes tea", "Alice")
+        assert await cached.asearch("drinks", "Alice") == ["likes tea"]
+        assert backend.searches == 2
+
+    def test_entries_expire(self, backend):
+        from frameworks.search_cache import CachedMemoryBackend
+
+        cached = CachedMemoryBackend(backend, ttl=0.01)
+        cached.search("drinks", "Alice")
+        time.sleep(0.02)
+        cached.search("drinks", "Alice")
+        assert backend.searches == 2
+
+    def test_search_overlapping_a_write_is_not_cached(self, cached, backend):
+        """Results computed before a write finished must not be served after it."""
+        original = backend.search
+
+        def search_during_add(query, user_id):
+            results = original(query, user_id)
+            cached.add("likes tea", user_id)
+            return results
+
+        backend.search = search_during_add
+        assert cached.search("drinks", "Alice") == []
+        backend.search = original
+        assert cached.search("drinks", "Alice") == ["likes tea"]
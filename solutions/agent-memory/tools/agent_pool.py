@@ -0,0 +1,90 @@
+"""Pool of reusable Strands sub-agents.
+
+Sub-agent tools (weather_agent, general_assistant) used to build a new Agent
+on every call: a new Bedrock client, a new tool registry and new HTTP
+connections, only to run one prompt. The AgentPool keeps idle agents per
+system prompt and tool set, and hands one out per call. Between calls the
+conversation is reset, so each call starts from a blank conversation on warm
+clients and connections. Tools that stop working, such as those of an MCP
+session that restarted, are discarded together with the agents bound to them.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from strands import Agent
+from strands.agent.state import AgentState
+from strands.telemetry.metrics import EventLoopMetrics
+
+
+def reset_agent(agent: Agent):
+    """Forget the conversation, state and metrics of an agent's previous calls."""
+    agent.messages.clear()
+    agent.state = AgentState()
+    agent.event_loop_metrics = EventLoopMetrics()
+    if hasattr(agent.conversation_manager, "removed_message_count"):
+        agent.conversation_manager.removed_message_count = 0
+
+
+class AgentPool:
+    """Idle agents by (system prompt, tools), created on demand.
+
+    An agent serves one call at a time, so concurrent calls get distinct agents.
+
+    Args:
+        factory: Creates an agent from a system prompt and a list of tools.
+        max_idle: Idle agents kept per system prompt and tool set.
+    """
+
+    def __init__(self, factory: Callable[..., Agent] = Agent, max_idle: int = 4):
+        self.factory = factory
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self._idle: dict[tuple, list[Agent]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def agent(self, system_prompt: str, tools: list) -> Iterator[Agent]:
+        """Borrow an agent with a blank conversation for the duration of the block."""
+        # Tools are long-lived objects, their identity names the tool set
+        key = (system_prompt, tuple(id(t) for t in tools))
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            agent = idle.pop() if idle else None
+            if agent is not None:
+                self.reused += 1
+        if agent is None:
+            agent = self.factory(system_prompt=system_prompt, tools=list(tools))
+            with self._lock:
+                self.created += 1
+        try:
+            yield agent
+        finally:
+            reset_agent(agent)
+            with self._lock:
+                # The tool set may have been discarded during the call
+                idle = self._idle.get(key)
+                if idle is not None and len(idle) < self.max_idle:
+                    idle.append(agent)
+
+    def discard(self, tools: list):
+        """Drop the idle agents bound to any of these tools, and those of them still in use once returned."""
+        ids = {id(t) for t in tools}
+        with self._lock:
+            for key in [key for key in self._idle if ids.intersection(key[1])]:
+                del self._idle[key]
+
+    def stats(self) -> dict:
+        """Report the agents created and reused, and the idle agents."""
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+            }
+
+
+# Shared by the sub-agent tools
+agent_pool = AgentPool()
@@ -1,14 +1,17 @@
-from strands import Agent, tool
+from strands import tool
 from strands.agent import AgentResult
 from strands.tools.mcp import MCPClient
 from mcp import stdio_client, StdioServerParameters
 from dotenv import load_dotenv
+import atexit
 import os
 
+from tools.agent_pool import agent_pool
+from tools.mcp_session import MCPSession
+
 load_dotenv()
 
 # Define a specialized system prompt
-from strands.tools.mcp import MCPClient
 FLIGHTS_PROMPT = """
 You are a specialized agent for booking flight itineraries based on data in a graph database.
 Ignore any dates, airline preference, or other preferences you receive and only search for flight routes using the airport.
@@ -17,27 +20,37 @@ Always cite your sources when possible.
 """
 
 endpoint = os.getenv("NEPTUNE_FLIGHTS_ENDPOINT", None)
+flights_session = None
 if endpoint:
-    query_mcp_client = MCPClient(lambda: stdio_client(StdioServerParameters(command="uvx", 
-        args=["awslabs.amazon-neptune-mcp-server@latest"],
-        env={"NEPTUNE_ENDPOINT": f"{endpoint}", "FASTMCP_LOG_LEVEL": "INFO"},
-        )
-        )
-        )
+    # The Neptune MCP server is started on the first question and kept running
+    # for the next ones, instead of being started and stopped for each of them.
+    # Pooled agents bound to the tools of a stopped server are dropped with it.
+    flights_session = MCPSession(
+        lambda: MCPClient(lambda: stdio_client(StdioServerParameters(command="uvx",
+            args=["awslabs.amazon-neptune-mcp-server@latest"],
+            env={"NEPTUNE_ENDPOINT": f"{endpoint}", "FASTMCP_LOG_LEVEL": "INFO"},
+            )
+            )
+            ),
+        on_stop=agent_pool.discard,
+    )
+    atexit.register(flights_session.close)
 
 
 @tool
 def flights(query: str) -> AgentResult:
     try:
-        with query_mcp_client:
-            tools = query_mcp_client.list_tools_sync()
-            flight_agent = Agent(
-                system_prompt=FLIGHTS_PROMPT,
-                tools=tools
-            )
-
+        if flights_session is None:
+            raise ValueError("NEPTUNE_FLIGHTS_ENDPOINT must be set")
+        tools = flights_session.tools()
+        with agent_pool.agent(
+            system_prompt=FLIGHTS_PROMPT,
+            tools=tools
+        ) as flight_agent:
             # Call the agent and return its response
             return flight_agent(query)
     except Exception as e:
+        if flights_session is not None:
+            flights_session.mark_unhealthy()
         print(e)
         raise Exception(f"Error in flight agent: {str(e)}")
@@ -1,6 +1,8 @@
-from strands import Agent, tool
+from strands import tool
 import json
 
+from tools.agent_pool import agent_pool
+
 GENERAL_ASSISTANT_SYSTEM_PROMPT = """
 You are GeneralAssist, a concise general knowledge assistant for topics outside specialized domains. Your key characteristics are:
 
@@ -46,11 +48,11 @@ def general_assistant(query: str) -> str:
     
     try:
         print("Routed to General Assistant")
-        general_agent = Agent(
+        with agent_pool.agent(
             system_prompt=GENERAL_ASSISTANT_SYSTEM_PROMPT,
             tools=[],  # No specialized tools needed for general knowledge
-        )
-        agent_response = general_agent(formatted_query)
+        ) as general_agent:
+            agent_response = general_agent(formatted_query)
         text_response = str(agent_response)
 
         if len(text_response) > 0:
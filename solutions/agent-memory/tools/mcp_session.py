@@ -0,0 +1,102 @@
+"""Long-lived MCP client session for agent tools.
+
+Entering an MCPClient context starts the MCP server subprocess, runs the MCP
+handshake and, on exit, tears it all down: seconds of overhead when done for
+every question. The MCPSession starts the client once, caches its tool list,
+and keeps both for the next calls. Before a use, and at most once per
+health check interval, the session checks that the server still answers,
+and restarts it if it does not.
+
+MCPClient runs its session on a background thread and multiplexes requests,
+so concurrent calls can share the tools of one session. The tools of a stopped
+session are handed to on_stop, so that whatever was built on them, such as
+pooled agents, can be dropped.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from strands.tools.mcp import MCPClient
+
+logger = logging.getLogger(__name__)
+
+
+class MCPSession:
+    """Started MCP client and cached tool list, restarted when the server stops answering.
+
+    Args:
+        client_factory: Creates a new, not yet started, MCPClient.
+        health_check_interval: Seconds after which the server is checked again before use.
+        on_stop: Called with the tools of the session when it is stopped or restarted.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], MCPClient],
+        health_check_interval: float = 60.0,
+        on_stop: Callable[[list], None] | None = None,
+    ):
+        self.client_factory = client_factory
+        self.health_check_interval = health_check_interval
+        self.on_stop = on_stop
+        self.starts = 0
+        self._client: MCPClient | None = None
+        self._tools: list | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def tools(self) -> list:
+        """Return the server's tools, starting or restarting the server if needed."""
+        with self._lock:
+            if self._client is not None and time.monotonic() - self._checked_at >= self.health_check_interval:
+                if not self._healthy():
+                    self._stop()
+            if self._client is None:
+                self._start()
+            return self._tools
+
+    def mark_unhealthy(self):
+        """Check the server before the next use, e.g. after a failed call."""
+        with self._lock:
+            self._checked_at = float("-inf")
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                self._stop()
+
+    def _start(self):
+        started = time.perf_counter()
+        client = self.client_factory()
+        client.start()
+        try:
+            tools = list(client.list_tools_sync())
+        except BaseException:
+            client.stop(None, None, None)
+            raise
+        self._client, self._tools = client, tools
+        self._checked_at = time.monotonic()
+        self.starts += 1
+        logger.info(f"MCP session started in {time.perf_counter() - started:.2f}s with {len(tools)} tools")
+
+    def _healthy(self) -> bool:
+        try:
+            # Listing the tools is the cheapest request every MCP server answers
+            self._client.list_tools_sync()
+        except Exception as e:
+            logger.warning(f"MCP server stopped answering, restarting it: {e!r}")
+            return False
+        self._checked_at = time.monotonic()
+        return True
+
+    def _stop(self):
+        client, tools = self._client, self._tools
+        self._client, self._tools = None, None
+        try:
+            client.stop(None, None, None)
+        except Exception as e:
+            logger.warning(f"Could not stop the MCP session cleanly: {e!r}")
+        if self.on_stop is not None:
+            self.on_stop(tools)
@@ -3,6 +3,7 @@
 Configuration:
     AGENT_CONFIG - Which agent persona to use (default: "default")
     MEMORY_FRAMEWORK - Which memory backend to use: mem0, cognee, graphiti (default: "mem0")
+    MEMORY_RESULT_TOKEN_BUDGET - Tokens of search results returned to the agent, 0 for raw results (default: 1000)
     BEDROCK_MODEL_ID - Bedrock model for the agent LLM
 """
 
@@ -11,6 +12,7 @@ from dotenv import load_dotenv
 from strands.models import BedrockModel
 from strands import tool, Agent
 from frameworks.memory_backend import get_memory_backend
+from frameworks.result_compaction import compact_results, result_token_budget
 from examples import load_agent_config
 
 load_dotenv()
@@ -34,19 +36,24 @@ model = BedrockModel(
 memory = get_memory_backend()
 
 
+# The memory tools are async so that the agent's event loop keeps serving
+# other tool calls while the memory framework waits on Neptune and Bedrock.
 @tool
-def search_memory(query):
+async def search_memory(query):
     """Search the user's stored memories for relevant information."""
     user_id = memory_agent.state.get('user_id')
-    results = memory.search(query, user_id)
+    results = await memory.asearch(query, user_id)
+    budget = result_token_budget()
+    if budget > 0:
+        return compact_results(results, budget)["memories"]
     return results
 
 
 @tool
-def add_memory(query):
+async def add_memory(query):
     """Store new information in the user's memory for future recall."""
     user_id = memory_agent.state.get('user_id')
-    results = memory.add(query, user_id)
+    results = await memory.aadd(query, user_id)
     return results
 
 
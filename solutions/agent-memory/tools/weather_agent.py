@@ -62,9 +62,11 @@ Strands Agents' http_request tool provides:
    - "Get the forecast for San Francisco"
 """
 
-from strands import Agent, tool
+from strands import tool
 from strands_tools import http_request
 
+from tools.agent_pool import agent_pool
+
 # Define a weather-focused system prompt
 WEATHER_SYSTEM_PROMPT = """You are a weather assistant with HTTP capabilities. You can:
 
@@ -87,9 +89,10 @@ Always explain the weather conditions clearly and provide context for the foreca
 
 @tool()
 def weather_agent(prompt: str):
-    weather_agent =  Agent(
+    # Pooled agents keep their Bedrock client and HTTP connections between calls
+    with agent_pool.agent(
         system_prompt=WEATHER_SYSTEM_PROMPT,
         tools=[http_request],  # Explicitly enable http_request tool
-    )
-    resp = weather_agent(prompt)
+    ) as weather_agent:
+        resp = weather_agent(prompt)
     return str(resp)
\ No newline at end of file